@@ -1,8 +1,17 @@
 from manim import *
 from manim_slides import Slide
-import matplotlib.pyplot as plt
+import os
+import sys
 
-class WireframeBoxWithSlice(ThreeDScene, Slide):
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "scripts"))
+from box_colorplot import box_colorplot
+from incremental_slides import IncrementalSlide
+from isosurface import IsoSurface, VolumeMesher
+from resolution import grid_resolution
+from reverse_video import StreamingReverse
+from surface_lod import LODSphere
+
+class WireframeBoxWithSlice(StreamingReverse, IncrementalSlide, ThreeDScene, Slide):
     def construct(self):
         # Create a wireframe box
         X_size, Y_size, Z_size = 3, 3, 3
@@ -78,21 +87,11 @@ class WireframeBoxWithSlice(ThreeDScene, Slide):
         # animate rectangle to white color
         rect_color = ApplyMethod(rectangle.set_fill, WHITE, 1)
 
-        # Add 2D colorplot in the cube
-        x = np.linspace(-X_size/2, X_size/2, 100)
-        z = np.linspace(-Z_size/2, Z_size/2, 100)
-        X, Z = np.meshgrid(x, z)
-        Y = (1+5*np.exp(-((X - hotspot_location[0])**2 / 0.1 + (Z - hotspot_location[1])**2 / 0.2) ) ) * np.cos(2 * np.pi * np.sqrt((X - hotspot_location[0])**2 + (Z - hotspot_location[1])**2) / 0.3)
-        fig = plt.figure(figsize=(X_size, Z_size))
-        ax = fig.add_subplot(111)
-        ax.contourf(X, Z, Y, 100, cmap='jet')
-        ax.axis('off')
-        plt.gca().set_position([0, 0, 1, 1])
-        plt.savefig('colorplot.png')
-        plt.close()
+        # Add 2D colorplot in the cube, sampled for its on-screen size at this quality (built by assets.py)
+        colorplot_path = box_colorplot((X_size, Z_size), hotspot_location[:2]).ensure()
 
         # Add the colorplot to the scene
-        colorplot = ImageMobject('colorplot.png')
+        colorplot = ImageMobject(str(colorplot_path))
         colorplot.set_width(X_size)
         colorplot.set_height(Z_size)
         # move the colorplot to the hotspot location
@@ -109,7 +108,8 @@ class WireframeBoxWithSlice(ThreeDScene, Slide):
         self.next_slide()
 
         # Add a dot at the hotspot location
-        hotspot = Sphere(radius=0.09, color=WHITE).move_to(hotspot_location)
+        # Tessellated for its projected size, re-tessellated as the camera moves
+        hotspot = LODSphere(radius=0.09, color=WHITE).move_to(hotspot_location).track_camera(self.renderer.camera)
         hotspot.set_color(WHITE)
         hotspot.set_stroke(width=0)
         hotspot_label = Tex("Hotspot").next_to(hotspot, RIGHT + UP)
@@ -236,4 +236,26 @@ class WireframeBoxWithSlice(ThreeDScene, Slide):
 
         self.play(FadeIn(z_axis_graph), run_time=1)
         self.wait(0.5)
+        self.next_slide()
+
+        # Show the 3D field around the hotspot as an isosurface and sweep its level
+        hotspot_field = lambda x, y, z: np.abs((1+15*np.exp(-((x - hotspot_location[0])**2 / 0.1 + (y - hotspot_location[1])**2 / 0.2 + (z - hotspot_location[2])**2 / 0.3) ) ) * np.cos(2 * np.pi * np.sqrt((x - hotspot_location[0])**2 + (y - hotspot_location[1])**2 + (z - hotspot_location[2])**2) / 0.3))
+        field_extent = 0.45
+        # Odd sample count so the grid hits the peak; the field's shells make the face count grow quickly
+        field_samples = grid_resolution(2 * field_extent, samples_per_pixel=1/10, minimum=17, maximum=25) | 1
+        hotspot_mesher = VolumeMesher.from_function(
+            hotspot_field, bounds=[(c - field_extent, c + field_extent) for c in hotspot_location], shape=(field_samples,) * 3
+        )
+        # Place the mesh where the hotspot marker went: the same rotations and shift since it was added
+        iso_placement = rotation_matrix(PI/12, UP) @ rotation_matrix(PI/6-PI/2, RIGHT)
+        iso_level = ValueTracker(0.95 * hotspot_mesher.maximum)
+        hotspot_surface = IsoSurface(hotspot_mesher, iso_level.get_value(), matrix=iso_placement, offset=3 * LEFT, color=YELLOW, opacity=0.6)
+        hotspot_surface.add_updater(lambda m: m.set_level(iso_level.get_value()))
+        iso_label = VGroup(MathTex(r"\|\vec{E}\| \geq"), DecimalNumber(0.95, num_decimal_places=2), MathTex(r"\|\vec{E}\|_{\max}"))
+        iso_label.arrange(RIGHT, buff=0.15).scale(0.7).to_corner(DL)
+        iso_label[1].add_updater(lambda m: m.set_value(iso_level.get_value() / hotspot_mesher.maximum))
+
+        self.play(FadeOut(hotspot), FadeIn(hotspot_surface), Write(iso_label), run_time=1)
+        self.play(iso_level.animate.set_value(0.75 * hotspot_mesher.maximum), run_time=3)
+        self.wait(0.5)
         self.next_slide()
\ No newline at end of file
@@ -1,8 +1,13 @@
 from manim import *
 from manim_slides import Slide
-import matplotlib.pyplot as plt
+import os
+import sys
 
-class Formulas(Slide):
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "scripts"))
+from incremental_slides import IncrementalSlide
+from reverse_video import StreamingReverse
+
+class Formulas(StreamingReverse, IncrementalSlide, Slide):
     def construct(self):
         # Write vector electric field
         e_field = MathTex(r"\vec{E}(\vec{r}, t)")
@@ -0,0 +1,131 @@
+"""Content-addressed cache for generated scene assets (heatmaps, patterns).
+
+An asset is named after a hash of everything it is generated from, so scene
+variants that need the same heatmap share one file and concurrent renders
+never generate it twice in a row::
+
+    png = cached_bytes("rx_heatmaps", {"mpc": 0, "k": k, ...}, lambda: render_png())
+
+Assets that scenes declare up front are ``Asset`` nodes: a module-level build
+function and its parameters.  Their key also covers the source of the modules
+the build runs, so editing the generator makes old files stale rather than
+wrong; ``assets.py`` builds the declared assets of a scene before it renders::
+
+    pattern = Asset("cigar_pattern", cigar_svg, {"power": 100, ...}, suffix=".svg")
+    SVGMobject(str(pattern.ensure()))
+
+The cache lives in ``media/asset_cache`` (``MANIM_ASSET_CACHE`` overrides it)
+and can be deleted at any time.
+"""
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+
+CACHE_ENV = "MANIM_ASSET_CACHE"
+
+
+def cache_dir():
+    return Path(os.environ.get(CACHE_ENV, os.path.join("media", "asset_cache")))
+
+
+def _canonical(value):
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (tuple, set)):
+        return list(value)
+    raise TypeError(f"Cannot use {type(value).__name__} in an asset key")
+
+
+def asset_key(parts):
+    """Stable hash of the JSON-compatible (or numpy) values in ``parts``."""
+    canonical = json.dumps(parts, sort_keys=True, default=_canonical)
+    return hashlib.sha256(canonical.encode()).hexdigest()[:32]
+
+
+def asset_path(kind, parts, suffix=".png"):
+    return cache_dir() / kind / f"{asset_key(parts)}{suffix}"
+
+
+def _store(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Unique temporary name, then an atomic rename: parallel renders may store the same asset
+    temporary = path.with_name(f"{path.name}.{os.getpid()}.part")
+    temporary.write_bytes(data)
+    os.replace(temporary, path)
+
+
+def cached_bytes(kind, parts, build, suffix=".png"):
+    """The asset for ``parts``, calling ``build()`` for its bytes only when it is not cached."""
+    path = asset_path(kind, parts, suffix)
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        data = build()
+        _store(path, data)
+        return data
+
+
+_source_digests = {}
+
+
+def code_digest(module_names):
+    """Hash of the source files of ``module_names``, computed once per process."""
+    digest = hashlib.sha256()
+    for name in sorted(set(module_names)):
+        if name not in _source_digests:
+            path = getattr(sys.modules[name], "__file__", None)
+            _source_digests[name] = hashlib.sha256(Path(path).read_bytes()).hexdigest() if path else name
+        digest.update(_source_digests[name].encode())
+    return digest.hexdigest()[:32]
+
+
+class Asset:
+    """A generated file: ``build(params, *dependency_paths)`` returns its bytes.
+
+    ``build`` must be a module-level function so the asset can be built on a
+    process pool.  ``sources`` names further modules whose code the build runs.
+    """
+
+    def __init__(self, kind, build, params, suffix=".png", deps=(), sources=()):
+        self.kind = kind
+        self.build = build
+        self.params = params
+        self.suffix = suffix
+        self.deps = tuple(deps)
+        self.sources = (build.__module__, *sources)
+
+    def parts(self):
+        return {
+            "code": code_digest(self.sources),
+            "params": self.params,
+            "deps": [dep.key() for dep in self.deps],
+        }
+
+    def key(self):
+        return asset_key(self.parts())
+
+    @property
+    def path(self):
+        return asset_path(self.kind, self.parts(), self.suffix)
+
+    def up_to_date(self):
+        return self.path.exists()
+
+    def read(self):
+        """The asset's bytes, building it (and its dependencies) first when it is missing or stale."""
+        return cached_bytes(
+            self.kind, self.parts(), lambda: self.build(self.params, *[dep.ensure() for dep in self.deps]),
+            self.suffix,
+        )
+
+    def ensure(self):
+        """Path of the built asset."""
+        if not self.up_to_date():
+            self.read()
+        return self.path
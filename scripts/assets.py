@@ -0,0 +1,151 @@
+"""Generated scene inputs, declared per scene and built before rendering.
+
+Every generated file a scene needs is declared as an ``Asset`` node (see
+``asset_cache``) next to the code that builds it: ``generate_cigar``,
+``rx_heatmaps`` and ``box_colorplot``.  Scenes import the declaration from
+there and ask for the file with ``ensure()``, which builds a missing or stale
+one on the spot, so a plain ``manim render`` always gets its inputs.  This
+module only maps scene names to those declarations (``SCENE_ASSETS``) and
+builds them ahead of time, on a process pool, skipping the ones already in
+the cache::
+
+    python scripts/assets.py                                  # every scene, -qh
+    python scripts/assets.py RxBeamformingPhasors -q l -j 8
+    python scripts/assets.py TxBeamformingArcs --list         # status and paths only
+
+``sweep.py`` builds the assets of all its variants this way before the first
+render starts.  Assets are keyed by their parameters and the source of the
+code that builds them, so a variant or an edit to a generator gets new files
+and unchanged ones are never rebuilt.  Scene parameters come from
+``MANIM_SCENE_PARAMS`` like in the scenes; ``-q`` picks the resolution
+(custom ``-r`` resolutions are only built by the render itself).
+"""
+import argparse
+import re
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+from box_colorplot import box_assets
+from generate_cigar import tx_assets
+from resolution import DEFAULT_FRAME_WIDTH, QUALITY_PIXEL_WIDTHS
+from rx_heatmaps import heatmap_assets
+from scene_params import SCENE_PARAMS
+
+# Scene class name -> assets(params, **screen), the scene's generated inputs
+SCENE_ASSETS = {
+    "TxBeamformingArcs": tx_assets,
+    "RxBeamformingPhasors": heatmap_assets,
+    "WireframeBoxWithSlice": box_assets,
+}
+
+
+def scene_assets(scene_name, params=None, **screen):
+    """Assets a render of ``scene_name`` needs, for ``params`` or those in ``MANIM_SCENE_PARAMS``."""
+    if params is None and scene_name in SCENE_PARAMS:
+        params = SCENE_PARAMS[scene_name].from_env()
+    return SCENE_ASSETS[scene_name](params, **screen)
+
+
+def quality_screen(quality):
+    """``pixel_width``/``frame_width`` of a manim quality letter, for the declarations above."""
+    return {"pixel_width": QUALITY_PIXEL_WIDTHS[quality], "frame_width": DEFAULT_FRAME_WIDTH}
+
+
+# manim's short options that take a value: in a bundle like ``-pql`` the rest of the group is that value
+_VALUE_FLAGS = "cnoqrv"
+
+
+def quality_from_args(manim_args, default="h"):
+    """Quality letter in a manim command line (``-ql``, ``-pql``, ``-q l``, ``--quality=l``), manim's default otherwise."""
+    args = iter(manim_args)
+    for arg in args:
+        if arg == "--quality":
+            return next(args, default)[0]
+        if arg.startswith("--quality="):
+            return arg.split("=", 1)[1][0]
+        if not re.fullmatch(r"-[a-zA-Z]+", arg):
+            continue
+        for position, letter in enumerate(arg[1:], start=2):
+            if letter not in _VALUE_FLAGS:
+                continue
+            value = arg[position:] or next(args, default)
+            if letter == "q":
+                return value[0]
+            break
+    return default
+
+
+# --- Runner ---
+def _levels(assets):
+    """Distinct assets and their dependencies, grouped so every group only depends on earlier ones."""
+    depth = {}
+
+    def visit(asset):
+        path = asset.path
+        if path not in depth:
+            depth[path] = (1 + max((visit(dep) for dep in asset.deps), default=-1), asset)
+        return depth[path][0]
+
+    for asset in assets:
+        visit(asset)
+    levels = [[] for _ in range(1 + max((level for level, _ in depth.values()), default=-1))]
+    for level, asset in depth.values():
+        levels[level].append(asset)
+    return levels
+
+
+def _build(asset):
+    start = time.perf_counter()
+    asset.ensure()
+    return time.perf_counter() - start
+
+
+def build(assets, jobs=None):
+    """Build the missing or stale ``assets`` (and their dependencies) on ``jobs`` processes."""
+    levels = _levels(assets)
+    missing = [[asset for asset in level if not asset.up_to_date()] for level in levels]
+    total = sum(len(level) for level in levels)
+    pending = sum(len(level) for level in missing)
+    if not pending:
+        print(f"{total} assets up to date")
+        return
+    start = time.perf_counter()
+    built = defaultdict(lambda: [0, 0.0])
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        for level in missing:
+            # Dependencies first: each level waits for the previous one
+            for asset, seconds in zip(level, pool.map(_build, level)):
+                built[asset.kind][0] += 1
+                built[asset.kind][1] += seconds
+    for kind, (count, seconds) in built.items():
+        print(f"built {count:>4} {kind:<20} {seconds:>7.1f} s of work")
+    print(f"{pending} of {total} assets built in {time.perf_counter() - start:.1f} s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the generated inputs of scenes before rendering.")
+    parser.add_argument("scenes", nargs="*", help=f"scene class names, of {', '.join(sorted(SCENE_ASSETS))} (default: all)")
+    parser.add_argument("-q", "--quality", default="h", choices=list(QUALITY_PIXEL_WIDTHS),
+                        help="manim quality the assets are sized for (default: h)")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="build processes (default: all cores)")
+    parser.add_argument("--list", action="store_true", help="only list the assets and whether they are built")
+    args = parser.parse_args()
+    unknown = sorted(set(args.scenes) - set(SCENE_ASSETS))
+    if unknown:
+        parser.error(f"no assets declared for {', '.join(unknown)}")
+
+    assets = [
+        asset for scene_name in args.scenes or sorted(SCENE_ASSETS)
+        for asset in scene_assets(scene_name, **quality_screen(args.quality))
+    ]
+    if args.list:
+        for level in _levels(assets):
+            for asset in level:
+                print(f"{'ok     ' if asset.up_to_date() else 'missing'} {asset.kind:<20} {asset.path}")
+        return
+    build(assets, args.jobs)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""Reproducible render benchmarks for the project's scenes.
+
+Renders every scene in ``SCENES`` at a fixed quality, once with empty caches
+("cold": fresh media folder, so LaTeX, text and SVG caches are rebuilt) and
+once with warm caches ("warm": a persistent media folder that has already seen
+the scene, partial-movie caching disabled so every frame is still rendered).
+Each run records wall time, frames per second, per-phase times from
+``frame_profiler`` and the render process' peak RSS, appends them to a JSON
+history and fails when a scene is slower than the recent history by more than
+the threshold::
+
+    python scripts/benchmark_scenes.py --quality l --threshold 0.15
+    python scripts/benchmark_scenes.py --scenes Formulas TxBeamformingArcs --modes warm
+
+Everything runs in subprocesses with Matplotlib's Agg backend, so a headless
+CPU-only Linux box is enough.
+"""
+import argparse
+import datetime
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+REPO_DIR = SCRIPTS_DIR.parent
+
+# (scene file relative to the repository, scene class)
+SCENES = [
+    ("scripts/rx_beamforming_phasors.py", "RxBeamformingPhasors"),
+    ("scripts/tx_beamforming_arcs.py", "TxBeamformingArcs"),
+    ("scripts/reflection_animation.py", "ReflectionAnimation"),
+    ("examples_manim_slides/3d_box.py", "WireframeBoxWithSlice"),
+    ("examples_manim_slides/formulas.py", "Formulas"),
+    ("examples_manim_slides/characterization.py", "Characterization"),
+    ("examples_manim_slides/software.py", "VersionEnumeration"),
+    ("examples_manim_slides/dnauper.py", "RogueWavePlot"),
+]
+MODES = ("cold", "warm")
+
+
+def render_once(scene_file, scene_name, quality, media_dir):
+    """Render one scene in a fresh process and return its measurements."""
+    command = [
+        sys.executable, str(SCRIPTS_DIR / "render.py"), "--profile",
+        str(REPO_DIR / scene_file), scene_name,
+        f"-q{quality}", "--disable_caching", "--progress_bar", "none",
+        "--media_dir", str(media_dir),
+    ]
+    env = dict(os.environ, MPLBACKEND="Agg")
+    start = time.perf_counter()
+    process = subprocess.Popen(command, cwd=REPO_DIR, env=env, stdout=subprocess.DEVNULL)
+    # wait4 gives the resource usage of this child alone (ru_maxrss is in KiB on Linux)
+    _, status, usage = os.wait4(process.pid, 0)
+    wall_time = time.perf_counter() - start
+    process.returncode = os.waitstatus_to_exitcode(status)
+    if process.returncode != 0:
+        raise RuntimeError(f"Rendering {scene_name} failed with exit code {process.returncode}")
+
+    summary_path = Path(media_dir) / "profiles" / f"{scene_name}_summary.json"
+    with open(summary_path) as summary_file:
+        summary = json.load(summary_file)
+    return {
+        "wall_time": wall_time,
+        "frames": summary["frames"],
+        "fps": summary["frames"] / wall_time if wall_time > 0 else 0.0,
+        "phases": summary["phases"],
+        "peak_rss_mb": usage.ru_maxrss / 1024,
+    }
+
+
+def run_benchmarks(scenes, modes, quality, work_dir):
+    results = {}
+    warm_media = Path(work_dir) / "warm_media"
+    for scene_file, scene_name in scenes:
+        for mode in modes:
+            if mode == "cold":
+                media_dir = Path(tempfile.mkdtemp(prefix="cold_media_", dir=work_dir))
+                try:
+                    result = render_once(scene_file, scene_name, quality, media_dir)
+                finally:
+                    shutil.rmtree(media_dir, ignore_errors=True)
+            else:
+                if not (warm_media / "profiles" / f"{scene_name}_summary.json").exists():
+                    print(f"Warming caches for {scene_name}...")
+                    render_once(scene_file, scene_name, quality, warm_media)
+                result = render_once(scene_file, scene_name, quality, warm_media)
+            key = f"{scene_name}/{mode}"
+            results[key] = result
+            print(f"{key:<40} {result['wall_time']:8.2f} s {result['fps']:8.1f} fps "
+                  f"{result['peak_rss_mb']:8.0f} MB")
+    return results
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_DIR,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def find_regressions(history, results, quality, threshold, window):
+    """Compare ``results`` with the median of the last ``window`` runs at the same quality."""
+    regressions = []
+    for key, result in results.items():
+        previous = [
+            run["results"][key]["wall_time"]
+            for run in history
+            if run["quality"] == quality and key in run["results"]
+        ][-window:]
+        if not previous:
+            continue
+        baseline = statistics.median(previous)
+        change = result["wall_time"] / baseline - 1
+        if change > threshold:
+            regressions.append((key, baseline, result["wall_time"], change))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark scene rendering and detect regressions.")
+    parser.add_argument("--scenes", nargs="+", help="scene class names to run (default: all)")
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--quality", default="l", choices=list("lmhpk"), help="manim quality flag (default: l)")
+    parser.add_argument("--history", default="media/benchmarks/history.json", help="JSON history file")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="allowed slowdown against the recent median, as a fraction (default: 0.10)")
+    parser.add_argument("--window", type=int, default=5, help="number of previous runs in the baseline")
+    parser.add_argument("--work-dir", default="media/benchmarks", help="folder for the benchmark media")
+    args = parser.parse_args()
+
+    scenes = SCENES
+    if args.scenes:
+        scenes = [entry for entry in SCENES if entry[1] in args.scenes]
+        unknown = set(args.scenes) - {name for _, name in scenes}
+        if unknown:
+            parser.error(f"unknown scenes: {', '.join(sorted(unknown))}")
+
+    work_dir = (REPO_DIR / args.work_dir).resolve()
+    work_dir.mkdir(parents=True, exist_ok=True)
+    results = run_benchmarks(scenes, args.modes, args.quality, work_dir)
+
+    history_path = REPO_DIR / args.history
+    history = json.loads(history_path.read_text()) if history_path.exists() else []
+    regressions = find_regressions(history, results, args.quality, args.threshold, args.window)
+
+    history.append({
+        "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "quality": args.quality,
+        "results": results,
+    })
+    history_path.parent.mkdir(parents=True, exist_ok=True)
+    history_path.write_text(json.dumps(history, indent=2))
+    print(f"Results appended to {history_path}")
+
+    for key, baseline, wall_time, change in regressions:
+        print(f"REGRESSION {key}: {wall_time:.2f} s vs. median {baseline:.2f} s (+{100 * change:.0f}%)")
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Colorplot of the hotspot field over the XZ slice of ``WireframeBoxWithSlice``.
+
+The slide scene (``examples_manim_slides/3d_box.py``) asks for it with
+``box_colorplot(size, hotspot).ensure()``; ``assets.py`` builds it ahead of
+the render through ``box_assets``.
+"""
+import io
+
+import numpy as np
+
+from asset_cache import Asset
+from field_eval import evaluate_tiled
+from lazy_imports import lazy_module
+from resolution import CONTOUR_PIXELS_PER_PIXEL, figure_dpi, grid_resolution
+
+plt = lazy_module("matplotlib.pyplot")
+
+
+def box_colorplot_png(spec):
+    """Contour plot of the hotspot field over the box's XZ slice."""
+    width, height = spec["size"]
+    hotspot_x, hotspot_z = spec["hotspot"]
+    x = np.linspace(-width/2, width/2, spec["resolution"][0])
+    z = np.linspace(-height/2, height/2, spec["resolution"][1])
+    # Evaluated tile by tile in float32 into a single (z, x) array
+    Y = evaluate_tiled(lambda X, Z: (1+5*np.exp(-((X - hotspot_x)**2 / 0.1 + (Z - hotspot_z)**2 / 0.2) ) ) * np.cos(2 * np.pi * np.sqrt((X - hotspot_x)**2 + (Z - hotspot_z)**2) / 0.3), x, z)
+    fig = plt.figure(figsize=(width, height))
+    ax = fig.add_subplot(111)
+    ax.contourf(x, z, Y, 100, cmap='jet')
+    ax.axis('off')
+    ax.set_position([0, 0, 1, 1])
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', dpi=spec["dpi"])
+    plt.close(fig)
+    return buf.getvalue()
+
+
+def box_colorplot(size=(3, 3), hotspot=(0.75, 0.75), **screen):
+    """The slice colorplot, sampled for its on-screen size; the defaults are the scene's box and hotspot."""
+    width, height = size
+    spec = {
+        "size": [width, height], "hotspot": [float(value) for value in hotspot],
+        "resolution": [grid_resolution(width, **screen), grid_resolution(height, **screen)],
+        "dpi": figure_dpi(width, width, CONTOUR_PIXELS_PER_PIXEL, **screen),
+    }
+    return Asset("box_colorplot", box_colorplot_png, spec, sources=["field_eval"])
+
+
+def box_assets(params, **screen):
+    return [box_colorplot(**screen)]
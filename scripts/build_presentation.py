@@ -0,0 +1,136 @@
+"""Build the whole talk from ``presentation.json`` in long-lived render workers.
+
+Rendering every scene with its own ``manim-slides render`` process re-imports
+manim, re-registers fonts and starts with empty in-memory Text/Tex/SVG caches
+each time.  This builder renders the scenes listed in the presentation
+manifest inside one process (or a pool of ``-j`` long-lived processes), so
+those caches stay warm from one scene to the next, and then writes a single
+combined slide manifest::
+
+    python scripts/build_presentation.py presentation.json -j 2
+    manim-slides Talk                  # or export_html.py / export_pptx.py Talk
+
+The manifest lists the scenes in presentation order::
+
+    {
+        "name": "Talk",
+        "quality": "h",
+        "scenes": [
+            {"file": "examples_manim_slides/formulas.py", "scene": "Formulas"},
+            {"file": "scripts/tx_beamforming_arcs.py", "scene": "TxBeamformingArcs", "config": {"frame_rate": 30}}
+        ]
+    }
+
+Slide scenes contribute their slides; plain scenes become one slide that
+plays their movie.  ``config`` entries are manim config overrides for that
+scene only.
+"""
+import argparse
+import importlib.util
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+QUALITIES = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+# Scene modules loaded by this process, reused when a file holds several scenes
+_modules = {}
+
+
+def load_scene_class(scene_file, scene_name):
+    scene_file = Path(scene_file).resolve()
+    if scene_file not in _modules:
+        # Like manim, let the scene import modules that sit next to it
+        sys.path.insert(0, str(scene_file.parent))
+        spec = importlib.util.spec_from_file_location(f"presentation_scene_{len(_modules)}", scene_file)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _modules[scene_file] = module
+    return getattr(_modules[scene_file], scene_name)
+
+
+def warm_up():
+    """Pool initializer: pay for the manim and manim-slides imports once per worker."""
+    import manim  # noqa: F401
+    import manim_slides  # noqa: F401
+
+
+def relative_to_cwd(path):
+    try:
+        return str(Path(path).resolve().relative_to(Path.cwd()))
+    except ValueError:
+        return str(Path(path).resolve())
+
+
+def render_scene(entry, quality, media_dir):
+    """Render one manifest entry in this process and return its slides and resolution."""
+    from manim import tempconfig
+
+    scene_class = load_scene_class(entry["file"], entry["scene"])
+    options = {"quality": QUALITIES[quality], "media_dir": media_dir, **entry.get("config", {})}
+    start = time.perf_counter()
+    with tempconfig(options):
+        from manim import config
+
+        scene = scene_class()
+        scene.render()
+        resolution = [config.pixel_width, config.pixel_height]
+        movie_path = scene.renderer.file_writer.movie_file_path
+
+    slides_path = Path(getattr(scene, "_output_folder", "slides")) / f"{entry['scene']}.json"
+    if hasattr(scene, "_save_slides") and slides_path.exists():
+        slides = json.loads(slides_path.read_text())["slides"]
+    else:
+        movie = relative_to_cwd(movie_path)
+        slides = [{"file": movie, "rev_file": movie, "loop": False, "notes": "", "auto_next": False}]
+    print(f"[{os.getpid()}] {entry['scene']}: {len(slides)} slides in {time.perf_counter() - start:.1f} s")
+    return {"scene": entry["scene"], "resolution": resolution, "slides": slides}
+
+
+def build(manifest_path, jobs=1, media_dir="media"):
+    manifest = json.loads(Path(manifest_path).read_text())
+    quality = manifest.get("quality", "h")
+    entries = manifest["scenes"]
+    if jobs <= 1:
+        warm_up()
+        results = [render_scene(entry, quality, media_dir) for entry in entries]
+    else:
+        # Workers live for the whole build, so each keeps its caches across the scenes it gets
+        with ProcessPoolExecutor(max_workers=jobs, initializer=warm_up) as pool:
+            results = list(pool.map(render_scene, entries, [quality] * len(entries), [media_dir] * len(entries)))
+
+    resolutions = {tuple(result["resolution"]) for result in results}
+    if len(resolutions) > 1:
+        print(f"Warning: scenes were rendered at different resolutions {sorted(resolutions)}")
+    combined = {
+        "resolution": results[0]["resolution"],
+        "background_color": manifest.get("background_color", "black"),
+        "slides": [slide for result in results for slide in result["slides"]],
+    }
+    output_path = Path(manifest.get("output_folder", "slides")) / f"{manifest['name']}.json"
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(combined, indent=2))
+    print(f"{len(combined['slides'])} slides from {len(results)} scenes written to {output_path}")
+    return output_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render every scene of a presentation and combine their slides.")
+    parser.add_argument("manifest", nargs="?", default="presentation.json", help="presentation manifest")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="long-lived render processes (default: 1)")
+    parser.add_argument("--media_dir", default="media", help="manim media folder (default: media)")
+    args = parser.parse_args()
+    build(args.manifest, args.jobs, args.media_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""Draft renders that only compute every Nth frame, at real speed.
+
+Enable it through the render wrapper::
+
+    python scripts/render.py --draft 4 scripts/reflection_animation.py ReflectionAnimation -ql
+    python scripts/render.py --draft-fps 5 scripts/rx_beamforming_phasors.py RxBeamformingPhasors -ql
+
+Every ``play``/``wait`` steps through every Nth time of manim's frame grid
+(``--draft-fps K`` picks N for about K frames per second of scene time), so
+updaters, animations and rasterization run N times less often.  Updaters
+still see the right time: each gets the ``dt`` since the last computed frame,
+and the last frame of every call is always computed, so the total ``dt`` per
+call is the same as in a full render and motion that integrates ``dt`` ends
+up where it would.  Every computed frame is written once per frame it stands
+in for, so the movie keeps its frame rate, length and timing.
+
+The draft goes to ``<Scene>_draft<N>.mp4`` with its own partial movie
+folder, so it never replaces the real render or its cached animations.  A
+slide scene writes its deck to ``slides_draft<N>/`` instead of ``slides/``,
+and ``IncrementalSlide`` its checkpoints to ``<Scene>_draft<N>.json``, so the
+real deck and the checkpoints of the last full render stay as they were.
+"""
+from pathlib import Path
+
+import manim_hooks
+
+
+class DraftState:
+    def __init__(self):
+        self.every = None
+        self.fps = None
+        # Frames of the full frame grid the frame being rendered stands in for
+        self.repeat = 1
+
+    def step(self):
+        from manim import config
+
+        if self.every:
+            return max(1, int(self.every))
+        return max(1, round(config.frame_rate / self.fps))
+
+    def suffix(self):
+        return f"_draft{self.every}" if self.every else f"_draft{self.fps:g}fps"
+
+    def thinned(self, times, kept):
+        """``times`` at the ``kept`` indices, setting ``repeat`` before each."""
+        for index, following in zip(kept, kept[1:] + [len(times)]):
+            self.repeat = following - index
+            yield times[index]
+
+
+draft = DraftState()
+
+
+def kept_frames(count, step):
+    """Indices of the frames computed out of ``count``: every ``step``-th and the last one."""
+    kept = list(range(0, count, step))
+    if kept[-1] != count - 1:
+        kept.append(count - 1)
+    return kept
+
+
+def _draft_path(path, suffix):
+    return path.with_name(f"{path.stem}{suffix}{path.suffix}")
+
+
+def install(every=None, fps=None):
+    """Compute every ``every``-th frame (or about ``fps`` frames per second) of every rendered scene."""
+    from manim import Scene
+    from manim.renderer.cairo_renderer import CairoRenderer
+    from manim.scene.scene_file_writer import SceneFileWriter
+
+    if not every and not fps:
+        raise ValueError("draft preview needs a frame step or a frame rate")
+    draft.every = every
+    draft.fps = fps
+
+    def thin_progression(original):
+        def get_time_progression(self, run_time, *args, **kwargs):
+            progression = original(self, run_time, *args, **kwargs)
+            times = progression.iterable
+            step = draft.step()
+            if step == 1 or len(times) <= 1:
+                return progression
+            kept = kept_frames(len(times), step)
+            progression.iterable = draft.thinned(times, kept)
+            progression.total = len(kept)
+            return progression
+        return get_time_progression
+
+    def repeat_frames(original):
+        def add_frame(self, frame, num_frames=1):
+            return original(self, frame, num_frames=num_frames * draft.repeat)
+        return add_frame
+
+    def draft_outputs(original):
+        def init_output_directories(self, scene_name):
+            original(self, scene_name)
+            suffix = draft.suffix()
+            for name in ("movie_file_path", "gif_file_path"):
+                path = getattr(self, name, None)
+                if path is not None:
+                    setattr(self, name, _draft_path(path, suffix))
+            partial = getattr(self, "partial_movie_directory", None)
+            if partial is not None:
+                self.partial_movie_directory = partial.with_name(partial.name + suffix)
+                self.partial_movie_directory.mkdir(parents=True, exist_ok=True)
+        return init_output_directories
+
+    def reset_repeat(original):
+        def play_internal(self, *args, **kwargs):
+            # A stop condition or an error can leave the progression unfinished:
+            # frames added after this call (wait, freeze) stand for themselves again
+            try:
+                return original(self, *args, **kwargs)
+            finally:
+                draft.repeat = 1
+        return play_internal
+
+    def draft_slides(scene):
+        suffix = draft.suffix()
+        folder = getattr(scene, "_output_folder", None)
+        if folder is not None:
+            # manim-slides writes <folder>/<Scene>.json and <folder>/files/<Scene>/
+            folder = Path(folder)
+            scene._output_folder = folder.parent / (folder.name + suffix)
+        checkpoint_path = getattr(scene, "_checkpoint_path", None)
+        if checkpoint_path is not None:
+            scene._checkpoint_path = lambda: _draft_path(checkpoint_path(), suffix)
+
+    manim_hooks.patch_method(Scene, "get_time_progression", thin_progression)
+    manim_hooks.patch_method(Scene, "play_internal", reset_repeat)
+    manim_hooks.patch_method(CairoRenderer, "add_frame", repeat_frames)
+    manim_hooks.patch_method(SceneFileWriter, "init_output_directories", draft_outputs)
+    manim_hooks.on_scene_start(draft_slides)
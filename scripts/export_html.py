@@ -0,0 +1,186 @@
+"""Streaming one-file HTML export of manim-slides presentations.
+
+``manim-slides convert --to html --one-file`` builds the base64 of every slide
+video as one string before writing anything, so a long 1080p deck needs
+gigabytes of memory.  This exporter writes the same kind of reveal.js page but
+streams each video through a chunked base64 encoder straight into the output
+file, so memory use stays around one chunk::
+
+    python scripts/export_html.py Formulas WireframeBoxWithSlice -o talk.html
+    python scripts/export_html.py Formulas -o talk.html --sidecar
+
+With ``--sidecar`` the videos are not inlined but copied next to the page as
+``<output>_assets/<content hash>.mp4``; identical slides share one file and
+re-exporting only copies videos whose content changed.
+
+Slide videos first go through the ``remux`` profile of the shared
+``transcode_cache``: manim's H.264 stream is copied as it is, with the index
+moved to the front so playback starts while the file downloads.
+``--profile html`` re-encodes them instead (only needed for renders that
+browsers cannot play), ``--profile none`` inlines the rendered files as they
+are.
+"""
+import argparse
+import base64
+import html
+import json
+import os
+import shutil
+import sys
+from pathlib import Path
+
+from transcode_cache import TranscodeCache, file_digest
+
+DEFAULT_CHUNK_SIZE = 3 * 1024 * 1024
+REVEAL_URL = "https://cdn.jsdelivr.net/npm/reveal.js@4.6.1"
+
+PAGE_START = """<!doctype html>
+<html>
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1.0">
+<title>{title}</title>
+<link rel="stylesheet" href="{reveal}/dist/reveal.css">
+<link rel="stylesheet" href="{reveal}/dist/theme/black.css">
+</head>
+<body>
+<div class="reveal">
+<div class="slides">
+"""
+
+PAGE_END = """</div>
+</div>
+<script src="{reveal}/dist/reveal.js"></script>
+<script src="{reveal}/plugin/notes/notes.js"></script>
+<script>
+Reveal.initialize({{
+  width: {width}, height: {height}, margin: 0, controls: false, progress: false,
+  hash: true, transition: "none", backgroundTransition: "none", plugins: [RevealNotes]
+}});
+// Slides created with next_slide(auto_next=True) advance when their video ends
+Reveal.on("slidechanged", function (event) {{
+  if (!event.currentSlide.hasAttribute("data-auto-next")) return;
+  var video = Reveal.getSlideBackground(event.indexh, event.indexv).querySelector("video");
+  if (video) video.addEventListener("ended", function () {{ Reveal.next(); }}, {{once: true}});
+}});
+</script>
+</body>
+</html>
+"""
+
+
+def load_presentation(folder, scene):
+    """Slides of ``scene`` from the manim-slides manifest, with video paths resolved."""
+    manifest_path = Path(folder) / f"{scene}.json"
+    if not manifest_path.exists():
+        raise FileNotFoundError(f"No slides manifest at {manifest_path}, render {scene} with manim-slides first")
+    presentation = json.loads(manifest_path.read_text())
+    for slide in presentation["slides"]:
+        slide["file"] = resolve_video(slide["file"], manifest_path)
+    return presentation
+
+
+def resolve_video(path, manifest_path):
+    # manim-slides stores paths relative to the folder it was run from
+    path = Path(path)
+    for candidate in (path, manifest_path.parent.parent / path, manifest_path.parent / path):
+        if candidate.exists():
+            return candidate
+    raise FileNotFoundError(f"Slide video {path} listed in {manifest_path} does not exist")
+
+
+# --- Video payloads ---
+def stream_base64(video_path, output, chunk_size):
+    """Write the base64 of ``video_path`` to ``output``, reading one chunk at a time."""
+    # A multiple of 3 bytes encodes without padding, so the chunks concatenate
+    chunk_size = max(3, chunk_size - chunk_size % 3)
+    with open(video_path, "rb") as video:
+        while chunk := video.read(chunk_size):
+            output.write(base64.b64encode(chunk).decode("ascii"))
+
+
+def copy_sidecar(video_path, assets_dir):
+    """Copy ``video_path`` into ``assets_dir`` under its content hash and return the new path."""
+    target = assets_dir / f"{file_digest(video_path)[:20]}{Path(video_path).suffix}"
+    if not target.exists():
+        temporary = target.with_suffix(target.suffix + ".part")
+        shutil.copyfile(video_path, temporary)
+        os.replace(temporary, target)
+    return target
+
+
+# --- Page ---
+def write_slide(output, slide, video_source, chunk_size):
+    attributes = ['data-background-size="contain"']
+    if slide.get("loop"):
+        attributes.append("data-background-video-loop")
+    if slide.get("auto_next"):
+        attributes.append("data-auto-next")
+    output.write(f"<section {' '.join(attributes)} data-background-video=\"")
+    if isinstance(video_source, Path):
+        output.write("data:video/mp4;base64,")
+        stream_base64(video_source, output, chunk_size)
+    else:
+        output.write(html.escape(video_source))
+    output.write('">')
+    if slide.get("notes"):
+        output.write(f'<aside class="notes">{html.escape(slide["notes"])}</aside>')
+    output.write("</section>\n")
+
+
+def export(scenes, output_path, folder="slides", sidecar=False, chunk_size=DEFAULT_CHUNK_SIZE,
+           profile="remux", jobs=None, cache_dir=None):
+    output_path = Path(output_path)
+    presentations = [load_presentation(folder, scene) for scene in scenes]
+    if profile != "none":
+        cache = TranscodeCache(cache_dir) if cache_dir else TranscodeCache()
+        slides = [slide for presentation in presentations for slide in presentation["slides"]]
+        for slide, video in zip(slides, cache.transcode_all([slide["file"] for slide in slides], profile, jobs)):
+            slide["file"] = video
+    width, height = presentations[0].get("resolution", (1920, 1080))
+    assets_dir = output_path.parent / f"{output_path.stem}_assets"
+    if sidecar:
+        assets_dir.mkdir(parents=True, exist_ok=True)
+
+    # Write to a temporary file so an interrupted export never leaves a truncated page
+    temporary = output_path.with_suffix(output_path.suffix + ".part")
+    with open(temporary, "w", encoding="utf-8") as output:
+        output.write(PAGE_START.format(title=html.escape(", ".join(scenes)), reveal=REVEAL_URL))
+        for scene, presentation in zip(scenes, presentations):
+            for index, slide in enumerate(presentation["slides"]):
+                if sidecar:
+                    video_source = copy_sidecar(slide["file"], assets_dir).relative_to(output_path.parent).as_posix()
+                else:
+                    video_source = slide["file"]
+                write_slide(output, slide, video_source, chunk_size)
+                print(f"{scene}: slide {index + 1}/{len(presentation['slides'])}")
+        output.write(PAGE_END.format(reveal=REVEAL_URL, width=width, height=height))
+    os.replace(temporary, output_path)
+    print(f"Presentation written to {output_path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export manim-slides presentations to one HTML file.")
+    parser.add_argument("scenes", nargs="+", help="slide scene names, in presentation order")
+    parser.add_argument("-o", "--output", required=True, help="HTML file to write")
+    parser.add_argument("--folder", default="slides", help="manim-slides output folder (default: slides)")
+    parser.add_argument("--sidecar", action="store_true",
+                        help="reference content-hashed video files next to the page instead of inlining them")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help="bytes of video encoded at a time (default: 3 MiB)")
+    parser.add_argument("--profile", default="remux", choices=["remux", "html", "none"],
+                        help="'remux' copies the video streams, 'html' re-encodes them, "
+                             "'none' uses the rendered files (default: remux)")
+    parser.add_argument("-j", "--jobs", type=int, help="parallel ffmpeg processes (default: all cores)")
+    parser.add_argument("--cache-dir", help="transcode cache folder (default: media/transcode_cache)")
+    args = parser.parse_args()
+    try:
+        export(args.scenes, args.output, args.folder, args.sidecar, args.chunk_size,
+               args.profile, args.jobs, args.cache_dir)
+    except (FileNotFoundError, RuntimeError) as error:
+        print(error)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""PPTX export of manim-slides presentations through the shared transcode cache.
+
+    python scripts/export_pptx.py Formulas WireframeBoxWithSlice -o talk.pptx -j 8
+
+Each slide video is converted with the ``pptx`` profile of ``transcode_cache``
+and its first frame is extracted as the poster image; both are cached by
+source-video hash, so exporting the deck again after editing one slide only
+transcodes that slide.  Every video starts on its own when its slide appears
+(looping slides loop), through the same main-sequence "mediacall" effect
+PowerPoint writes for "Start: Automatically"; its length is read with
+``ffprobe``.  Needs ``python-pptx`` (``pip install python-pptx``).
+"""
+import argparse
+import subprocess
+import sys
+
+from export_html import load_presentation
+from transcode_cache import TranscodeCache
+
+# PowerPoint slides are 13.333 in wide; the height follows the video aspect ratio
+SLIDE_WIDTH_EMU = 12192000
+
+
+# Main sequence of a slide with one effect, "Start: After Previous", that plays the movie from
+# its start; PowerPoint only honours autoplay written as this full timing tree.
+AUTOPLAY_XML = """<p:seq {namespaces} concurrent="1" nextAc="seek">
+  <p:cTn id="{ids[0]}" dur="indefinite" nodeType="mainSeq"><p:childTnLst>
+    <p:par><p:cTn id="{ids[1]}" fill="hold">
+      <p:stCondLst><p:cond delay="indefinite"/><p:cond evt="onBegin" delay="0"><p:tn val="{ids[0]}"/></p:cond></p:stCondLst>
+      <p:childTnLst><p:par><p:cTn id="{ids[2]}" fill="hold">
+        <p:stCondLst><p:cond delay="0"/></p:stCondLst>
+        <p:childTnLst><p:par>
+          <p:cTn id="{ids[3]}" presetID="1" presetClass="mediacall" presetSubtype="0" fill="hold" nodeType="afterEffect">
+            <p:stCondLst><p:cond delay="0"/></p:stCondLst>
+            <p:childTnLst><p:cmd type="call" cmd="playFrom(0.0)"><p:cBhvr>
+              <p:cTn id="{ids[4]}" dur="{duration_ms}" fill="hold"/>
+              <p:tgtEl><p:spTgt spid="{shape_id}"/></p:tgtEl>
+            </p:cBhvr></p:cmd></p:childTnLst>
+          </p:cTn>
+        </p:par></p:childTnLst>
+      </p:cTn></p:par></p:childTnLst>
+    </p:cTn></p:par>
+  </p:childTnLst></p:cTn>
+  <p:prevCondLst><p:cond evt="onPrev" delay="0"><p:tgtEl><p:sldTgt/></p:tgtEl></p:cond></p:prevCondLst>
+  <p:nextCondLst><p:cond evt="onNext" delay="0"><p:tgtEl><p:sldTgt/></p:tgtEl></p:cond></p:nextCondLst>
+</p:seq>"""
+
+
+def video_duration(path):
+    """Length of the video at ``path`` in seconds, read with ffprobe."""
+    result = subprocess.run(
+        ["ffprobe", "-v", "error", "-show_entries", "format=duration", "-of", "csv=p=0", str(path)],
+        capture_output=True, text=True,
+    )
+    if result.returncode:
+        raise RuntimeError(f"ffprobe failed on {path}: {result.stderr.strip()}")
+    return float(result.stdout)
+
+
+def start_automatically(movie, duration, loop):
+    """Make ``movie`` play as soon as its slide appears, instead of on click."""
+    from pptx.oxml import parse_xml
+    from pptx.oxml.ns import nsdecls
+
+    slide = movie.part.slide.element
+    root_children = slide.xpath("./p:timing/p:tnLst/p:par/p:cTn/p:childTnLst")[0]
+    first_id = 1 + max(int(node_id) for node_id in slide.xpath("./p:timing//p:cTn/@id"))
+    sequence = parse_xml(AUTOPLAY_XML.format(
+        namespaces=nsdecls("p"), ids=range(first_id, first_id + 5),
+        duration_ms=max(1, round(duration * 1000)), shape_id=movie.shape_id,
+    ))
+    # The main sequence comes before the media nodes python-pptx added
+    root_children.insert(0, sequence)
+    if loop:
+        media_nodes = f"./p:video/p:cMediaNode[p:tgtEl/p:spTgt/@spid='{movie.shape_id}']/p:cTn"
+        for time_node in root_children.xpath(media_nodes):
+            time_node.set("repeatCount", "indefinite")
+
+
+def export(scenes, output_path, folder="slides", jobs=None, cache_dir=None):
+    try:
+        from pptx import Presentation
+    except ImportError:
+        raise RuntimeError("PPTX export needs python-pptx: pip install python-pptx") from None
+
+    presentations = [load_presentation(folder, scene) for scene in scenes]
+    slides = [slide for presentation in presentations for slide in presentation["slides"]]
+    sources = [slide["file"] for slide in slides]
+    cache = TranscodeCache(cache_dir) if cache_dir else TranscodeCache()
+    videos = cache.transcode_all(sources, "pptx", jobs)
+    posters = cache.transcode_all(sources, "poster", jobs)
+
+    width, height = presentations[0].get("resolution", (1920, 1080))
+    deck = Presentation()
+    deck.slide_width = SLIDE_WIDTH_EMU
+    deck.slide_height = SLIDE_WIDTH_EMU * height // width
+    blank_layout = deck.slide_layouts[6]
+    for slide, video, poster in zip(slides, videos, posters):
+        page = deck.slides.add_slide(blank_layout)
+        movie = page.shapes.add_movie(
+            str(video), 0, 0, deck.slide_width, deck.slide_height,
+            poster_frame_image=str(poster), mime_type="video/mp4",
+        )
+        start_automatically(movie, video_duration(video), slide.get("loop", False))
+        if slide.get("notes"):
+            page.notes_slide.notes_text_frame.text = slide["notes"]
+    deck.save(output_path)
+    print(f"Presentation written to {output_path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export manim-slides presentations to PowerPoint.")
+    parser.add_argument("scenes", nargs="+", help="slide scene names, in presentation order")
+    parser.add_argument("-o", "--output", required=True, help="PPTX file to write")
+    parser.add_argument("--folder", default="slides", help="manim-slides output folder (default: slides)")
+    parser.add_argument("-j", "--jobs", type=int, help="parallel ffmpeg processes (default: all cores)")
+    parser.add_argument("--cache-dir", help="transcode cache folder (default: media/transcode_cache)")
+    args = parser.parse_args()
+    try:
+        export(args.scenes, args.output, args.folder, args.jobs, args.cache_dir)
+    except (FileNotFoundError, RuntimeError) as error:
+        print(error)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
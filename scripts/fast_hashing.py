@@ -0,0 +1,224 @@
+"""Fast content hash of play calls for manim's partial-movie cache.
+
+manim names partial movies after a JSON dump of the camera, the animations
+and every mobject on screen.  For scenes with hundreds of wavefront arcs that
+dump dominates the time spent per ``play``/``wait``, and large arrays are
+truncated before hashing, so different states can collide.  This module feeds
+the same objects into blake2b (xxh3 when ``xxhash`` is installed) instead:
+
+* numpy arrays go in as raw buffers, whole, with dtype and shape;
+* attributes are walked in sorted order, with type tags, so the encoding is
+  canonical; functions contribute their code, defaults and closure values;
+* the immutable attributes of a mobject (numbers, strings, colours, tuples of
+  those) are encoded once and memoized per mobject.  The memo is keyed on the
+  identity of those values and keeps them alive, so rebinding any of them
+  (``set_fill``, ``z_index = ...``) invalidates it; arrays, containers and
+  functions are always hashed afresh.
+
+Enable it through the render wrapper::
+
+    python scripts/render.py --fast-hashing examples_manim_slides/formulas.py Formulas
+
+Partial movies get new names, so the first render with it re-encodes
+everything once.  ``IncrementalSlide`` keeps working: its segment keys are
+computed from whichever play hash is installed.
+"""
+import hashlib
+import sys
+import weakref
+
+import numpy as np
+
+try:
+    import xxhash
+except ImportError:  # optional, blake2b is fast enough without it
+    xxhash = None
+
+# Camera attributes that hold the last rendered frame rather than camera state
+CAMERA_SKIPPED = frozenset({"pixel_array", "background"})
+_IMMUTABLE = (int, float, complex, str, bytes, bool, type(None))
+
+
+def _new_hash():
+    return xxhash.xxh3_64() if xxhash is not None else hashlib.blake2b(digest_size=8)
+
+
+def _is_immutable(value):
+    if isinstance(value, _IMMUTABLE):
+        return True
+    if isinstance(value, tuple):
+        return all(isinstance(item, _IMMUTABLE) for item in value)
+    # manim colours are value objects, every colour change assigns a new one
+    return type(value).__name__ == "ManimColor"
+
+
+class _MobjectMemo:
+    __slots__ = ("names", "values", "digest")
+
+    def __init__(self, names, values, digest):
+        self.names = names
+        self.values = values
+        self.digest = digest
+
+
+_memo = weakref.WeakKeyDictionary()
+
+
+class StateHasher:
+    """Canonical, buffer-based encoder of scene objects into one running hash."""
+
+    def __init__(self):
+        self.hash = _new_hash()
+        self.seen = {}
+
+    def hexdigest(self):
+        return self.hash.hexdigest()
+
+    def tag(self, label):
+        self.hash.update(label.encode() + b"\0")
+
+    def feed(self, value):
+        update = self.hash.update
+        if isinstance(value, _IMMUTABLE):
+            update(f"{type(value).__name__}:{value!r}\0".encode())
+            return
+        if isinstance(value, np.ndarray):
+            self.feed_array(value)
+            return
+        if isinstance(value, np.generic):
+            update(f"{value.dtype.str}:{value!r}\0".encode())
+            return
+        key = id(value)
+        if key in self.seen:
+            update(f"ref:{self.seen[key]}\0".encode())
+            return
+        self.seen[key] = len(self.seen)
+        if isinstance(value, (list, tuple)):
+            self.tag(f"{type(value).__name__}[{len(value)}]")
+            for item in value:
+                self.feed(item)
+        elif isinstance(value, dict):
+            self.tag(f"dict[{len(value)}]")
+            for item_key in sorted(value, key=repr):
+                self.feed(item_key)
+                self.feed(value[item_key])
+        elif isinstance(value, (set, frozenset)):
+            self.tag(f"set[{len(value)}]")
+            for item in sorted(value, key=repr):
+                self.feed(item)
+        elif hasattr(value, "submobjects"):
+            self.feed_mobject(value)
+        elif hasattr(value, "__code__"):
+            self.feed_function(value)
+        elif hasattr(value, "__func__"):
+            self.tag("method")
+            self.feed(value.__func__)
+            self.feed(value.__self__)
+        elif hasattr(value, "construct") and hasattr(value, "renderer"):
+            # The scene, reached through closures: its renderer and file writer change on every play
+            self.tag(f"scene:{type(value).__qualname__}")
+        elif hasattr(value, "__dict__"):
+            self.tag(type(value).__qualname__)
+            self.feed_attributes(vars(value), CAMERA_SKIPPED)
+        else:
+            # C objects (cairo contexts, locks...) only contribute their type
+            self.tag(type(value).__qualname__)
+
+    def feed_array(self, array):
+        self.tag(f"ndarray:{array.dtype.str}:{array.shape}")
+        if array.dtype.hasobject:
+            for item in array.ravel():
+                self.feed(item)
+        else:
+            self.hash.update(np.ascontiguousarray(array))
+
+    def feed_function(self, function):
+        code = function.__code__
+        self.tag(f"function:{getattr(function, '__qualname__', '')}")
+        self.feed_code(code)
+        self.feed(function.__defaults__)
+        self.feed(function.__kwdefaults__)
+        if function.__closure__:
+            for name, cell in zip(code.co_freevars, function.__closure__):
+                self.tag(name)
+                try:
+                    self.feed(cell.cell_contents)
+                except ValueError:  # empty cell
+                    self.tag("empty")
+
+    def feed_code(self, code):
+        self.hash.update(code.co_code)
+        for constant in code.co_consts:
+            if hasattr(constant, "co_code"):
+                self.feed_code(constant)
+            else:
+                self.feed(constant)
+        self.tag(",".join(code.co_names))
+
+    def feed_attributes(self, attributes, skipped=frozenset()):
+        for name in sorted(attributes):
+            if name in skipped:
+                continue
+            self.tag(name)
+            self.feed(attributes[name])
+
+    def feed_mobject(self, mobject):
+        self.tag(f"mobject:{type(mobject).__qualname__}")
+        attributes = vars(mobject)
+        names = sorted(attributes)
+        immutable = tuple(name for name in names if _is_immutable(attributes[name]))
+        values = tuple(attributes[name] for name in immutable)
+        try:
+            memo = _memo.get(mobject)
+        except TypeError:  # unhashable mobject class, nothing to memoize on
+            memo = None
+        if memo is None or memo.names != immutable or any(
+            old is not new for old, new in zip(memo.values, values)
+        ):
+            encoder = StateHasher()
+            for name, value in zip(immutable, values):
+                encoder.tag(name)
+                encoder.feed(value)
+            memo = _MobjectMemo(immutable, values, encoder.hexdigest())
+            try:
+                _memo[mobject] = memo
+            except TypeError:
+                pass
+        self.tag(f"{','.join(immutable)}={memo.digest}")
+        # Arrays, containers, functions and child mobjects are hashed every time
+        for name in names:
+            value = attributes[name]
+            if _is_immutable(value):
+                continue
+            self.tag(name)
+            self.feed(value)
+
+
+def state_hash(value):
+    hasher = StateHasher()
+    hasher.feed(value)
+    return hasher.hexdigest()
+
+
+def get_hash_from_play_call(scene_object, camera_object, animations_list, current_mobjects_list):
+    """Drop-in replacement for ``manim.utils.hashing.get_hash_from_play_call``."""
+    camera = state_hash(camera_object)
+    animations = state_hash(sorted(animations_list, key=str))
+    mobjects = state_hash(list(current_mobjects_list))
+    return f"{camera}_{animations}_{mobjects}"
+
+
+def install():
+    """Use the fast hash for every play call of this process."""
+    from manim.renderer import cairo_renderer
+    from manim.utils import hashing
+
+    incremental = sys.modules.get("incremental_slides")
+    if incremental is not None:
+        # IncrementalSlide is already installed and wraps the hash it captured: swap what it wraps
+        incremental._manim_play_hash = get_hash_from_play_call
+        return
+    # Installed first: incremental_slides, if imported later, captures and wraps this one
+    hashing.get_hash_from_play_call = get_hash_from_play_call
+    if hasattr(cairo_renderer, "get_hash_from_play_call"):
+        cairo_renderer.get_hash_from_play_call = get_hash_from_play_call
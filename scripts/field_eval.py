@@ -0,0 +1,110 @@
+"""Tiled, single-precision evaluation of fields on large 2D grids.
+
+Evaluating a field over a full grid at once allocates several grid-sized
+float64/complex128 temporaries (displacements, distances, phases,
+exponentials), which multiplies peak memory at still resolutions.  These
+helpers walk the grid in cache-sized tiles instead, compute in float32 by
+default and write into one preallocated output::
+
+    x = np.linspace(left, right, 2000)
+    y = np.linspace(bottom, top, 2000)
+    intensity = summed_intensity(x, y, sources, phases, k, amplitude)        # (2000, 2000) float32
+    wave = real_part(x, y, sources[0], phases[0], k, amplitude)
+    Y = evaluate_tiled(lambda X, Z: np.cos(np.hypot(X, Z)), x, z)           # any elementwise formula
+
+Rows of the output follow ``y`` and columns follow ``x``, the layout
+``imshow(..., origin='lower')`` and ``contourf(x, y, values)`` expect.  Pass
+``dtype=np.float64`` when the extra precision matters.  Peak memory is the
+output plus a handful of ``TILE_CELLS``-sized buffers, whatever the grid size.
+"""
+import numpy as np
+
+# Cells per tile: a few float32 tile buffers stay within a typical L2 cache
+TILE_CELLS = 64 * 1024
+
+
+def tiles(shape, tile_cells=TILE_CELLS):
+    """Row and column slices covering ``shape`` in tiles of at most ``tile_cells`` cells."""
+    rows, cols = shape
+    tile_cols = min(cols, tile_cells)
+    tile_rows = max(1, min(rows, tile_cells // tile_cols))
+    for row in range(0, rows, tile_rows):
+        for col in range(0, cols, tile_cols):
+            yield slice(row, row + tile_rows), slice(col, col + tile_cols)
+
+
+def _output(x, y, out, dtype):
+    shape = (len(y), len(x))
+    if out is None:
+        return np.empty(shape, dtype=dtype)
+    if out.shape != shape:
+        raise ValueError(f"Output has shape {out.shape}, the grid is {shape}")
+    return out
+
+
+def evaluate_tiled(function, x, y, out=None, dtype=np.float32, tile_cells=TILE_CELLS):
+    """``function(X, Y)`` over the grid spanned by ``x`` and ``y``, one tile at a time.
+
+    ``function`` gets broadcastable (rows, 1) and (1, cols) coordinate blocks
+    and must be elementwise.
+    """
+    x, y = np.asarray(x, dtype=dtype), np.asarray(y, dtype=dtype)
+    out = _output(x, y, out, dtype)
+    for rows, cols in tiles(out.shape, tile_cells):
+        out[rows, cols] = function(x[None, cols], y[rows, None])
+    return out
+
+
+def _tile_buffers(count, tile_cells, dtype):
+    return [np.empty(tile_cells, dtype=dtype) for _ in range(count)]
+
+
+def _view(buffer, shape):
+    return buffer[:shape[0] * shape[1]].reshape(shape)
+
+
+def _wave_phase(tile_x, tile_y, source, initial_phase, k, out):
+    """``k |p - source| + initial_phase`` for the grid points (in the z = 0 plane) of one tile."""
+    np.hypot(tile_x - source[0], tile_y - source[1], out=out)
+    if len(source) > 2 and source[2]:
+        np.hypot(out, source[2], out=out)
+    out *= k
+    out += initial_phase
+    return out
+
+
+def summed_intensity(x, y, sources, phases, k, amplitude, out=None, dtype=np.float32, tile_cells=TILE_CELLS):
+    """``|sum_i amplitude * exp(j (k |p - s_i| + phase_i))|^2`` over the grid.
+
+    The complex sum is accumulated as separate real and imaginary tile buffers,
+    so no complex temporaries are created.
+    """
+    x, y = np.asarray(x, dtype=dtype), np.asarray(y, dtype=dtype)
+    out = _output(x, y, out, dtype)
+    sources = np.asarray(sources, dtype=dtype).reshape(len(phases), -1)
+    buffers = _tile_buffers(4, tile_cells, dtype)
+    for rows, cols in tiles(out.shape, tile_cells):
+        tile = out[rows, cols]
+        phase, real, imag, scratch = (_view(buffer, tile.shape) for buffer in buffers)
+        real.fill(0)
+        imag.fill(0)
+        for source, initial_phase in zip(sources, phases):
+            _wave_phase(x[None, cols], y[rows, None], source, initial_phase, k, phase)
+            real += np.cos(phase, out=scratch)
+            imag += np.sin(phase, out=scratch)
+        np.multiply(real, real, out=tile)
+        tile += np.multiply(imag, imag, out=scratch)
+        tile *= amplitude * amplitude
+    return out
+
+
+def real_part(x, y, source, phase, k, amplitude, out=None, dtype=np.float32, tile_cells=TILE_CELLS):
+    """``amplitude * cos(k |p - source| + phase)`` over the grid: one wave's instantaneous field."""
+    x, y = np.asarray(x, dtype=dtype), np.asarray(y, dtype=dtype)
+    out = _output(x, y, out, dtype)
+    source = np.asarray(source, dtype=dtype)
+    for rows, cols in tiles(out.shape, tile_cells):
+        tile = out[rows, cols]
+        np.cos(_wave_phase(x[None, cols], y[rows, None], source, phase, k, tile), out=tile)
+        tile *= amplitude
+    return out
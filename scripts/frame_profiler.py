@@ -0,0 +1,236 @@
+"""Opt-in per-frame timing of updaters, animations, frame rendering and frame writing.
+
+Enable it through the render wrapper::
+
+    python scripts/render.py --profile scripts/rx_beamforming_phasors.py RxBeamformingPhasors -ql
+
+For every rendered scene a summary table is printed and the per-frame timings
+are written to ``<media_dir>/profiles/<Scene>_frames.csv`` (scene totals go to
+``<Scene>_summary.json``).  Timings nest:
+``update`` contains the ``updater:*`` and ``animation:*`` entries, ``render`` is
+Cairo rasterization and ``write`` is handing the frame to the movie encoder.
+Pass ``--disable_caching`` to manim when you want every animation measured,
+cached animations are fast-forwarded without rendering.
+"""
+import csv
+import functools
+import json
+import time
+from collections import defaultdict
+from pathlib import Path
+
+import manim_hooks
+
+CATEGORIES = ("update", "render", "write")
+
+
+def updater_label(function):
+    """Readable, stable name for an updater function."""
+    code = getattr(function, "__code__", None)
+    qualname = getattr(function, "__qualname__", None)
+    # Callable updater objects (keyframes.KeyframedUpdater) are named after what they compute
+    if qualname is None:
+        compute = getattr(function, "compute", None)
+        inner = f"({updater_label(compute)})" if compute is not None else ""
+        return f"{type(function).__name__}{inner}"
+    # always_redraw wraps the user's function in a lambda, report the inner one
+    if qualname.startswith("always_redraw") and code is not None and "func" in code.co_freevars:
+        inner = function.__closure__[code.co_freevars.index("func")].cell_contents
+        return f"always_redraw({updater_label(inner)})"
+    label = qualname.replace(".<locals>", "")
+    if code is not None:
+        label += f"@{Path(code.co_filename).name}:{code.co_firstlineno}"
+    return label
+
+
+def animation_label(animation):
+    return f"{type(animation).__name__}({type(animation.mobject).__name__})"
+
+
+class _TimedUpdater:
+    """Updater wrapper that reports its run time and still compares equal to the original,
+    so ``remove_updater(original)`` keeps working."""
+
+    def __init__(self, profiler, function):
+        self.profiler = profiler
+        self.function = function
+        self.label = "updater:" + updater_label(function)
+        functools.update_wrapper(self, function)
+
+    def __call__(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return self.function(*args, **kwargs)
+        finally:
+            self.profiler.record(self.label, time.perf_counter() - start)
+
+    def __eq__(self, other):
+        if isinstance(other, _TimedUpdater):
+            other = other.function
+        return self.function == other
+
+    def __hash__(self):
+        return hash(self.function)
+
+
+class FrameProfiler:
+    def __init__(self):
+        self.reset(None)
+
+    def reset(self, scene_name):
+        self.scene_name = scene_name
+        self.frames = []
+        self.current = defaultdict(float)
+        self.calls = defaultdict(int)
+        self.play_index = 0
+        self.scene_start = time.perf_counter()
+        self.combine_time = 0.0
+
+    def record(self, label, seconds):
+        self.current[label] += seconds
+        self.calls[label] += 1
+
+    def timed(self, label, function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.record(label, time.perf_counter() - start)
+        return wrapper
+
+    def end_frame(self, num_frames, skipped):
+        row = dict(self.current)
+        row["frame"] = len(self.frames)
+        row["play"] = self.play_index
+        row["num_frames"] = num_frames
+        row["skipped"] = int(skipped)
+        self.frames.append(row)
+        self.current = defaultdict(float)
+
+    # --- Reporting ---
+    def labels(self):
+        seen = set()
+        for row in self.frames:
+            seen.update(row)
+        seen -= {"frame", "play", "num_frames", "skipped"}
+        others = sorted(seen - set(CATEGORIES))
+        return [c for c in CATEGORIES if c in seen] + others
+
+    def summary_rows(self):
+        rows = []
+        for label in self.labels():
+            values = [row.get(label, 0.0) for row in self.frames]
+            total = sum(values)
+            rows.append((label, total, total / max(len(values), 1), max(values, default=0.0), self.calls[label]))
+        return rows
+
+    def print_summary(self):
+        wall = time.perf_counter() - self.scene_start
+        rendered = sum(1 for row in self.frames if not row["skipped"])
+        print(f"\n--- Frame timings for {self.scene_name}: {len(self.frames)} frames "
+              f"({rendered} rendered), {wall:.2f} s wall ---")
+        print(f"{'label':<70} {'total s':>9} {'ms/frame':>9} {'max ms':>9} {'calls':>7} {'share':>6}")
+        for label, total, mean, worst, calls in self.summary_rows():
+            indent = "" if label in CATEGORIES else "  "
+            print(f"{indent + label:<70} {total:>9.3f} {mean * 1e3:>9.2f} {worst * 1e3:>9.2f} "
+                  f"{calls:>7} {100 * total / wall:>5.1f}%")
+        print(f"{'combine movie':<70} {self.combine_time:>9.3f}")
+
+    def write_csv(self):
+        path = manim_hooks.output_path("profiles", f"{self.scene_name}_frames.csv")
+        labels = self.labels()
+        with open(path, "w", newline="") as csv_file:
+            writer = csv.writer(csv_file)
+            writer.writerow(["frame", "play", "num_frames", "skipped"] + [f"{label} [s]" for label in labels])
+            for row in self.frames:
+                writer.writerow(
+                    [row["frame"], row["play"], row["num_frames"], row["skipped"]]
+                    + [f"{row.get(label, 0.0):.6f}" for label in labels]
+                )
+        print(f"Per-frame timings written to {path}")
+
+    def write_summary_json(self):
+        """Scene totals in machine-readable form, used by benchmark_scenes.py."""
+        path = manim_hooks.output_path("profiles", f"{self.scene_name}_summary.json")
+        summary = {
+            "scene": self.scene_name,
+            "wall_time": time.perf_counter() - self.scene_start,
+            "frames": sum(row["num_frames"] for row in self.frames),
+            "rendered_frames": sum(row["num_frames"] for row in self.frames if not row["skipped"]),
+            "phases": {label: total for label, total, *_ in self.summary_rows() if label in CATEGORIES},
+        }
+        summary["phases"]["combine"] = self.combine_time
+        with open(path, "w") as json_file:
+            json.dump(summary, json_file, indent=2)
+
+
+profiler = FrameProfiler()
+
+
+def install():
+    """Wrap manim's update, render and write steps with timers."""
+    from manim import Mobject, Scene
+    from manim.renderer.cairo_renderer import CairoRenderer
+    from manim.scene.scene_file_writer import SceneFileWriter
+
+    def wrap_add_updater(original):
+        def add_updater(self, update_function, *args, **kwargs):
+            if not isinstance(update_function, _TimedUpdater):
+                update_function = _TimedUpdater(profiler, update_function)
+            return original(self, update_function, *args, **kwargs)
+        return add_updater
+
+    def wrap_begin_animations(original):
+        def begin_animations(self):
+            original(self)
+            for animation in self.animations:
+                animation.interpolate = profiler.timed(
+                    "animation:" + animation_label(animation), animation.interpolate
+                )
+        return begin_animations
+
+    def wrap_play(original):
+        def play(self, *args, **kwargs):
+            try:
+                return original(self, *args, **kwargs)
+            finally:
+                profiler.play_index += 1
+        return play
+
+    def wrap_add_frame(original):
+        def add_frame(self, frame, num_frames=1):
+            try:
+                return original(self, frame, num_frames)
+            finally:
+                profiler.end_frame(num_frames, self.skip_animations)
+        return add_frame
+
+    def wrap_combine(original):
+        def combine_to_movie(self, *args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return original(self, *args, **kwargs)
+            finally:
+                profiler.combine_time += time.perf_counter() - start
+        return combine_to_movie
+
+    manim_hooks.patch_method(Mobject, "add_updater", wrap_add_updater)
+    manim_hooks.patch_method(Scene, "begin_animations", wrap_begin_animations)
+    manim_hooks.patch_method(Scene, "play", wrap_play)
+    manim_hooks.patch_method(Scene, "update_to_time", lambda f: profiler.timed("update", f))
+    manim_hooks.patch_method(CairoRenderer, "update_frame", lambda f: profiler.timed("render", f))
+    manim_hooks.patch_method(CairoRenderer, "get_frame", lambda f: profiler.timed("render", f))
+    manim_hooks.patch_method(CairoRenderer, "add_frame", wrap_add_frame)
+    manim_hooks.patch_method(SceneFileWriter, "write_frame", lambda f: profiler.timed("write", f))
+    manim_hooks.patch_method(SceneFileWriter, "combine_to_movie", wrap_combine)
+
+    manim_hooks.on_scene_start(lambda scene: profiler.reset(type(scene).__name__))
+
+    def report(scene):
+        profiler.print_summary()
+        profiler.write_csv()
+        profiler.write_summary_json()
+
+    manim_hooks.on_scene_end(report)
@@ -0,0 +1,74 @@
+"""Background producer for frames whose inputs are known before playback.
+
+When an updater follows a known trajectory (``alignment_tracker`` going
+linearly from 0 to 1 in Step 5 of ``RxBeamformingPhasors``), every value it
+will ask for is known up front.  ``HeatmapPrefetcher`` computes them on a
+process pool, a bounded window ahead of playback, while manim rasterizes and
+encodes the earlier frames; the updater only collects finished results::
+
+    source = HeatmapPrefetcher(summed_heatmap_png, spec, schedule)
+    def heatmap_updater(img_mob):
+        png_bytes = source.get(alignment_tracker.get_value())
+        ...
+    ...
+    source.close()
+
+``function(argument, value)`` must be a module-level function so it can be sent
+to the workers.  Values off the schedule are computed in the calling process.
+"""
+import bisect
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+
+class HeatmapPrefetcher:
+    def __init__(self, function, argument, schedule, workers=None, ahead=None, tolerance=None):
+        self.function = function
+        self.argument = argument
+        self.schedule = sorted(float(value) for value in schedule)
+        self.workers = workers or max(1, min(4, (os.cpu_count() or 2) - 1))
+        # Results waiting to be used are the only memory cost, so keep the window small
+        self.ahead = ahead or 4 * self.workers
+        if tolerance is None:
+            steps = [b - a for a, b in zip(self.schedule, self.schedule[1:]) if b > a]
+            tolerance = min(steps) / 2 if steps else 1e-9
+        self.tolerance = tolerance
+        self.futures = {}
+        self.next_index = 0
+        self.pool = ProcessPoolExecutor(max_workers=self.workers) if self.schedule else None
+        self._fill(0)
+
+    def _fill(self, index):
+        """Keep the ``ahead`` values from ``index`` on submitted."""
+        self.next_index = max(self.next_index, index)
+        while self.next_index < min(index + self.ahead, len(self.schedule)):
+            self.futures[self.next_index] = self.pool.submit(
+                self.function, self.argument, self.schedule[self.next_index]
+            )
+            self.next_index += 1
+
+    def _nearest(self, value):
+        position = bisect.bisect_left(self.schedule, value)
+        candidates = [index for index in (position - 1, position) if 0 <= index < len(self.schedule)]
+        if not candidates:
+            return None
+        index = min(candidates, key=lambda index: abs(self.schedule[index] - value))
+        return index if abs(self.schedule[index] - value) <= self.tolerance else None
+
+    def get(self, value):
+        index = self._nearest(value)
+        if index is None or self.pool is None:
+            return self.function(self.argument, value)
+        # Frames before this one will not be asked for again
+        for passed in [passed for passed in self.futures if passed < index]:
+            self.futures.pop(passed).cancel()
+        self._fill(index)
+        if index not in self.futures:
+            self.futures[index] = self.pool.submit(self.function, self.argument, self.schedule[index])
+        return self.futures[index].result()
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.shutdown(wait=False, cancel_futures=True)
+            self.pool = None
+        self.futures.clear()
@@ -0,0 +1,328 @@
+"""Batch characterization of hotspots in stacks of 2D/3D field intensities.
+
+Computes the twelve metrics of the ``Characterization`` slide for every field
+of a stack at once, vectorized over the stack::
+
+    metrics = characterize(fields, spacing=(dy, dx))    # fields: (N, H, W) or (N, D, H, W)
+    metrics.fwhm[:, 1]                                  # FWHM along axis 1 of every field
+    metrics.as_dict(0)                                  # everything about the first field
+
+Fields are non-negative intensities (e.g. ``|E|^2``); axis ``i`` of a field is
+sampled every ``spacing[i]`` units.  Definitions:
+
+* peak: the global maximum and its grid index;
+* FWHM: width of the half-maximum crossing around the peak along each axis,
+  linearly interpolated between samples (NaN when the lobe reaches the edge);
+* side lobes and troughs: local maxima and minima of the axis profiles through
+  the peak, ordered outwards on each side (``[..., 0, k]`` towards lower
+  indices, ``[..., 1, k]`` towards higher ones); trough depths are the trough
+  value over the peak, side-lobe ratios the side-lobe peak over the peak;
+* main lobe: the box between the first troughs on every axis; the mean
+  background is the mean field outside it;
+* peak-to-prominence ratio: peak over its prominence, the drop from the peak
+  to the highest first trough;
+* ellipticity: ``1 - sqrt(l_min / l_max)`` of the second moments of the
+  above-half-maximum part of the main lobe;
+* dimensionality: number of axes whose FWHM is below ``confinement`` times
+  the axis length.
+
+``half_max_contour`` extracts the half-maximum iso-lines of a 2D field with
+vectorized marching squares, for ``hotspot_overlay.HotspotOverlay``.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+
+# Grid cells processed at once; large studies are characterized chunk by chunk
+CHUNK_CELLS = 20_000_000
+
+
+@dataclass
+class HotspotMetrics:
+    peak: np.ndarray                 # (N,)
+    peak_index: np.ndarray           # (N, d)
+    fwhm: np.ndarray                 # (N, d)
+    peak_to_prominence: np.ndarray   # (N,)
+    dimensionality: np.ndarray       # (N,)
+    ellipticity: np.ndarray          # (N,)
+    mean_background: np.ndarray      # (N,)
+    peak_to_background: np.ndarray   # (N,)
+    side_lobe_peaks: np.ndarray      # (N, d, 2, orders)
+    side_lobe_distances: np.ndarray  # (N, d, 2, orders)
+    trough_depths: np.ndarray        # (N, d, 2, orders)
+    trough_distances: np.ndarray     # (N, d, 2, orders)
+    side_lobe_ratios: np.ndarray     # (N, d, 2, orders)
+
+    def __len__(self):
+        return len(self.peak)
+
+    def as_dict(self, index):
+        return {name: getattr(self, name)[index] for name in self.__dataclass_fields__}
+
+    @classmethod
+    def concatenate(cls, parts):
+        return cls(**{
+            name: np.concatenate([getattr(part, name) for part in parts])
+            for name in cls.__dataclass_fields__
+        })
+
+
+# --- Axis profiles ---
+def _profiles(fields, peak_index, axis):
+    """(N, L) cuts through every field's peak along ``axis``."""
+    moved = np.moveaxis(fields, axis + 1, -1)
+    others = [peak_index[:, other] for other in range(fields.ndim - 1) if other != axis]
+    return moved[(np.arange(len(fields)), *others)]
+
+
+def _half_crossings(profile, center, half):
+    """Sub-sample positions where ``profile`` first drops below ``half`` on each side of ``center``."""
+    length = profile.shape[1]
+    rows = np.arange(len(profile))
+    index = np.arange(length)[None, :]
+    below = profile < half[:, None]
+
+    right = np.where(below & (index > center[:, None]), index, length).min(axis=1)
+    has_right = right < length
+    right_inner = np.clip(right - 1, 0, length - 1)
+    right_outer = np.clip(right, 0, length - 1)
+    inner, outer = profile[rows, right_inner], profile[rows, right_outer]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        right_x = right_inner + (inner - half) / (inner - outer)
+
+    left = np.where(below & (index < center[:, None]), index, -1).max(axis=1)
+    has_left = left >= 0
+    left_outer = np.clip(left, 0, length - 1)
+    left_inner = np.clip(left + 1, 0, length - 1)
+    inner, outer = profile[rows, left_inner], profile[rows, left_outer]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        left_x = left_inner - (inner - half) / (inner - outer)
+
+    return np.where(has_left, left_x, np.nan), np.where(has_right, right_x, np.nan)
+
+
+def _ordered_extrema(profile, center, orders, find_maxima):
+    """Positions (N, 2, orders) of the local extrema on each side of ``center``, nearest first; -1 if absent."""
+    previous, current, following = profile[:, :-2], profile[:, 1:-1], profile[:, 2:]
+    if find_maxima:
+        interior = (current > previous) & (current >= following)
+    else:
+        interior = (current < previous) & (current <= following)
+    extrema = np.zeros(profile.shape, dtype=bool)
+    extrema[:, 1:-1] = interior
+
+    length = profile.shape[1]
+    index = np.arange(length)[None, :]
+    positions = np.full((len(profile), 2, orders), -1)
+    for side, outward in enumerate((index < center[:, None], index > center[:, None])):
+        candidates = extrema & outward
+        # Rank the candidates by distance from the peak: count them walking outwards
+        if side == 0:
+            rank = np.cumsum(candidates[:, ::-1], axis=1)[:, ::-1]
+        else:
+            rank = np.cumsum(candidates, axis=1)
+        for order in range(orders):
+            match = candidates & (rank == order + 1)
+            found = match.any(axis=1)
+            positions[:, side, order] = np.where(found, match.argmax(axis=1), -1)
+    return positions
+
+
+def _values_at(profile, positions):
+    rows = np.arange(len(profile))[:, None, None]
+    values = profile[rows, np.clip(positions, 0, None)]
+    return np.where(positions >= 0, values, np.nan)
+
+
+# --- Characterization ---
+def _characterize_chunk(fields, spacing, orders, confinement):
+    count, shape = len(fields), fields.shape[1:]
+    dims = len(shape)
+    flat_peak = fields.reshape(count, -1).argmax(axis=1)
+    peak_index = np.stack(np.unravel_index(flat_peak, shape), axis=1)
+    peak = fields.reshape(count, -1)[np.arange(count), flat_peak]
+    half = peak / 2
+
+    fwhm = np.empty((count, dims))
+    lobe_shape = (count, dims, 2, orders)
+    side_lobe_peaks, side_lobe_distances = np.empty(lobe_shape), np.empty(lobe_shape)
+    trough_values, trough_distances = np.empty(lobe_shape), np.empty(lobe_shape)
+    inside = np.ones(fields.shape, dtype=bool)
+    for axis in range(dims):
+        profile = _profiles(fields, peak_index, axis)
+        center = peak_index[:, axis]
+        left_x, right_x = _half_crossings(profile, center, half)
+        fwhm[:, axis] = (right_x - left_x) * spacing[axis]
+
+        maxima = _ordered_extrema(profile, center, orders, find_maxima=True)
+        minima = _ordered_extrema(profile, center, orders, find_maxima=False)
+        side_lobe_peaks[:, axis] = _values_at(profile, maxima)
+        trough_values[:, axis] = _values_at(profile, minima)
+        offsets = np.abs(maxima - center[:, None, None])
+        side_lobe_distances[:, axis] = np.where(maxima >= 0, offsets * spacing[axis], np.nan)
+        offsets = np.abs(minima - center[:, None, None])
+        trough_distances[:, axis] = np.where(minima >= 0, offsets * spacing[axis], np.nan)
+
+        # Main lobe along this axis: between the first troughs, or the whole axis where there are none
+        length = profile.shape[1]
+        low = np.where(minima[:, 0, 0] >= 0, minima[:, 0, 0], 0)
+        high = np.where(minima[:, 1, 0] >= 0, minima[:, 1, 0], length - 1)
+        index = np.arange(length)[None, :]
+        axis_inside = (index >= low[:, None]) & (index <= high[:, None])
+        broadcast = [count] + [1] * dims
+        broadcast[axis + 1] = length
+        inside &= axis_inside.reshape(broadcast)
+
+    outside_count = (~inside).reshape(count, -1).sum(axis=1)
+    outside_sum = np.where(inside, 0.0, fields).reshape(count, -1).sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean_background = np.where(outside_count > 0, outside_sum / outside_count, np.nan)
+        peak_to_background = peak / mean_background
+
+        first_troughs = trough_values[:, :, :, 0].reshape(count, -1)
+        key_col = np.where(np.isnan(first_troughs).all(axis=1), np.nan,
+                           np.nanmax(np.where(np.isnan(first_troughs), -np.inf, first_troughs), axis=1))
+        peak_to_prominence = peak / (peak - key_col)
+
+    # Second moments of the above-half-maximum main lobe
+    weights = np.clip(fields - half.reshape([count] + [1] * dims), 0, None) * inside
+    total = weights.reshape(count, -1).sum(axis=1)
+    # An all-zero field has no weight above half maximum: its moments are undefined
+    total = np.where(total > 0, total, np.nan)
+    coordinates = [
+        (np.arange(length) * spacing[axis]).reshape([1] * (axis + 1) + [length] + [1] * (dims - axis - 1))
+        for axis, length in enumerate(shape)
+    ]
+    means = [(weights * coordinate).reshape(count, -1).sum(axis=1) / total for coordinate in coordinates]
+    covariance = np.empty((count, dims, dims))
+    for i in range(dims):
+        centered_i = coordinates[i] - means[i].reshape([count] + [1] * dims)
+        for j in range(i, dims):
+            centered_j = coordinates[j] - means[j].reshape([count] + [1] * dims)
+            value = (weights * centered_i * centered_j).reshape(count, -1).sum(axis=1) / total
+            covariance[:, i, j] = covariance[:, j, i] = value
+    # eigvalsh does not converge on NaN matrices (in 3D), so undefined rows are left out
+    defined = np.isfinite(covariance).all(axis=(1, 2))
+    eigenvalues = np.full((count, dims), np.nan)
+    eigenvalues[defined] = np.linalg.eigvalsh(covariance[defined])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ellipticity = 1 - np.sqrt(np.clip(eigenvalues[:, 0], 0, None) / eigenvalues[:, -1])
+
+    axis_lengths = np.array([(length - 1) * step for length, step in zip(shape, spacing)])
+    dimensionality = (np.nan_to_num(fwhm, nan=np.inf) < confinement * axis_lengths).sum(axis=1)
+
+    return HotspotMetrics(
+        peak=peak,
+        peak_index=peak_index,
+        fwhm=fwhm,
+        peak_to_prominence=peak_to_prominence,
+        dimensionality=dimensionality,
+        ellipticity=ellipticity,
+        mean_background=mean_background,
+        peak_to_background=peak_to_background,
+        side_lobe_peaks=side_lobe_peaks,
+        side_lobe_distances=side_lobe_distances,
+        trough_depths=trough_values / peak[:, None, None, None],
+        trough_distances=trough_distances,
+        side_lobe_ratios=side_lobe_peaks / peak[:, None, None, None],
+    )
+
+
+def characterize(fields, spacing=1.0, orders=3, confinement=0.5):
+    """Hotspot metrics of every field in ``fields`` (shape (N, H, W) or (N, D, H, W))."""
+    fields = np.asarray(fields, dtype=float)
+    if fields.ndim not in (3, 4):
+        raise ValueError(f"Expected a stack of 2D or 3D fields, got an array of shape {fields.shape}")
+    dims = fields.ndim - 1
+    spacing = tuple(np.broadcast_to(np.asarray(spacing, dtype=float), (dims,)))
+    chunk = max(1, CHUNK_CELLS // int(np.prod(fields.shape[1:])))
+    parts = [
+        _characterize_chunk(fields[start:start + chunk], spacing, orders, confinement)
+        for start in range(0, len(fields), chunk)
+    ]
+    return parts[0] if len(parts) == 1 else HotspotMetrics.concatenate(parts)
+
+
+# --- Half-maximum contour (marching squares) ---
+# Edges of a cell: 0 bottom, 1 right, 2 top, 3 left.  Segments per corner case
+# (bit 0 bottom-left, 1 bottom-right, 2 top-right, 3 top-left above the level);
+# the saddle cases 5 and 10 are resolved with the cell-centre value below.
+_SEGMENTS = {
+    1: [(3, 0)], 2: [(0, 1)], 3: [(3, 1)], 4: [(1, 2)], 6: [(0, 2)], 7: [(3, 2)],
+    8: [(2, 3)], 9: [(0, 2)], 11: [(1, 2)], 12: [(3, 1)], 13: [(0, 1)], 14: [(3, 0)],
+}
+_SADDLES = {
+    # case: (segments when the centre is above the level, when it is below)
+    5: ([(0, 1), (2, 3)], [(3, 0), (1, 2)]),
+    10: ([(3, 0), (1, 2)], [(0, 1), (2, 3)]),
+}
+
+
+def contour_segments(field, level):
+    """Iso-line segments of a 2D ``field`` at ``level`` as an (M, 2, 2) array of (row, col) points."""
+    a, b = field[:-1, :-1], field[:-1, 1:]
+    c, d = field[1:, 1:], field[1:, :-1]
+    case = (a >= level) * 1 + (b >= level) * 2 + (c >= level) * 4 + (d >= level) * 8
+    rows, cols = np.indices(case.shape)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        edge_points = [
+            np.stack([rows, cols + (level - a) / (b - a)], axis=-1),      # bottom
+            np.stack([rows + (level - b) / (c - b), cols + 1], axis=-1),  # right
+            np.stack([rows + 1, cols + (level - d) / (c - d)], axis=-1),  # top
+            np.stack([rows + (level - a) / (d - a), cols], axis=-1),      # left
+        ]
+    centre_above = (a + b + c + d) / 4 >= level
+    segments = []
+    cases = [(case == value, pairs) for value, pairs in _SEGMENTS.items()]
+    for value, (above_pairs, below_pairs) in _SADDLES.items():
+        cases.append(((case == value) & centre_above, above_pairs))
+        cases.append(((case == value) & ~centre_above, below_pairs))
+    for mask, pairs in cases:
+        for start_edge, end_edge in pairs:
+            segments.append(np.stack([edge_points[start_edge][mask], edge_points[end_edge][mask]], axis=1))
+    return np.concatenate(segments) if segments else np.empty((0, 2, 2))
+
+
+def contour_paths(segments, decimals=6):
+    """Chain segments that share end points into polylines (lists of points)."""
+    ends = {}
+    for index, segment in enumerate(segments):
+        for point in segment:
+            ends.setdefault(tuple(np.round(point, decimals)), []).append(index)
+    used = np.zeros(len(segments), dtype=bool)
+    paths = []
+    for start in range(len(segments)):
+        if used[start]:
+            continue
+        used[start] = True
+        path = [segments[start][0], segments[start][1]]
+        # Grow the polyline from both of its ends
+        for grow_front in (False, True):
+            while True:
+                tip = tuple(np.round(path[0] if grow_front else path[-1], decimals))
+                following = [index for index in ends.get(tip, []) if not used[index]]
+                if not following:
+                    break
+                used[following[0]] = True
+                first, second = segments[following[0]]
+                point = second if tuple(np.round(first, decimals)) == tip else first
+                if grow_front:
+                    path.insert(0, point)
+                else:
+                    path.append(point)
+        paths.append(np.array(path))
+    return paths
+
+
+def half_max_contour(field, peak_index=None, main_lobe_only=True):
+    """Polylines, in (row, col) grid coordinates, of the half-maximum contour of a 2D field.
+
+    With ``main_lobe_only`` only the contour enclosing the peak is returned.
+    """
+    field = np.asarray(field, dtype=float)
+    if peak_index is None:
+        peak_index = np.unravel_index(field.argmax(), field.shape)
+    paths = contour_paths(contour_segments(field, field[tuple(peak_index)] / 2))
+    if not main_lobe_only or not paths:
+        return paths
+    return [min(paths, key=lambda path: np.min(np.linalg.norm(path - np.asarray(peak_index), axis=1)))]
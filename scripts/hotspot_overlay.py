@@ -0,0 +1,109 @@
+"""Animated annotation of a hotspot on a heatmap.
+
+Draws the half-maximum contour, the peak, FWHM bars and the first side lobes
+of a 2D field on top of the ``ImageMobject`` showing it::
+
+    overlay = HotspotOverlay(field, heatmap_extent)   # field[row, col], row 0 at the bottom
+    self.play(overlay.animation())
+
+``extent`` is the (left, right, bottom, top) the heatmap was drawn with, as
+passed to ``imshow(..., origin='lower', extent=...)``.  The numbers come from
+``hotspot_metrics``; call ``set_field`` (e.g. from an updater) to follow a
+changing field.  FWHM bars are centred on the peak.
+"""
+import numpy as np
+from manim import (
+    DOWN, LEFT, RIGHT, UP, WHITE, YELLOW, Create, Dot, FadeIn, GrowFromCenter, LaggedStart, Line, Text, VGroup,
+    VMobject,
+)
+
+from hotspot_metrics import characterize, half_max_contour
+
+
+class HotspotOverlay(VGroup):
+    def __init__(self, field, extent, color=WHITE, peak_color=YELLOW, font_size=18, show_labels=True, **kwargs):
+        super().__init__(**kwargs)
+        self.extent = extent
+        self.overlay_color = color
+        self.peak_color = peak_color
+        self.font_size = font_size
+        self.show_labels = show_labels
+        self.metrics = None
+        self.contour = VGroup()
+        self.peak_dot = VGroup()
+        self.fwhm_bars = VGroup()
+        self.side_lobe_dots = VGroup()
+        self.labels = VGroup()
+        self.add(self.contour, self.fwhm_bars, self.side_lobe_dots, self.peak_dot, self.labels)
+        self.set_field(field)
+
+    # --- Geometry ---
+    def spacing(self, shape):
+        left, right, bottom, top = self.extent
+        return (top - bottom) / (shape[0] - 1), (right - left) / (shape[1] - 1)
+
+    def grid_to_scene(self, rows, cols, shape):
+        left, _, bottom, _ = self.extent
+        row_step, col_step = self.spacing(shape)
+        rows, cols = np.asarray(rows, dtype=float), np.asarray(cols, dtype=float)
+        return np.stack([left + cols * col_step, bottom + rows * row_step, np.zeros_like(rows)], axis=-1)
+
+    # --- Annotation ---
+    def set_field(self, field):
+        """Re-measure ``field`` and redraw every part of the overlay."""
+        field = np.asarray(field, dtype=float)
+        shape = field.shape
+        row_step, col_step = self.spacing(shape)
+        self.metrics = characterize(field[None], spacing=(row_step, col_step))
+        values = self.metrics.as_dict(0)
+        peak_row, peak_col = values["peak_index"]
+        peak_point = self.grid_to_scene(peak_row, peak_col, shape)
+
+        contour = VGroup(*[
+            VMobject(stroke_color=self.overlay_color, stroke_width=2).set_points_as_corners(
+                self.grid_to_scene(path[:, 0], path[:, 1], shape)
+            )
+            for path in half_max_contour(field, (peak_row, peak_col))
+        ])
+        peak_dot = VGroup(Dot(peak_point, radius=0.05, color=self.peak_color))
+
+        fwhm_y, fwhm_x = values["fwhm"]
+        bars = VGroup()
+        if np.isfinite(fwhm_x):
+            bars.add(Line(peak_point - RIGHT * fwhm_x / 2, peak_point + RIGHT * fwhm_x / 2,
+                          color=self.overlay_color, stroke_width=2))
+        if np.isfinite(fwhm_y):
+            bars.add(Line(peak_point - UP * fwhm_y / 2, peak_point + UP * fwhm_y / 2,
+                          color=self.overlay_color, stroke_width=2))
+
+        # First-order side lobes on both sides of both axes
+        side_lobes = VGroup()
+        for axis, direction in ((0, UP), (1, RIGHT)):
+            for side, sign in ((0, -1), (1, 1)):
+                distance = values["side_lobe_distances"][axis, side, 0]
+                if np.isfinite(distance):
+                    side_lobes.add(Dot(peak_point + sign * distance * direction, radius=0.035,
+                                       color=self.overlay_color, fill_opacity=0.8))
+
+        labels = VGroup()
+        if self.show_labels:
+            lines = [f"FWHM {fwhm_x:.2f} x {fwhm_y:.2f}", f"PBR {values['peak_to_background']:.1f}"]
+            ratios = values["side_lobe_ratios"][:, :, 0]
+            if np.isfinite(ratios).any():
+                lines.append(f"SLR {10 * np.log10(np.nanmax(ratios)):.1f} dB")
+            labels.add(*[Text(line, font_size=self.font_size, color=self.overlay_color) for line in lines])
+            labels.arrange(DOWN, aligned_edge=LEFT, buff=0.08)
+            labels.next_to(peak_point, UP + RIGHT, buff=0.2)
+
+        for group, parts in ((self.contour, contour), (self.peak_dot, peak_dot), (self.fwhm_bars, bars),
+                             (self.side_lobe_dots, side_lobes), (self.labels, labels)):
+            group.remove(*group.submobjects)
+            group.add(*parts.submobjects)
+        return self
+
+    def animation(self, lag_ratio=0.3, **kwargs):
+        parts = [Create(self.contour), GrowFromCenter(self.peak_dot), Create(self.fwhm_bars),
+                 FadeIn(self.side_lobe_dots)]
+        if self.show_labels:
+            parts.append(FadeIn(self.labels))
+        return LaggedStart(*parts, lag_ratio=lag_ratio, **kwargs)
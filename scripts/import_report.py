@@ -0,0 +1,84 @@
+"""Report what a scene file spends on imports before ``construct`` runs.
+
+Usage::
+
+    python scripts/import_report.py scripts/rx_beamforming_phasors.py [--lazy] [--top 15]
+
+The scene file is loaded (not rendered) in a fresh interpreter under
+``python -X importtime``; the per-module times are then summed per top-level
+package.  ``--lazy`` installs ``lazy_imports`` first, as ``render.py
+--lazy-imports`` does, so running both shows what the deferral saves::
+
+    package                     self ms   modules
+    manim                        812.4       402
+    matplotlib                   301.7       118
+    ...
+    total                       1630.2  (interpreter start-up and scene load: 1.92 s wall)
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+_LOAD_SCENE = """
+import runpy, sys
+sys.path[:0] = [{scripts!r}, {scene_dir!r}]
+if {lazy!r}:
+    import lazy_imports
+    lazy_imports.install()
+runpy.run_path({scene!r}, run_name="__scene__")
+"""
+
+
+def import_times(scene_file, lazy=False):
+    """[(module, self µs, cumulative µs)] of loading ``scene_file``, and the wall-clock seconds it took."""
+    code = _LOAD_SCENE.format(
+        scripts=SCRIPTS_DIR, scene_dir=os.path.dirname(os.path.abspath(scene_file)),
+        scene=os.path.abspath(scene_file), lazy=lazy,
+    )
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True)
+    wall = time.perf_counter() - start
+    if result.returncode:
+        sys.exit(f"Loading {scene_file} failed:\n{result.stderr[-2000:]}")
+    rows = []
+    for line in result.stderr.splitlines():
+        # "import time:       self [us] |  cumulative | imported package"
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|")
+        rows.append((module.strip(), int(self_us), int(cumulative_us)))
+    return rows, wall
+
+
+def by_package(rows):
+    totals = defaultdict(lambda: [0, 0])
+    for module, self_us, _ in rows:
+        package = totals[module.split(".")[0]]
+        package[0] += self_us
+        package[1] += 1
+    return sorted(totals.items(), key=lambda item: -item[1][0])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import-time report of a scene file.")
+    parser.add_argument("scene_file")
+    parser.add_argument("--lazy", action="store_true", help="install lazy_imports before loading the scene")
+    parser.add_argument("--top", type=int, default=15, help="packages to list (default 15)")
+    args = parser.parse_args()
+
+    rows, wall = import_times(args.scene_file, args.lazy)
+    packages = by_package(rows)
+    print(f"{'package':<24} {'self ms':>10} {'modules':>9}")
+    for package, (self_us, count) in packages[:args.top]:
+        print(f"{package:<24} {self_us / 1e3:>10.1f} {count:>9}")
+    total = sum(self_us for _, self_us, _ in rows)
+    print(f"{'total':<24} {total / 1e3:>10.1f}  (interpreter start-up and scene load: {wall:.2f} s wall)")
+
+
+if __name__ == "__main__":
+    main()
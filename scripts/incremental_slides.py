@@ -0,0 +1,191 @@
+"""Incremental per-slide re-rendering for manim-slides scenes.
+
+manim names each partial movie after a hash of the play call *and every
+mobject currently on screen*, so editing one slide changes the hashes, and
+forces re-encoding, of animations in slides that did not change.  With this
+mixin every play is instead named after its slide segment: the source lines
+between the surrounding ``next_slide()`` calls, the scene state when the
+segment starts, and the play's own animations.  Unchanged segments map to the
+same partial movies (and the same concatenated slide files), so only edited
+slides, and slides whose entry state they change, are rendered again::
+
+    from incremental_slides import IncrementalSlide
+
+    class Formulas(IncrementalSlide, Slide):
+        ...
+
+Python values that an edited slide hands to later slides without putting them
+on screen are only seen through the later plays' animations; set
+``incremental_slides = False`` on the class (or ``MANIM_INCREMENTAL_SLIDES=0``)
+to go back to manim's hashing.
+
+Every full render also writes a checkpoint manifest,
+``<media_dir>/slide_checkpoints/<Scene>.json``, with the fingerprint of the
+scene state at each slide boundary.  ``parallel_slides.py`` uses it to render
+segments in separate processes: a worker started with
+``MANIM_SLIDE_SEGMENTS=2,5`` fast-forwards through the other segments without
+rasterizing or encoding them, checks that it reached each assigned segment in
+the checkpointed state, and only renders those segments' partial movies.
+"""
+import ast
+import hashlib
+import inspect
+import json
+import os
+import textwrap
+
+from manim import config, logger
+from manim.utils import hashing
+from manim.utils.exceptions import EndSceneEarlyException
+
+_manim_play_hash = hashing.get_hash_from_play_call
+
+
+def get_hash_from_play_call(scene_object, camera_object, animations_list, current_mobjects_list):
+    """Segment-keyed play hash for IncrementalSlide scenes, manim's hash otherwise."""
+    segment_play_key = getattr(scene_object, "segment_play_key", None)
+    if segment_play_key is not None:
+        key = segment_play_key(camera_object, animations_list)
+        if key is not None:
+            return key
+    return _manim_play_hash(scene_object, camera_object, animations_list, current_mobjects_list)
+
+
+def _install():
+    from manim.renderer import cairo_renderer
+
+    hashing.get_hash_from_play_call = get_hash_from_play_call
+    if hasattr(cairo_renderer, "get_hash_from_play_call"):
+        cairo_renderer.get_hash_from_play_call = get_hash_from_play_call
+
+
+_install()
+
+
+class IncrementalSlide:
+    """Mixin for ``Slide``/``ThreeDSlide`` subclasses; list it before the slide base class."""
+
+    incremental_slides = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._segment_index = 0
+        self._segment_start_line = None
+        self._segment_key = None
+        self._segment_play = 0
+        self._next_slide_lines = None
+        self._segment_keys = {}
+        self._segment_plays = {}
+        self._worker_segments = None
+        if os.environ.get("MANIM_SLIDE_SEGMENTS"):
+            self._worker_segments = {int(index) for index in os.environ["MANIM_SLIDE_SEGMENTS"].split(",")}
+        # Keep the partial movies of a whole deck around between renders
+        if config.max_files_cached != -1:
+            config.max_files_cached = max(config.max_files_cached, 1000)
+
+    def _incremental_enabled(self):
+        return self.incremental_slides and os.environ.get("MANIM_INCREMENTAL_SLIDES", "1") != "0"
+
+    # --- Segment fingerprint ---
+    def _construct_source(self):
+        lines, first_line = inspect.getsourcelines(type(self).construct)
+        if self._next_slide_lines is None:
+            tree = ast.parse(textwrap.dedent("".join(lines)))
+            self._next_slide_lines = sorted(
+                first_line + node.lineno - 1
+                for node in ast.walk(tree)
+                if isinstance(node, ast.Call)
+                and isinstance(node.func, ast.Attribute)
+                and node.func.attr == "next_slide"
+            )
+        return lines, first_line
+
+    def _segment_source(self):
+        """Source lines from the ``next_slide()`` that opened this segment to the next one."""
+        lines, first_line = self._construct_source()
+        start = self._segment_start_line or first_line
+        end = next((line for line in self._next_slide_lines if line > start), first_line + len(lines) - 1)
+        return "".join(lines[start - first_line:end - first_line + 1])
+
+    def _fingerprint_segment(self, camera_object):
+        entry_state = _manim_play_hash(self, camera_object, [], self.mobjects)
+        source = textwrap.dedent(self._segment_source())
+        digest = hashlib.sha256(f"{type(self).__name__}\n{source}\n{entry_state}".encode())
+        return digest.hexdigest()[:16]
+
+    def segment_play_key(self, camera_object, animations_list):
+        """Partial-movie name for the current play, or None to use manim's hash."""
+        if not self._incremental_enabled():
+            return None
+        if self._segment_key is None:
+            self._segment_key = self._fingerprint_segment(camera_object)
+            self._check_entry_state()
+            self._segment_keys[self._segment_index] = self._segment_key
+        animations = _manim_play_hash(self, camera_object, animations_list, [])
+        play_digest = hashlib.sha256(f"{self._segment_key}_{self._segment_play}_{animations}".encode())
+        return f"slide{self._segment_index:03d}_{self._segment_key}_{play_digest.hexdigest()[:16]}"
+
+    # --- Checkpoints ---
+    def _checkpoint_path(self):
+        return config.get_dir("media_dir") / "slide_checkpoints" / f"{type(self).__name__}.json"
+
+    def _write_checkpoints(self):
+        path = self._checkpoint_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        segments = [
+            {"index": index, "key": self._segment_keys.get(index), "plays": plays}
+            for index, plays in sorted(self._segment_plays.items())
+        ]
+        path.write_text(json.dumps({"scene": type(self).__name__, "segments": segments}, indent=2))
+
+    def _check_entry_state(self):
+        """In a worker, warn when fast-forwarding did not reproduce the checkpointed state."""
+        if self._worker_segments is None or not self._checkpoint_path().exists():
+            return
+        segments = json.loads(self._checkpoint_path().read_text())["segments"]
+        expected = {segment["index"]: segment["key"] for segment in segments}.get(self._segment_index)
+        if expected is not None and expected != self._segment_key:
+            logger.warning(
+                f"Slide segment {self._segment_index} of {type(self).__name__} does not match its "
+                "checkpoint (the scene changed, or an updater depends on per-frame time steps); "
+                "it is rendered here and picked up or re-rendered by the final pass."
+            )
+
+    def render(self, *args, **kwargs):
+        if self._worker_segments is None:
+            result = super().render(*args, **kwargs)
+            self._write_checkpoints()
+            return result
+        # Worker: only produce the partial movies of the assigned segments,
+        # combining them into slides is left to the final serial pass
+        self.setup()
+        try:
+            self.construct()
+        except EndSceneEarlyException:
+            pass
+        self.tear_down()
+
+    # --- Segment bookkeeping ---
+    def play(self, *args, **kwargs):
+        renderer = self.renderer
+        original_skipping = renderer._original_skipping_status
+        if self._worker_segments is not None and self._segment_index not in self._worker_segments:
+            renderer._original_skipping_status = True
+        try:
+            return super().play(*args, **kwargs)
+        finally:
+            renderer._original_skipping_status = original_skipping
+            self._segment_play += 1
+            self._segment_plays[self._segment_index] = self._segment_play
+
+    def next_slide(self, *args, **kwargs):
+        result = super().next_slide(*args, **kwargs)
+        construct_code = type(self).construct.__code__
+        frame = inspect.currentframe().f_back
+        while frame is not None and frame.f_code is not construct_code:
+            frame = frame.f_back
+        self._segment_start_line = frame.f_lineno if frame is not None else None
+        self._segment_index += 1
+        self._segment_key = None
+        self._segment_play = 0
+        return result
@@ -0,0 +1,176 @@
+"""Isosurfaces of 3D fields as manim meshes.
+
+The field is sampled once over a 3D grid with broadcast NumPy; meshes at any
+level are then extracted from that cached volume, so animating the iso-level
+only re-runs the (vectorized) extraction::
+
+    mesher = VolumeMesher.from_function(field, bounds=((-1.5, 1.5),) * 3, shape=(48, 48, 48))
+    surface = IsoSurface(mesher, level=0.5 * mesher.maximum, color=YELLOW)
+    level = ValueTracker(surface.level)
+    surface.add_updater(lambda m: m.set_level(level.get_value()))
+    self.play(level.animate.set_value(0.3 * mesher.maximum))
+
+``field(x, y, z)`` gets broadcastable (nx, 1, 1), (1, ny, 1) and (1, 1, nz)
+coordinate arrays.  Extraction uses marching tetrahedra (every grid cell is
+split into six tetrahedra around its main diagonal), which needs no
+ambiguity tables and vectorizes over all cells that straddle the level.
+The meshes of the last ``MESH_CACHE_SIZE`` levels are kept in memory, so a
+level that is set again (by several updaters in one frame, or a sweep that
+holds still) is not extracted twice.  They are not written to disk: an
+animated sweep gives a new level every frame (about 10 ms to extract on a
+48^3 grid), which another render at a different frame rate would not hit.
+``matrix`` and ``offset`` place the mesh in the scene, so it can
+follow a rotated and shifted box without losing that placement when the level
+changes.
+"""
+from collections import OrderedDict
+
+import numpy as np
+from manim import ThreeDVMobject, VGroup
+
+# Cube corner c sits at offset (c & 1, c >> 1 & 1, c >> 2 & 1); six tetrahedra share the 0-7 diagonal
+CORNER_OFFSETS = np.array([[c & 1, c >> 1 & 1, c >> 2 & 1] for c in range(8)])
+TETRAHEDRA = ((0, 7, 1, 3), (0, 7, 3, 2), (0, 7, 2, 6), (0, 7, 6, 4), (0, 7, 4, 5), (0, 7, 5, 1))
+# Inside-vertex pairs of the two-inside cases; the other two cases of each split give the same quad
+_PAIRS = ((0, 1), (0, 2), (0, 3), (1, 2), (1, 3), (2, 3))
+# Isosurface meshes kept in memory per mesher; the least recently used level is dropped first
+MESH_CACHE_SIZE = 2
+
+
+def sample_volume(function, bounds, shape, dtype=np.float32):
+    """``function`` over the grid spanned by ``bounds`` ((x0, x1), (y0, y1), (z0, z1)) with ``shape`` samples."""
+    axes = [np.linspace(low, high, count, dtype=dtype) for (low, high), count in zip(bounds, shape)]
+    x, y, z = axes[0][:, None, None], axes[1][None, :, None], axes[2][None, None, :]
+    return np.broadcast_to(function(x, y, z), tuple(shape)).astype(dtype)
+
+
+def _interpolate(values, positions, level, inside, outside):
+    """Points where the level crosses the edges ``inside``-``outside`` (vertex indices) of every tetrahedron."""
+    start, end = values[:, inside], values[:, outside]
+    t = ((level - start) / (end - start))[:, None]
+    return positions[:, inside] + t * (positions[:, outside] - positions[:, inside])
+
+
+def marching_tetrahedra(values, positions, level):
+    """(T, 3, 3) triangles of the ``level`` surface through tetrahedra with corner ``values`` (N, 4)
+    at ``positions`` (N, 4, 3), oriented towards decreasing values."""
+    inside = values >= level
+    case = (inside * (1 << np.arange(4))).sum(axis=1)
+    triangles = []
+    for lone in range(4):
+        # One vertex on its own side of the surface: one triangle around it
+        mask = (case == 1 << lone) | (case == 15 ^ 1 << lone)
+        if mask.any():
+            others = [vertex for vertex in range(4) if vertex != lone]
+            points = [_interpolate(values[mask], positions[mask], level, lone, other) for other in others]
+            triangles.append(np.stack(points, axis=1))
+    for first, second in _PAIRS:
+        # Two vertices on each side: a quad, split into two triangles
+        mask = case == (1 << first | 1 << second)
+        if mask.any():
+            third, fourth = [vertex for vertex in range(4) if vertex not in (first, second)]
+            tetra_values, tetra_positions = values[mask], positions[mask]
+            a = _interpolate(tetra_values, tetra_positions, level, first, third)
+            b = _interpolate(tetra_values, tetra_positions, level, first, fourth)
+            c = _interpolate(tetra_values, tetra_positions, level, second, fourth)
+            d = _interpolate(tetra_values, tetra_positions, level, second, third)
+            triangles.append(np.concatenate([np.stack([a, b, c], axis=1), np.stack([a, c, d], axis=1)]))
+    if not triangles:
+        return np.empty((0, 3, 3), dtype=positions.dtype)
+    return np.concatenate(triangles)
+
+
+def _orient(triangles, gradient_at):
+    """Flip triangles whose normal points up the field gradient."""
+    normals = np.cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0])
+    flip = (normals * gradient_at(triangles.mean(axis=1))).sum(axis=1) > 0
+    triangles[flip] = triangles[flip][:, ::-1]
+    return triangles
+
+
+class VolumeMesher:
+    def __init__(self, volume, bounds):
+        self.volume = np.ascontiguousarray(volume)
+        self.bounds = tuple(tuple(float(value) for value in axis) for axis in bounds)
+        self.shape = self.volume.shape
+        self.origin = np.array([low for low, _ in self.bounds])
+        self.spacing = np.array([(high - low) / (count - 1) for (low, high), count in zip(self.bounds, self.shape)])
+        self.maximum = float(self.volume.max())
+        self.gradient = np.stack(np.gradient(self.volume, *self.spacing), axis=-1)
+
+        # Corner values of every cell, (cells, 8), and the value range per cell to skip inactive ones
+        nx, ny, nz = self.shape
+        self.corner_values = np.stack([
+            self.volume[dx:nx - 1 + dx, dy:ny - 1 + dy, dz:nz - 1 + dz].ravel() for dx, dy, dz in CORNER_OFFSETS
+        ], axis=1)
+        self.cell_min = self.corner_values.min(axis=1)
+        self.cell_max = self.corner_values.max(axis=1)
+        self._meshes = OrderedDict()
+
+    @classmethod
+    def from_function(cls, function, bounds, shape):
+        return cls(sample_volume(function, bounds, shape), bounds)
+
+    def gradient_at(self, points):
+        index = np.rint((points - self.origin) / self.spacing).astype(int)
+        index = np.clip(index, 0, np.array(self.shape) - 1)
+        return self.gradient[index[:, 0], index[:, 1], index[:, 2]]
+
+    def extract(self, level):
+        """(T, 3, 3) triangles of the ``level`` isosurface in field coordinates."""
+        active = np.flatnonzero((self.cell_min < level) & (self.cell_max >= level))
+        cells = np.stack(np.unravel_index(active, tuple(count - 1 for count in self.shape)), axis=1)
+        values = self.corner_values[active]
+        positions = self.origin + (cells[:, None, :] + CORNER_OFFSETS[None]) * self.spacing
+        triangles = [
+            marching_tetrahedra(values[:, tetrahedron], positions[:, tetrahedron], level)
+            for tetrahedron in TETRAHEDRA
+        ]
+        return _orient(np.concatenate(triangles), self.gradient_at)
+
+    def triangles(self, level):
+        """``extract(level)`` as float32, cached for the last ``MESH_CACHE_SIZE`` levels."""
+        level = float(level)
+        if level in self._meshes:
+            self._meshes.move_to_end(level)
+        else:
+            self._meshes[level] = self.extract(level).astype(np.float32)
+            while len(self._meshes) > MESH_CACHE_SIZE:
+                self._meshes.popitem(last=False)
+        return self._meshes[level]
+
+
+class IsoSurface(VGroup):
+    def __init__(self, mesher, level, matrix=None, offset=(0, 0, 0), color="#FFFF00", opacity=0.8,
+                 stroke_width=0.5, **kwargs):
+        super().__init__(**kwargs)
+        self.mesher = mesher
+        self.matrix = np.eye(3) if matrix is None else np.asarray(matrix, dtype=float)
+        self.offset = np.asarray(offset, dtype=float)
+        self.surface_color = color
+        self.surface_opacity = opacity
+        self.surface_stroke_width = stroke_width
+        self.faces = []
+        self.level = None
+        self.set_level(level)
+
+    def _new_face(self):
+        return ThreeDVMobject(
+            fill_color=self.surface_color, fill_opacity=self.surface_opacity,
+            stroke_color=self.surface_color, stroke_width=self.surface_stroke_width,
+        )
+
+    def set_level(self, level):
+        """Show the isosurface at ``level``, reusing face mobjects from the previous level."""
+        if level == self.level:
+            return self
+        self.level = level
+        triangles = self.mesher.triangles(level)
+        placed = triangles.reshape(-1, 3) @ self.matrix.T + self.offset
+        placed = placed.reshape(-1, 3, 3)
+        while len(self.faces) < len(placed):
+            self.faces.append(self._new_face())
+        for face, triangle in zip(self.faces, placed):
+            face.set_points_as_corners([*triangle, triangle[0]])
+        self.submobjects = list(self.faces[:len(placed)])
+        return self
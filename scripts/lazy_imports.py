@@ -0,0 +1,89 @@
+"""Deferred imports of heavy modules, to cut the start-up time of render workers.
+
+Scene modules import what they only need in some steps lazily::
+
+    from lazy_imports import lazy_module
+
+    plt = lazy_module("matplotlib.pyplot")    # loaded on the first plt.<attribute>
+
+``install()`` goes further and makes every later ``import`` of the modules in
+``DEFERRED`` lazy, including the imports manim and manim_slides do
+themselves.  The render wrapper enables it with::
+
+    python scripts/render.py --lazy-imports scripts/tx_beamforming_arcs.py TxBeamformingArcs -ql
+
+A lazy module is created empty and executed on its first attribute access,
+so ``import scipy`` costs nothing until ``scipy.<something>`` is used.
+``from module import name`` needs the attribute right away and loads the
+module as before; that only costs the deferral, never correctness.  Import
+errors of a missing module are still raised at the import statement, errors
+inside a module's own code move to its first use.
+
+``import_report.py`` shows which packages dominate start-up, with and
+without this.
+"""
+import importlib
+import importlib.abc
+import importlib.util
+import sys
+
+# Heavy modules that manim, manim_slides or the scenes import but few scenes use
+DEFERRED = (
+    "matplotlib.pyplot",
+    "scipy",
+    "moderngl",
+    "moderngl_window",
+    "manim.renderer.opengl_renderer",
+    "manim.renderer.opengl_renderer_window",
+    "qtpy",
+    "PySide6",
+    "IPython",
+)
+
+
+def _lazy_spec(name, path=None):
+    """Spec of ``name`` from the other finders, with its loader wrapped in a ``LazyLoader``."""
+    spec = None
+    for finder in sys.meta_path:
+        if isinstance(finder, _DeferringFinder) or not hasattr(finder, "find_spec"):
+            continue
+        spec = finder.find_spec(name, path)
+        if spec is not None:
+            break
+    if spec is not None and spec.loader is not None and hasattr(spec.loader, "exec_module"):
+        spec.loader = importlib.util.LazyLoader(spec.loader)
+    return spec
+
+
+def lazy_module(name):
+    """``name``, imported on first attribute access (the real module if it is already loaded)."""
+    if name in sys.modules:
+        return sys.modules[name]
+    parent, _, child = name.rpartition(".")
+    path = importlib.import_module(parent).__path__ if parent else None
+    spec = _lazy_spec(name, path)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    if parent:
+        setattr(sys.modules[parent], child, module)
+    return module
+
+
+class _DeferringFinder(importlib.abc.MetaPathFinder):
+    def __init__(self, names):
+        self.names = frozenset(names)
+
+    def find_spec(self, name, path=None, target=None):
+        if name not in self.names:
+            return None
+        return _lazy_spec(name, path)
+
+
+def install(names=DEFERRED):
+    """Make every later import of ``names`` lazy, for the rest of this process."""
+    if any(isinstance(finder, _DeferringFinder) for finder in sys.meta_path):
+        return
+    sys.meta_path.insert(0, _DeferringFinder(names))
@@ -0,0 +1,70 @@
+"""Small helpers shared by the render instrumentation tools in this folder.
+
+The tools hook into manim by wrapping a handful of methods before the scene
+module is loaded, then hand the remaining command line to manim itself, so the
+scenes do not need to know they are being measured.
+"""
+import functools
+import sys
+
+_scene_start_callbacks = []
+_scene_end_callbacks = []
+
+
+def patch_method(owner, name, make_wrapper):
+    """Replace ``owner.name`` with ``make_wrapper(original)`` and return the original."""
+    original = getattr(owner, name)
+    wrapper = make_wrapper(original)
+    functools.update_wrapper(wrapper, original)
+    setattr(owner, name, wrapper)
+    return original
+
+
+def _install_scene_render_hook():
+    from manim import Scene
+
+    if getattr(Scene.render, "_has_scene_hooks", False):
+        return
+
+    def make_wrapper(original):
+        def render(self, *args, **kwargs):
+            for callback in _scene_start_callbacks:
+                callback(self)
+            try:
+                return original(self, *args, **kwargs)
+            finally:
+                for callback in _scene_end_callbacks:
+                    callback(self)
+        return render
+
+    patch_method(Scene, "render", make_wrapper)
+    Scene.render._has_scene_hooks = True
+
+
+def on_scene_start(callback):
+    """Call ``callback(scene)`` right before every ``Scene.render``."""
+    _install_scene_render_hook()
+    _scene_start_callbacks.append(callback)
+
+
+def on_scene_end(callback):
+    """Call ``callback(scene)`` once every ``Scene.render`` has returned (or failed)."""
+    _install_scene_render_hook()
+    _scene_end_callbacks.append(callback)
+
+
+def output_path(category, filename):
+    """Path under ``<media_dir>/<category>/`` for a tool's report, creating the folder."""
+    from manim import config
+
+    path = config.get_dir("media_dir") / category / filename
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def run_manim(argv):
+    """Run manim's command line in this process with ``argv`` as its arguments."""
+    from manim.__main__ import main
+
+    sys.argv = ["manim", *argv]
+    main()
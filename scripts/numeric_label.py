@@ -0,0 +1,93 @@
+from manim import *
+
+
+class NumericLabel(VGroup):
+    """Live numeric readout built from glyphs that are typeset only once.
+
+    Behaves like ``DecimalNumber`` for readouts driven by an updater, but the ten
+    digits, the sign, the decimal point and the unit are prepared in ``__init__``.
+    ``set_value`` only copies those glyph paths and shifts them into place, so a
+    readout that changes every frame never goes back through LaTeX or SVG parsing.
+    """
+
+    GLYPHS = "0123456789+-."
+
+    def __init__(
+        self,
+        number=0,
+        num_decimal_places=2,
+        include_sign=False,
+        unit=None,
+        font_size=DEFAULT_FONT_SIZE,
+        digit_buff_per_font_unit=0.001,
+        color=WHITE,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.number = number
+        self.num_decimal_places = num_decimal_places
+        self.include_sign = include_sign
+        self.glyph_buff = digit_buff_per_font_unit * font_size
+
+        # Typeset every glyph in a single MathTex so they share one baseline
+        # (the minus sign sits on the math axis, the point on the baseline).
+        glyph_tex = MathTex(*self.GLYPHS, font_size=font_size, color=color)
+        baseline = glyph_tex[0].get_bottom()[1]
+        self.glyphs = {}
+        self.glyph_widths = {}
+        for char, glyph in zip(self.GLYPHS, glyph_tex):
+            glyph.shift(-glyph.get_left()[0] * RIGHT - baseline * UP)
+            self.glyphs[char] = glyph
+            self.glyph_widths[char] = glyph.width
+
+        self.unit = None
+        if unit is not None:
+            self.unit = MathTex(unit, font_size=font_size, color=color)
+            self.unit.shift(-self.unit.get_corner(DL))
+
+        self._set_submobjects_from_number(number)
+        self.move_to(ORIGIN)
+
+    def _get_num_string(self, number):
+        num_string = f"{number:{'+' if self.include_sign else ''}.{self.num_decimal_places}f}"
+        # Avoid "-0.00" for values that round to zero
+        if num_string.startswith("-") and round(number, self.num_decimal_places) == 0:
+            num_string = ("+" if self.include_sign else "") + num_string[1:]
+        return num_string
+
+    def _set_submobjects_from_number(self, number, glyph_scale=1.0):
+        self.number = number
+        parts = []
+        cursor = 0.0
+        for char in self._get_num_string(number):
+            parts.append(self.glyphs[char].copy().shift(cursor * RIGHT))
+            cursor += self.glyph_widths[char] + self.glyph_buff
+        if self.unit is not None:
+            parts.append(self.unit.copy().shift(cursor * RIGHT))
+        parts_group = VGroup(*parts)
+        # Height of the glyphs as typeset, to read the label's scale back later
+        self.unscaled_height = parts_group.height
+        parts_group.scale(glyph_scale, about_point=ORIGIN)
+        self.submobjects = []
+        self.add(*parts)
+
+    def set_value(self, number):
+        """Show ``number``, keeping the left edge and the current style fixed."""
+        if not self.submobjects:
+            self._set_submobjects_from_number(number)
+            return self
+        anchor = self.get_left()
+        style_reference = self.submobjects[0]
+        # Scaled directly, through .animate or by a Transform: the current height tells by how much
+        glyph_scale = self.height / self.unscaled_height
+        self._set_submobjects_from_number(number, glyph_scale)
+        for part in self.submobjects:
+            part.match_style(style_reference)
+        self.move_to(anchor, LEFT)
+        return self
+
+    def get_value(self):
+        return self.number
+
+    def increment_value(self, delta_t=1):
+        return self.set_value(self.get_value() + delta_t)
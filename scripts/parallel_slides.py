@@ -0,0 +1,85 @@
+"""Render the slide segments of an IncrementalSlide deck on several processes.
+
+    python scripts/parallel_slides.py examples_manim_slides/formulas.py Formulas -j 8 -- -ql
+
+The first render of a deck (or any render without a checkpoint manifest) runs
+serially and writes ``<media_dir>/slide_checkpoints/<Scene>.json``.  Later
+renders split the checkpointed segments over ``-j`` worker processes; each
+worker fast-forwards to its segments and renders only their partial movies.
+A final serial pass then finds every animation cached, concatenates the slide
+videos and writes the usual manim-slides manifest.
+
+``construct`` is ordinary Python and cannot be resumed half-way from a pickled
+scene, so the checkpoints hold state fingerprints rather than the state
+itself: workers replay the cheap, non-rendering part of the earlier slides and
+verify they reached the checkpointed state before rendering.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+
+def manim_command(scene_file, scene_name, manim_args):
+    return [sys.executable, "-m", "manim", "render", scene_file, scene_name, *manim_args]
+
+
+def media_dir_from_args(manim_args):
+    for index, arg in enumerate(manim_args):
+        if arg == "--media_dir" and index + 1 < len(manim_args):
+            return Path(manim_args[index + 1])
+        if arg.startswith("--media_dir="):
+            return Path(arg.split("=", 1)[1])
+    return Path("media")
+
+
+def balance(segments, jobs):
+    """Assign segments to ``jobs`` workers, heaviest first, by number of plays."""
+    buckets = [[] for _ in range(jobs)]
+    loads = [0] * jobs
+    for segment in sorted(segments, key=lambda segment: -segment["plays"]):
+        worker = loads.index(min(loads))
+        buckets[worker].append(segment["index"])
+        loads[worker] += segment["plays"]
+    return [sorted(bucket) for bucket in buckets if bucket]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render slide segments in parallel from checkpoints.")
+    parser.add_argument("scene_file")
+    parser.add_argument("scene_name")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="worker processes")
+    argv = sys.argv[1:]
+    manim_args = []
+    if "--" in argv:
+        split = argv.index("--")
+        argv, manim_args = argv[:split], argv[split + 1:]
+    args = parser.parse_args(argv)
+
+    checkpoint_path = media_dir_from_args(manim_args) / "slide_checkpoints" / f"{args.scene_name}.json"
+    serial_render = manim_command(args.scene_file, args.scene_name, manim_args)
+    if not checkpoint_path.exists():
+        print(f"No checkpoints at {checkpoint_path} yet, rendering serially to create them")
+        sys.exit(subprocess.run(serial_render).returncode)
+
+    segments = json.loads(checkpoint_path.read_text())["segments"]
+    assignments = balance(segments, max(1, args.jobs))
+    print(f"Rendering {len(segments)} segments of {args.scene_name} on {len(assignments)} workers")
+    workers = []
+    for assigned in assignments:
+        env = dict(os.environ, MANIM_SLIDE_SEGMENTS=",".join(map(str, assigned)))
+        command = manim_command(args.scene_file, args.scene_name, [*manim_args, "--progress_bar", "none"])
+        workers.append((assigned, subprocess.Popen(command, env=env)))
+    failed = [assigned for assigned, process in workers if process.wait() != 0]
+    if failed:
+        print(f"Workers for segments {failed} failed")
+        sys.exit(1)
+
+    # Every partial movie now exists; this pass only concatenates slides and writes the manifest
+    sys.exit(subprocess.run(serial_render).returncode)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Many phasors as one array-backed mobject.
+
+A ``Vector`` per phasor plus a ``Rotate`` per phasor does not scale to
+channels with hundreds of MPCs.  ``PhasorArray`` keeps lengths, angles and
+origins in arrays and draws all phasors of one colour as a single
+``VMobject`` with one sub-path per arrow, so the mobject count depends on the
+number of colours, not phasors.  ``RotatePhasors`` turns every phasor by its
+own angle in one vectorized animation::
+
+    colors = colormap_colors("twilight", aoa / TAU)       # per-element colours, quantized
+    phasors = PhasorArray(1.0, phases, origins=rx_position, colors=colors)
+    self.play(RotatePhasors(phasors, rotation_angles), run_time=5)
+
+With ``tips=False`` the phasors are plain lines, e.g. dial indicators.  The
+points are regenerated from the arrays on every change, so position phasors
+through ``origins`` rather than by moving the mobject.
+"""
+import numpy as np
+from manim import ORIGIN, Animation, VGroup, VMobject, color_to_rgb, rgb_to_hex
+
+from lazy_imports import lazy_module
+
+matplotlib = lazy_module("matplotlib")
+
+# Fractions along a straight segment of its cubic Bezier control points
+_LINE_CONTROLS = np.array([0, 1 / 3, 2 / 3, 1])[None, :, None]
+
+
+def colormap_colors(colormap, values, buckets=16):
+    """Hex colours of ``colormap`` at ``values`` in [0, 1], quantized to ``buckets`` levels."""
+    levels = np.round(np.clip(np.asarray(values, dtype=float), 0, 1) * (buckets - 1)) / (buckets - 1)
+    return [rgb_to_hex(rgba[:3]) for rgba in matplotlib.colormaps[colormap](levels)]
+
+
+def _line_curves(starts, ends):
+    """(n, 4, 3) Bezier control points of the straight segments ``starts[i]`` to ``ends[i]``."""
+    return starts[:, None, :] + _LINE_CONTROLS * (ends - starts)[:, None, :]
+
+
+class PhasorArray(VGroup):
+    def __init__(self, lengths, angles, origins=ORIGIN, colors="#FFFFFF", stroke_width=4,
+                 tip_length=0.35, max_tip_length_to_length_ratio=0.25, tips=True, **kwargs):
+        super().__init__(**kwargs)
+        self.angles = np.array(angles, dtype=float)
+        count = len(self.angles)
+        self.lengths = np.broadcast_to(np.asarray(lengths, dtype=float), (count,)).copy()
+        self.origins = np.broadcast_to(np.asarray(origins, dtype=float), (count, 3)).copy()
+        self.tip_length = tip_length
+        self.max_tip_length_to_length_ratio = max_tip_length_to_length_ratio
+        self.tips = tips
+
+        # One shaft (and tip) VMobject per distinct colour
+        if not isinstance(colors, (list, tuple, np.ndarray)):
+            colors = [colors] * count
+        keys = [rgb_to_hex(color_to_rgb(color)) for color in colors]
+        self.buckets = []
+        for key in dict.fromkeys(keys):
+            members = np.array([index for index, other in enumerate(keys) if other == key])
+            shafts = VMobject(stroke_color=key, stroke_width=stroke_width, fill_opacity=0)
+            heads = VMobject(stroke_color=key, stroke_width=1, fill_color=key, fill_opacity=1) if tips else None
+            self.buckets.append((members, shafts, heads))
+            self.add(shafts, *([heads] if tips else []))
+        self.update_points()
+
+    def directions(self):
+        return np.stack([np.cos(self.angles), np.sin(self.angles), np.zeros_like(self.angles)], axis=1)
+
+    def update_points(self):
+        directions = self.directions()
+        ends = self.origins + self.lengths[:, None] * directions
+        if self.tips:
+            tip_lengths = np.minimum(self.tip_length, self.max_tip_length_to_length_ratio * self.lengths)[:, None]
+            bases = ends - tip_lengths * directions
+            # Perpendicular in the plane, tips are as wide as they are long
+            normals = np.stack([-directions[:, 1], directions[:, 0], directions[:, 2]], axis=1) * tip_lengths / 2
+            left, right = bases + normals, bases - normals
+            shafts = _line_curves(self.origins, bases)
+            heads = np.concatenate(
+                [_line_curves(ends, left), _line_curves(left, right), _line_curves(right, ends)], axis=1
+            )
+        else:
+            shafts = _line_curves(self.origins, ends)
+        for members, shaft_mobject, head_mobject in self.buckets:
+            shaft_mobject.set_points(shafts[members].reshape(-1, 3))
+            if head_mobject is not None:
+                head_mobject.set_points(heads[members].reshape(-1, 3))
+        return self
+
+    def set_angles(self, angles):
+        self.angles[:] = angles
+        return self.update_points()
+
+    def set_lengths(self, lengths):
+        self.lengths[:] = lengths
+        return self.update_points()
+
+    def total(self):
+        """Tip of the phasor sum, relative to the origins."""
+        return (self.lengths[:, None] * self.directions()).sum(axis=0)
+
+
+class RotatePhasors(Animation):
+    """Rotate every phasor of a ``PhasorArray`` by its own angle (or all by one angle)."""
+
+    def __init__(self, phasors, angles, **kwargs):
+        self.rotations = np.broadcast_to(np.asarray(angles, dtype=float), phasors.angles.shape).copy()
+        super().__init__(phasors, **kwargs)
+
+    def begin(self):
+        self.start_angles = self.mobject.angles.copy()
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        self.mobject.set_angles(self.start_angles + self.rate_func(alpha) * self.rotations)
@@ -0,0 +1,188 @@
+"""Opt-in memory profiling of a render, one measurement per ``play``/``wait``.
+
+Enable it through the render wrapper::
+
+    python scripts/render.py --memory scripts/tx_beamforming_arcs.py TxBeamformingArcs -ql
+
+After every ``play``/``wait`` a tracemalloc snapshot is compared with the one
+taken after the previous call, and the live mobjects are counted by class.
+When the scene ends a table of traced memory, RSS and mobject counts per call
+is printed, followed by the allocation sites and mobject classes that grew
+the most over the whole scene, which is where leaks and bloat show up.  The
+rows go to ``<media_dir>/profiles/<Scene>_memory.csv`` and the top sites per
+call to ``<Scene>_memory.json``.
+
+Snapshots and the ``gc`` walk make every call noticeably slower; do not
+combine ``--memory`` with ``--profile`` when the timings matter.
+"""
+import csv
+import gc
+import json
+import os
+import tracemalloc
+from collections import Counter
+
+import manim_hooks
+from render_trace import play_label, tracer
+
+TRACEBACK_FRAMES = 8
+TOP_SITES = 10
+_FILTERS = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+]
+
+
+def resident_memory():
+    """Current RSS in bytes, or None where /proc is not available."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return None
+
+
+def live_mobjects():
+    from manim import Mobject
+
+    return Counter(type(obj).__name__ for obj in gc.get_objects() if isinstance(obj, Mobject))
+
+
+def current_step():
+    """Innermost scene step (``render_trace`` span) that is not a play or wait span."""
+    return next((name for name in reversed(tracer.open_spans) if not name.startswith(("play:", "wait("))), "")
+
+
+def _site(stat):
+    frame = stat.traceback[0]
+    return f"{os.path.basename(frame.filename)}:{frame.lineno}"
+
+
+class MemoryProfiler:
+    def __init__(self):
+        self.reset(None)
+
+    def reset(self, scene_name):
+        self.scene_name = scene_name
+        self.rows = []
+        self.sites = []
+        self.depth = 0
+        self.first_snapshot = None
+        self.previous_snapshot = None
+        self.first_counts = Counter()
+        self.previous_counts = Counter()
+
+    def snapshot(self):
+        gc.collect()
+        return tracemalloc.take_snapshot().filter_traces(_FILTERS)
+
+    def start(self, scene):
+        self.reset(type(scene).__name__)
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(TRACEBACK_FRAMES)
+        self.first_snapshot = self.previous_snapshot = self.snapshot()
+        self.first_counts = self.previous_counts = live_mobjects()
+
+    def measure(self, label):
+        snapshot = self.snapshot()
+        counts = live_mobjects()
+        growth = snapshot.compare_to(self.previous_snapshot, "lineno")
+        traced, peak = tracemalloc.get_traced_memory()
+        changed = Counter(counts)
+        changed.subtract(self.previous_counts)
+        changed = sorted((item for item in changed.items() if item[1]), key=lambda item: -abs(item[1]))
+        self.rows.append({
+            "call": len(self.rows),
+            "step": current_step(),
+            "label": label,
+            "traced_mb": traced / 1e6,
+            "delta_mb": sum(stat.size_diff for stat in growth) / 1e6,
+            "peak_mb": peak / 1e6,
+            "rss_mb": (resident_memory() or 0) / 1e6,
+            "mobjects": sum(counts.values()),
+            "delta_mobjects": sum(counts.values()) - sum(self.previous_counts.values()),
+            "mobject_changes": " ".join(f"{name}{delta:+d}" for name, delta in changed[:5]),
+        })
+        self.sites.append([
+            {"site": _site(stat), "size_diff": stat.size_diff, "count_diff": stat.count_diff}
+            for stat in growth[:TOP_SITES] if stat.size_diff
+        ])
+        tracemalloc.reset_peak()
+        self.previous_snapshot = snapshot
+        self.previous_counts = counts
+
+    # --- Reporting ---
+    def print_summary(self):
+        print(f"\n--- Memory per play for {self.scene_name}: {len(self.rows)} calls ---")
+        print(f"{'#':>4} {'step':<28} {'call':<40} {'traced MB':>9} {'delta MB':>9} {'RSS MB':>8} "
+              f"{'mobjects':>8} {'delta':>6}")
+        for row in self.rows:
+            print(f"{row['call']:>4} {row['step'][:28]:<28} {row['label'][:40]:<40} {row['traced_mb']:>9.2f} "
+                  f"{row['delta_mb']:>+9.2f} {row['rss_mb']:>8.1f} {row['mobjects']:>8} {row['delta_mobjects']:>+6}"
+                  + (f"  {row['mobject_changes']}" if row["delta_mobjects"] else ""))
+        if self.previous_snapshot is None:
+            return
+        print("\nAllocation sites that grew the most over the scene:")
+        for stat in self.previous_snapshot.compare_to(self.first_snapshot, "traceback")[:TOP_SITES]:
+            if stat.size_diff <= 0:
+                break
+            print(f"  {stat.size_diff / 1e6:+9.2f} MB {stat.count_diff:+8d} blocks  {_site(stat)}")
+            for line in stat.traceback.format()[-4:]:
+                print(f"      {line}")
+        grown = self.previous_counts - self.first_counts
+        if grown:
+            print("Mobject classes that grew over the scene: "
+                  + ", ".join(f"{name} +{count}" for name, count in grown.most_common(10)))
+
+    def write_reports(self):
+        path = manim_hooks.output_path("profiles", f"{self.scene_name}_memory.csv")
+        fields = ["call", "step", "label", "traced_mb", "delta_mb", "peak_mb", "rss_mb",
+                  "mobjects", "delta_mobjects", "mobject_changes"]
+        with open(path, "w", newline="") as csv_file:
+            writer = csv.DictWriter(csv_file, fieldnames=fields)
+            writer.writeheader()
+            writer.writerows(self.rows)
+        sites_path = manim_hooks.output_path("profiles", f"{self.scene_name}_memory.json")
+        with open(sites_path, "w") as json_file:
+            json.dump({"scene": self.scene_name, "calls": [
+                {"call": row["call"], "label": row["label"], "top_sites": sites}
+                for row, sites in zip(self.rows, self.sites)
+            ]}, json_file, indent=2)
+        print(f"Memory per play written to {path}")
+
+
+profiler = MemoryProfiler()
+
+
+def install():
+    """Measure memory after every ``play`` and ``wait`` of every rendered scene."""
+    from manim import Scene
+
+    def measured(label_for):
+        def make_wrapper(original):
+            def wrapper(self, *args, **kwargs):
+                # wait() plays a Wait animation: only measure the outermost call
+                profiler.depth += 1
+                try:
+                    return original(self, *args, **kwargs)
+                finally:
+                    profiler.depth -= 1
+                    if profiler.depth == 0:
+                        profiler.measure(label_for(*args, **kwargs))
+            return wrapper
+        return make_wrapper
+
+    def wait_label(duration=1.0, *args, **kwargs):
+        return f"wait({duration:g})"
+
+    manim_hooks.patch_method(Scene, "play", measured(lambda *animations, **kwargs: play_label(animations)))
+    manim_hooks.patch_method(Scene, "wait", measured(wait_label))
+    manim_hooks.on_scene_start(profiler.start)
+
+    def report(scene):
+        profiler.print_summary()
+        profiler.write_reports()
+
+    manim_hooks.on_scene_end(report)
@@ -2,6 +2,8 @@ from manim import *
 import numpy as np
 import math
 
+from render_trace import span, begin_span, end_span
+
 # --- Helper Functions (remain the same) ---
 def on_segment(p, q, r):
     return (q[0] <= max(p[0], r[0]) and q[0] >= min(p[0], r[0]) and
@@ -155,11 +157,12 @@ class ReflectionAnimation(Scene):
             mobj.add(*new_reflected_waves)
 
         # --- Stage 1: Run Wave Animation ---
-        all_waves.add_updater(update_reflection_waves)
-        self.wait(stage1_duration)
-        all_waves.remove_updater(update_reflection_waves)
-        self.play(FadeOut(all_waves))
-        self.wait(0.5)
+        with span("Stage 1: Wave Animation"):
+            all_waves.add_updater(update_reflection_waves)
+            self.wait(stage1_duration)
+            all_waves.remove_updater(update_reflection_waves)
+            self.play(FadeOut(all_waves))
+            self.wait(0.5)
 
         # --- Stage 2 & 3: Show Principle ---
         principle_elements = VGroup() # Group elements to fade later
@@ -190,12 +193,15 @@ class ReflectionAnimation(Scene):
             reflected_ray_disp = Arrow(rp, rp + reflected_dir * ray_length, color=ray_color_reflected, stroke_width=3, buff=0)
 
             # --- Stage 2 Animation ---
+            begin_span("Stage 2: Rays and Normal")
             stage2_group = VGroup(rp_dot, wall_normal_line, right_angle, incident_ray_disp, reflected_ray_disp)
             principle_elements.add(stage2_group)
             self.play(Create(stage2_group), run_time=1.5)
             self.wait(stage2_duration - 1.5)
+            end_span()
 
             # --- Stage 3 Animation ---
+            begin_span("Stage 3: Angles")
             wall_seg_for_inc = wall_line_segment1
             wall_seg_for_ref_start = wall_line_segment2
 
@@ -222,12 +228,15 @@ class ReflectionAnimation(Scene):
             self.play(Create(angle_i), Create(angle_r), run_time=1)
             self.play(Write(label_i), Write(label_r), Write(equation), run_time=1)
             self.wait(stage3_duration - 2)
+            end_span()
 
             # --- Stage 4: Fade Out Principle ---
-            self.play(FadeOut(principle_elements), run_time=stage4_duration)
-            self.wait(0.5)
+            with span("Stage 4: Fade Out Principle"):
+                self.play(FadeOut(principle_elements), run_time=stage4_duration)
+                self.wait(0.5)
 
             # --- Stage 5: Show Current Densities ---
+            begin_span("Stage 5: Current Densities")
             current_densities_group = VGroup()
             # Extract unique points from the recorded events
             unique_reflection_points = [event[1] for event in reflection_events]
@@ -267,6 +276,7 @@ class ReflectionAnimation(Scene):
                 # Fade in the entire group at once
                 self.play(FadeIn(current_densities_group), run_time=stage5_duration)
                 self.wait(2) # Hold the final view
+            end_span()
 
         else:
             self.add(Text("No reflection detected.", font_size=24, color=BLACK))
@@ -0,0 +1,80 @@
+"""Render scenes with manim, optionally instrumented.
+
+Usage::
+
+    python scripts/render.py [--profile] [--trace] [--fast-hashing] [--memory] [--lazy-imports] [--draft N | --draft-fps K] <manim render arguments...>
+
+Everything this script does not recognise is passed on to manim unchanged, e.g.
+``python scripts/render.py --profile scripts/tx_beamforming_arcs.py TxBeamformingArcs -ql``.
+"""
+import argparse
+
+import manim_hooks
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Render scenes with manim, optionally instrumented.",
+        usage="%(prog)s [options] <manim render arguments...>",
+        allow_abbrev=False,
+    )
+    parser.add_argument(
+        "--profile", action="store_true",
+        help="time every updater, animation, frame render and frame write; "
+             "prints a summary table and writes a per-frame CSV",
+    )
+    parser.add_argument(
+        "--trace", action="store_true",
+        help="write a Chrome/Perfetto trace of scene steps, plays, frames and movie writes",
+    )
+    parser.add_argument(
+        "--fast-hashing", action="store_true",
+        help="name partial movies after a raw-buffer hash of the scene state instead of manim's JSON hash",
+    )
+    parser.add_argument(
+        "--memory", action="store_true",
+        help="snapshot traced memory and live mobjects after every play/wait; "
+             "prints growth per call and the top allocation sites, and writes a per-play CSV",
+    )
+    parser.add_argument(
+        "--lazy-imports", action="store_true",
+        help="defer matplotlib.pyplot, scipy, the OpenGL renderer and Qt until first use (see lazy_imports.py)",
+    )
+    draft = parser.add_mutually_exclusive_group()
+    draft.add_argument(
+        "--draft", type=int, metavar="N",
+        help="draft preview: compute only every Nth frame, keeping real-time motion and movie length",
+    )
+    draft.add_argument(
+        "--draft-fps", type=float, metavar="K",
+        help="draft preview: compute about K frames per second of scene time",
+    )
+    args, manim_args = parser.parse_known_args()
+    if (args.draft is not None and args.draft < 1) or (args.draft_fps is not None and args.draft_fps <= 0):
+        parser.error("--draft needs N >= 1 and --draft-fps a positive K")
+
+    # Before anything imports manim, the other tools' install() included
+    if args.lazy_imports:
+        import lazy_imports
+        lazy_imports.install()
+    if args.profile:
+        import frame_profiler
+        frame_profiler.install()
+    if args.trace:
+        import render_trace
+        render_trace.install()
+    if args.fast_hashing:
+        import fast_hashing
+        fast_hashing.install()
+    if args.memory:
+        import play_memory
+        play_memory.install()
+    if args.draft or args.draft_fps:
+        import draft_preview
+        draft_preview.install(every=args.draft, fps=args.draft_fps)
+
+    manim_hooks.run_manim(manim_args)
+
+
+if __name__ == "__main__":
+    main()
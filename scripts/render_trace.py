@@ -0,0 +1,162 @@
+"""Chrome/Perfetto trace export of a render, keyed to the steps of ``construct``.
+
+Scenes mark their steps with named spans::
+
+    from render_trace import span, begin_span, end_span
+
+    with span("Step 3: Transition"):
+        self.wait(transition_duration)
+
+    begin_span("Step 4: Initial Summed State")
+    ...
+    end_span()
+
+Outside a traced render these calls only keep track of the open step names
+(``scene_snapshots.py`` uses them to capture named steps).  Trace a render with::
+
+    python scripts/render.py --trace scripts/rx_beamforming_phasors.py RxBeamformingPhasors -ql
+
+Each scene is written to ``<media_dir>/traces/<Scene>.json``; open it in
+https://ui.perfetto.dev or ``chrome://tracing``.  Every ``play``/``wait``, updater
+batch, frame render and movie write becomes a span nested under the
+enclosing scene step.
+"""
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+
+import manim_hooks
+
+
+class Tracer:
+    def __init__(self):
+        self.enabled = False
+        self.events = []
+        self.open_spans = []
+        # Called with the span name whenever a span closes, traced or not
+        self.end_callbacks = []
+
+    def _event(self, phase, name, args=None):
+        event = {
+            "name": name,
+            "ph": phase,
+            "ts": time.perf_counter_ns() / 1e3,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+        }
+        if args:
+            event["args"] = args
+        self.events.append(event)
+
+    def begin(self, name, **args):
+        self.open_spans.append(name)
+        if self.enabled:
+            self._event("B", name, args)
+
+    def end(self):
+        if not self.open_spans:
+            return
+        name = self.open_spans.pop()
+        if self.enabled:
+            self._event("E", name)
+        for callback in self.end_callbacks:
+            callback(name)
+
+    def traced(self, name, function):
+        """Wrap ``function`` so every call is recorded as a span called ``name``."""
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            self.begin(name)
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.end()
+        return wrapper
+
+    def reset(self):
+        self.events = []
+        self.open_spans = []
+
+    def write(self, path):
+        # Close spans left open by an exception so the viewer can still nest them
+        while self.open_spans:
+            self.end()
+        with open(path, "w") as trace_file:
+            json.dump({"traceEvents": self.events, "displayTimeUnit": "ms"}, trace_file)
+
+
+tracer = Tracer()
+
+
+def begin_span(name, **args):
+    """Open a named span, closed by the next ``end_span()``; extra keywords are shown as span args."""
+    tracer.begin(name, **args)
+
+
+def end_span():
+    """Close the innermost open span."""
+    tracer.end()
+
+
+@contextlib.contextmanager
+def span(name, **args):
+    """Context manager recording the enclosed block as a named span."""
+    tracer.begin(name, **args)
+    try:
+        yield
+    finally:
+        tracer.end()
+
+
+def play_label(animations):
+    names = []
+    for animation in animations:
+        if type(animation).__name__ == "_AnimationBuilder":
+            names.append(f"{type(animation.mobject).__name__}.animate")
+        else:
+            names.append(type(animation).__name__)
+    return "play: " + ", ".join(names)
+
+
+def install():
+    """Record manim's render pipeline as trace spans and write one trace per scene."""
+    from manim import Scene
+    from manim.renderer.cairo_renderer import CairoRenderer
+    from manim.scene.scene_file_writer import SceneFileWriter
+
+    def wrap_play(original):
+        def play(self, *args, **kwargs):
+            with span(play_label(args), num_plays=self.renderer.num_plays):
+                return original(self, *args, **kwargs)
+        return play
+
+    def wrap_wait(original):
+        def wait(self, duration=1.0, *args, **kwargs):
+            with span(f"wait({duration:g})"):
+                return original(self, duration, *args, **kwargs)
+        return wait
+
+    tracer.enabled = True
+    manim_hooks.patch_method(Scene, "play", wrap_play)
+    manim_hooks.patch_method(Scene, "wait", wrap_wait)
+    manim_hooks.patch_method(Scene, "update_mobjects", lambda f: tracer.traced("updaters", f))
+    manim_hooks.patch_method(CairoRenderer, "render", lambda f: tracer.traced("frame", f))
+    manim_hooks.patch_method(CairoRenderer, "update_frame", lambda f: tracer.traced("rasterize", f))
+    manim_hooks.patch_method(SceneFileWriter, "write_frame", lambda f: tracer.traced("write frame", f))
+    manim_hooks.patch_method(SceneFileWriter, "combine_to_movie", lambda f: tracer.traced("combine movie", f))
+
+    def start(scene):
+        tracer.reset()
+        tracer.begin(type(scene).__name__)
+
+    def finish(scene):
+        tracer.end()
+        path = manim_hooks.output_path("traces", f"{type(scene).__name__}.json")
+        tracer.write(path)
+        print(f"Trace written to {path}")
+
+    manim_hooks.on_scene_start(start)
+    manim_hooks.on_scene_end(finish)
@@ -0,0 +1,69 @@
+"""Quality-aware sample counts for fields, curves and meshes.
+
+Grid sizes used to be hard-coded, so ``-ql`` previews paid the full numeric
+cost and ``-qk`` renders looked blocky.  These helpers derive them from how
+many pixels the object covers at the configured resolution::
+
+    resolution = grid_resolution(box_width)           # heatmap grid over a 6-unit box
+    dpi = figure_dpi(box_width, box_width / 2)        # Matplotlib figure 3 in wide
+    samples = curve_samples(2 * height)               # outline of a lobe height units tall
+
+Sizes are in scene units and ignore perspective.  The densities are chosen so
+that 1080p renders get about the sample counts the scenes were tuned with.
+Spheres take their tessellation from ``PIXELS_PER_FACE`` through
+``surface_lod.LODSphere``, which follows their projected size instead.
+Scripts that run without a manim config (``generate_cigar.py``) pass
+``pixel_width`` themselves, e.g. from ``QUALITY_PIXEL_WIDTHS``.
+"""
+import math
+
+# Pixel widths of manim's -ql/-qm/-qh/-qp/-qk presets
+QUALITY_PIXEL_WIDTHS = {"l": 854, "m": 1280, "h": 1920, "p": 2560, "k": 3840}
+DEFAULT_FRAME_WIDTH = 8 * 16 / 9
+
+# Samples per on-screen pixel: fields are smooth and drawn with bicubic interpolation,
+# curves need points close enough that the polyline looks round
+FIELD_SAMPLES_PER_PIXEL = 1 / 8
+CURVE_SAMPLES_PER_PIXEL = 0.6
+# On-screen pixels covered by one face of a sphere (surface_lod.LODSphere)
+PIXELS_PER_FACE = 4
+# Matplotlib figure pixels per on-screen pixel.  Images of field grids already hold
+# fewer samples than pixels and are resampled smoothly, contour plots draw their own
+# level lines; at 1080p both land on the 100 DPI the figures were tuned with.
+FIGURE_PIXELS_PER_PIXEL = 0.37
+CONTOUR_PIXELS_PER_PIXEL = 0.74
+
+
+def pixels_per_unit(pixel_width=None, frame_width=None):
+    if pixel_width is None or frame_width is None:
+        from manim import config
+
+        pixel_width = pixel_width or config.pixel_width
+        frame_width = frame_width or config.frame_width
+    return pixel_width / frame_width
+
+
+def on_screen_pixels(length, pixel_width=None, frame_width=None):
+    """Pixels covered by ``length`` scene units at the configured (or given) resolution."""
+    return length * pixels_per_unit(pixel_width, frame_width)
+
+
+def _clamp(value, minimum, maximum):
+    return int(min(max(math.ceil(value), minimum), maximum))
+
+
+def grid_resolution(length, samples_per_pixel=FIELD_SAMPLES_PER_PIXEL, minimum=24, maximum=1024, **screen):
+    """Samples along one side of a field grid ``length`` units long."""
+    return _clamp(on_screen_pixels(length, **screen) * samples_per_pixel, minimum, maximum)
+
+
+def curve_samples(length, samples_per_pixel=CURVE_SAMPLES_PER_PIXEL, minimum=64, maximum=4000, **screen):
+    """Points for a curve about ``length`` units long on screen."""
+    return _clamp(on_screen_pixels(length, **screen) * samples_per_pixel, minimum, maximum)
+
+
+def figure_dpi(length, figure_inches, pixels_per_pixel=FIGURE_PIXELS_PER_PIXEL, minimum=50, maximum=600,
+               **screen):
+    """DPI of a Matplotlib figure ``figure_inches`` wide whose image is shown ``length`` units wide."""
+    return _clamp(on_screen_pixels(length, **screen) * pixels_per_pixel / figure_inches, minimum, maximum)
+
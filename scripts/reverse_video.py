@@ -0,0 +1,174 @@
+"""Reversed slide videos with bounded memory, in parallel across slides.
+
+manim-slides reverses every slide video in one piece, which keeps every
+decoded frame of the slide in memory; long 1080p/60 slides run the build
+containers out of memory.  Here a video is cut into short segments, each
+segment is reversed on its own and the reversed segments are concatenated in
+reverse order, so memory is bounded by one segment per worker.  Slides are
+reversed in parallel, and slides that are never played backwards are skipped.
+
+As a mixin (list it first, before the other slide mixins)::
+
+    from reverse_video import StreamingReverse
+
+    class Formulas(StreamingReverse, IncrementalSlide, Slide):
+        def construct(self):
+            ...
+            self.next_slide(reversible=False)  # no backward playback for the next slide
+
+or on an already rendered deck::
+
+    python scripts/reverse_video.py Formulas --skip 3 4 -j 4
+
+A skipped slide uses its forward video as ``rev_file``, like manim-slides'
+own ``skip_reversing``.
+"""
+import argparse
+import inspect
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from fractions import Fraction
+from pathlib import Path
+
+from export_html import resolve_video
+
+DEFAULT_SEGMENT_SECONDS = 2.0
+ENCODE_ARGUMENTS = ["-c:v", "libx264", "-preset", "veryfast", "-crf", "18", "-pix_fmt", "yuv420p", "-an"]
+
+
+def probe_frames(video_path):
+    """Frame rate and number of frames of the first video stream."""
+    result = subprocess.run(
+        ["ffprobe", "-v", "error", "-select_streams", "v:0", "-count_packets",
+         "-show_entries", "stream=r_frame_rate,nb_read_packets", "-of", "json", str(video_path)],
+        capture_output=True, text=True, check=True,
+    )
+    stream = json.loads(result.stdout)["streams"][0]
+    return Fraction(stream["r_frame_rate"]), int(stream["nb_read_packets"])
+
+
+def reverse_video_file(source, target, segment_seconds=DEFAULT_SEGMENT_SECONDS):
+    """Write ``source`` played backwards to ``target``, one segment in memory at a time."""
+    source, target = Path(source), Path(target)
+    frame_rate, frame_count = probe_frames(source)
+    segment_frames = max(1, int(segment_seconds * frame_rate))
+    with tempfile.TemporaryDirectory(prefix="reverse_", dir=target.parent) as work_dir:
+        pieces = []
+        for start in range(0, frame_count, segment_frames):
+            piece = Path(work_dir) / f"{start:08d}.mp4"
+            # Seek half a frame early so the first frame of the segment is kept and the one before is not
+            seek = max(0.0, float((start - Fraction(1, 2)) / frame_rate))
+            subprocess.run(
+                ["ffmpeg", "-y", "-loglevel", "error", "-ss", f"{seek:.6f}", "-i", str(source),
+                 "-frames:v", str(min(segment_frames, frame_count - start)), "-vf", "reverse",
+                 *ENCODE_ARGUMENTS, "-r", str(frame_rate), str(piece)],
+                check=True,
+            )
+            pieces.append(piece)
+
+        concat_list = Path(work_dir) / "pieces.txt"
+        concat_list.write_text("".join(f"file '{piece.name}'\n" for piece in reversed(pieces)))
+        temporary = target.with_name(target.stem + ".part" + target.suffix)
+        subprocess.run(
+            ["ffmpeg", "-y", "-loglevel", "error", "-f", "concat", "-safe", "0", "-i", str(concat_list),
+             "-c", "copy", "-movflags", "+faststart", str(temporary)],
+            check=True,
+        )
+        os.replace(temporary, target)
+    return target
+
+
+def reversed_path(video_path):
+    video_path = Path(video_path)
+    return video_path.with_name(f"{video_path.stem}_reversed{video_path.suffix}")
+
+
+def reverse_presentation(manifest_path, skip=(), jobs=None, segment_seconds=DEFAULT_SEGMENT_SECONDS):
+    """Reverse the slides of a manim-slides manifest in parallel and point ``rev_file`` at them."""
+    manifest_path = Path(manifest_path)
+    presentation = json.loads(manifest_path.read_text())
+    tasks = []
+    for index, slide in enumerate(presentation["slides"]):
+        if index in skip:
+            slide["rev_file"] = slide["file"]
+            continue
+        source = resolve_video(slide["file"], manifest_path)
+        target = reversed_path(source)
+        slide["rev_file"] = str(reversed_path(slide["file"]))
+        # Slide files are named after their content, so an existing reversal is up to date
+        if not target.exists():
+            tasks.append((source, target))
+
+    if tasks:
+        print(f"Reversing {len(tasks)} of {len(presentation['slides'])} slides of {manifest_path.stem}")
+        with ThreadPoolExecutor(max_workers=jobs or os.cpu_count() or 1) as pool:
+            list(pool.map(lambda task: reverse_video_file(*task, segment_seconds=segment_seconds), tasks))
+    manifest_path.write_text(json.dumps(presentation, indent=2))
+
+
+class StreamingReverse:
+    """Mixin for ``Slide`` scenes replacing manim-slides' whole-clip reversal."""
+
+    reverse_segment_seconds = DEFAULT_SEGMENT_SECONDS
+    reverse_jobs = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._skip_reverse = set()
+        self._slide_count = 0
+        self._plays_in_slide = 0
+        self._slide_reversible = True
+
+    def play(self, *args, **kwargs):
+        self._plays_in_slide += 1
+        return super().play(*args, **kwargs)
+
+    def next_slide(self, *args, reversible=True, **kwargs):
+        self._close_slide()
+        self._slide_reversible = reversible
+        return super().next_slide(*args, **kwargs)
+
+    def _close_slide(self):
+        # manim-slides drops slides without animations, so only those with plays get an index
+        if self._plays_in_slide:
+            if not self._slide_reversible:
+                self._skip_reverse.add(self._slide_count)
+            self._slide_count += 1
+            self._plays_in_slide = 0
+
+    def _save_slides(self, *args, **kwargs):
+        self._close_slide()
+        # Let manim-slides skip its own reversal, the manifest is reversed below
+        if "skip_reversing" in inspect.signature(super()._save_slides).parameters:
+            kwargs["skip_reversing"] = True
+        else:
+            self.skip_reversing = True
+        result = super()._save_slides(*args, **kwargs)
+        manifest_path = Path(getattr(self, "_output_folder", "slides")) / f"{type(self).__name__}.json"
+        reverse_presentation(manifest_path, self._skip_reverse, self.reverse_jobs, self.reverse_segment_seconds)
+        return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Reverse the slide videos of a rendered deck.")
+    parser.add_argument("scenes", nargs="+", help="slide scene names")
+    parser.add_argument("--folder", default="slides", help="manim-slides output folder (default: slides)")
+    parser.add_argument("--skip", nargs="+", type=int, default=[], help="slide indices (from 0) to leave unreversed")
+    parser.add_argument("-j", "--jobs", type=int, help="slides reversed at once (default: all cores)")
+    parser.add_argument("--segment-seconds", type=float, default=DEFAULT_SEGMENT_SECONDS,
+                        help="length of the pieces reversed in memory (default: 2)")
+    args = parser.parse_args()
+    for scene in args.scenes:
+        manifest_path = Path(args.folder) / f"{scene}.json"
+        if not manifest_path.exists():
+            print(f"No slides manifest at {manifest_path}")
+            sys.exit(1)
+        reverse_presentation(manifest_path, set(args.skip), args.jobs, args.segment_seconds)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,41 +1,55 @@
 from manim import *
 import numpy as np
 import math
-import matplotlib.pyplot as plt
 import io
-from PIL import Image
 from manim import ImageMobject # Correct import path
 
+from heatmap_prefetch import HeatmapPrefetcher
+from hotspot_overlay import HotspotOverlay
+from keyframes import KeyframedUpdater, apply_pixels, crossfade_pixels
+from lazy_imports import lazy_module
+from phasor_field import PhasorArray, RotatePhasors, colormap_colors
+from render_trace import span, begin_span, end_span
+from rx_heatmaps import (
+    BOX_SIZE, RX_POSITION, heatmap_spec, mpc_sources, phases_at_rx, single_heatmap_png, summed_field_intensity, summed_heatmap_png,
+)
+from scene_params import RxBeamformingParams
+
+Image = lazy_module("PIL.Image")
+
 class RxBeamformingPhasors(Scene):
     def construct(self):
         # --- Configuration ---
-        num_mpc = 3
-        wave_speed = 2.5
-        wave_frequency = 1.0
-        wave_amplitude = 1.0
+        # Defaults live in RxBeamformingParams; sweep.py renders variants through MANIM_SCENE_PARAMS
+        params = RxBeamformingParams.from_env()
+        num_mpc = params.num_mpc
+        wave_speed = params.wave_speed
+        wave_frequency = params.wave_frequency
+        wave_amplitude = params.wave_amplitude
         max_radius_time_domain = 12
         pulse_interval = 1.0 / wave_frequency
         k = 2 * PI * wave_frequency / wave_speed
 
-        box_width = 6
-        box_height = 4
+        # Shared with the heatmap generator, which samples its fields over the same box
+        box_width, box_height = BOX_SIZE
         box_color = BLACK # Changed for white background
         rx_color = RED
-        phasor_colors = [BLUE, GREEN, ORANGE] # Adjusted colors slightly
-        heatmap_colormap = "viridis"
+        phasor_palette = [BLUE, GREEN, ORANGE, PURPLE, TEAL, MAROON, GOLD, PINK] # Adjusted colors slightly
+        # Beyond the palette, colours come from a colormap over the angle of arrival (set after MPC Setup)
+        phasor_colors = phasor_palette[:num_mpc]
 
         # Animation timings
-        time_domain_duration_per_mpc = 4
+        time_domain_duration_per_mpc = params.time_domain_duration_per_mpc
         transition_duration = 0.5
         initial_sum_hold_duration = 1.5
-        morph_align_duration = 5
+        morph_align_duration = params.morph_align_duration
         final_hold_duration = 3
 
         # --- Scene Elements ---
         self.camera.background_color = WHITE # Set background color
         box = Rectangle(
             width=box_width, height=box_height, color=box_color, stroke_width=2
-        ).shift(ORIGIN)
+        ).move_to(RX_POSITION)
         rx_position = box.get_center()
         rx_dot = Dot(point=rx_position, color=rx_color, radius=0.1)
         rx_label = Text("Rx", font_size=20, color=BLACK).next_to(rx_dot, UP, buff=0.15) # Label above, black
@@ -43,14 +57,14 @@ class RxBeamformingPhasors(Scene):
         self.add(title, box, rx_dot, rx_label)
 
         # --- MPC Setup ---
-        mpc_aoa = np.array([ PI * 3/4, PI * 1/4, PI * 5/4 ]) # TL, TR, BL
-        source_distance = 8
-        mpc_source_positions = np.array([
-            rx_position + source_distance * np.array([np.cos(angle), np.sin(angle), 0])
-            for angle in mpc_aoa
-        ])
-        mpc_initial_phases = np.array([PI/3, PI * 8/10, PI * 3/2])
+        mpc_aoa = np.array(params.mpc_aoa) # TL, TR, BL by default
+        mpc_source_positions = mpc_sources(params, rx_position)
+        mpc_initial_phases = np.array(params.mpc_initial_phases)
         mpc_time_delays = mpc_initial_phases / (2 * PI * wave_frequency)
+        if num_mpc > len(phasor_palette):
+            phasor_colors = colormap_colors(params.phasor_colormap, (mpc_aoa % TAU) / TAU)
+        # Large channels only introduce the first MPCs one by one
+        num_individual_mpc = min(num_mpc, params.max_individual_mpcs)
         # Step 1 Complete
 
         # --- Helper Functions ---
@@ -101,47 +115,19 @@ class RxBeamformingPhasors(Scene):
                 else: arc.set_opacity(0)
             mobj.remove(*arcs_to_remove)
 
-        # Define grid for heatmap calculation
-        resolution = 100
-        x_coords = np.linspace(box.get_left()[0], box.get_right()[0], resolution)
-        y_coords = np.linspace(box.get_bottom()[1], box.get_top()[1], resolution)
-        xx, yy = np.meshgrid(x_coords, y_coords)
-        grid_points = np.stack([xx.ravel(), yy.ravel(), np.zeros(resolution*resolution)], axis=-1)
-
-        # Helper to calculate single MPC field REAL PART
-        def calculate_single_mpc_real_part(points, source_pos, k_val, initial_phase, amplitude):
-            displacements = points - source_pos
-            distances = np.linalg.norm(displacements, axis=1)
-            phases = k_val * distances + initial_phase
-            return amplitude * np.cos(phases)
-
-        # Helper to generate buffer for a single MPC heatmap (using real part)
+        # Heatmap spec (grid sized for the box's on-screen pixels at this quality) from rx_heatmaps,
+        # where assets.py finds the same heatmaps to build before the render
+        summed_heatmap_spec = heatmap_spec(params)
+        heatmap_extent = summed_heatmap_spec["extent"]
+
         def generate_single_heatmap_buffer(mpc_idx):
-            real_part_values = calculate_single_mpc_real_part(
-                grid_points, mpc_source_positions[mpc_idx], k, mpc_initial_phases[mpc_idx], wave_amplitude
-            )
-            heatmap_data = real_part_values.reshape((resolution, resolution))
-            vmin = -wave_amplitude
-            vmax = wave_amplitude
-            fig, ax = plt.subplots(figsize=(box_width/2, box_height/2))
-            im = ax.imshow(
-                heatmap_data, cmap=heatmap_colormap, origin='lower',
-                extent=[box.get_left()[0], box.get_right()[0], box.get_bottom()[1], box.get_top()[1]],
-                vmin=vmin, vmax=vmax
-            )
-            ax.axis('off')
-            fig.tight_layout(pad=0)
-            buf = io.BytesIO()
-            fig.savefig(buf, format='png', bbox_inches='tight', pad_inches=0, transparent=True)
-            buf.seek(0)
-            plt.close(fig)
-            return buf
+            return io.BytesIO(single_heatmap_png(summed_heatmap_spec, mpc_idx))
 
         # --- Step 2: Time Domain + Individual Static Heatmaps ---
-        print("--- Starting Step 2: Time Domain + Static Heatmaps ---")
+        begin_span("Step 2: Time Domain + Static Heatmaps")
         time_trackers = {}
-        label_corners = [UL, UR, DL] # Define corners for labels
-        for mpc_index in range(num_mpc):
+        label_corners = [UL, UR, DL, DR] # Define corners for labels, reused beyond four MPCs
+        for mpc_index in range(num_individual_mpc):
             current_mpc_waves = VGroup()
             current_source_pos = mpc_source_positions[mpc_index]
             current_delay = mpc_time_delays[mpc_index]
@@ -160,7 +146,7 @@ class RxBeamformingPhasors(Scene):
             )
 
             # Position Label in appropriate corner
-            corner = label_corners[mpc_index]
+            corner = label_corners[mpc_index % len(label_corners)]
             mpc_label = Text(f"MPC {mpc_index+1}", font_size=24, color=BLACK).to_corner(corner) # Black label
 
             time_trackers[mpc_index] = {'scene_time': 0.0, 'last_emission': -pulse_interval}
@@ -181,73 +167,32 @@ class RxBeamformingPhasors(Scene):
                 FadeOut(mpc_label), FadeOut(arrow), FadeOut(static_heatmap_image),
                 FadeOut(current_mpc_waves), run_time=0.5
             )
-        print("--- Finished Step 2 ---")
+        end_span()
         # Step 2 Complete
 
         # --- Step 3: Transition ---
-        self.wait(transition_duration)
+        with span("Step 3: Transition"):
+            self.wait(transition_duration)
         # Step 3 Complete
 
         # --- Step 4: Initial Summed Heatmap & Phasors ---
-        print("--- Starting Step 4: Initial Summed State ---")
-        target_phase = 0.0
-        rotation_angles = []
-        phasor_vectors_np = []
-        current_phases_at_rx = []
-        for i in range(num_mpc):
-            source_pos = mpc_source_positions[i]
-            initial_phase = mpc_initial_phases[i]
-            dist_to_rx = np.linalg.norm(rx_position - source_pos)
-            phase_at_rx = (k * dist_to_rx + initial_phase)
-            current_phase = phase_at_rx % (2 * PI)
-            current_phases_at_rx.append(current_phase)
-            rotation_angle = target_phase - current_phase
-            rotation_angles.append(rotation_angle)
-            phasor_np = wave_amplitude * np.array([np.cos(current_phase), np.sin(current_phase), 0])
-            phasor_vectors_np.append(phasor_np)
-
-        def calculate_summed_field_intensity(points, alignment_value):
-            total_complex_field = np.zeros(points.shape[0], dtype=complex)
-            for i in range(num_mpc):
-                source_pos = mpc_source_positions[i]
-                initial_phase = mpc_initial_phases[i]
-                rot_angle = rotation_angles[i]
-                displacements = points - source_pos
-                distances = np.linalg.norm(displacements, axis=1)
-                phi_initial = k * distances + initial_phase
-                phi_adjusted = phi_initial + alignment_value * rot_angle
-                total_complex_field += wave_amplitude * np.exp(1j * phi_adjusted)
-            return np.abs(total_complex_field)**2
+        begin_span("Step 4: Initial Summed State")
+        # Aligning means turning every MPC to phase 0 at the Rx
+        current_phases_at_rx = phases_at_rx(mpc_source_positions, mpc_initial_phases, k, rx_position)
+        rotation_angles = summed_heatmap_spec["rotations"]
 
+        # Summed heatmaps are rendered by rx_heatmaps so Step 5 can prefetch them in worker processes
         def generate_summed_heatmap_buffer(alignment_val):
-            field_intensity = calculate_summed_field_intensity(grid_points, alignment_val)
-            heatmap_data = field_intensity.reshape((resolution, resolution))
-            vmin = np.percentile(heatmap_data, 1)
-            vmax = np.percentile(heatmap_data, 99.5)
-            fig, ax = plt.subplots(figsize=(box_width/2, box_height/2))
-            im = ax.imshow(
-                heatmap_data, cmap=heatmap_colormap, origin='lower',
-                extent=[box.get_left()[0], box.get_right()[0], box.get_bottom()[1], box.get_top()[1]],
-                vmin=vmin, vmax=vmax, interpolation='bicubic'
-            )
-            ax.axis('off')
-            fig.tight_layout(pad=0)
-            buf = io.BytesIO()
-            fig.savefig(buf, format='png', bbox_inches='tight', pad_inches=0, transparent=True)
-            buf.seek(0)
-            plt.close(fig)
-            return buf
+            return io.BytesIO(summed_heatmap_png(summed_heatmap_spec, alignment_val))
 
         initial_summed_buf = generate_summed_heatmap_buffer(0.0)
         summed_heatmap_image = ImageMobject(Image.open(initial_summed_buf))
         summed_heatmap_image.set_height(box_height).move_to(box.get_center()).set_opacity(0.8)
 
-        phasors_initial = VGroup()
-        for i in range(num_mpc):
-             phasor_vec = Vector(
-                 phasor_vectors_np[i], color=phasor_colors[i], stroke_width=4
-             ).shift(rx_position)
-             phasors_initial.add(phasor_vec)
+        # All phasors in one array-backed mobject, one sub-path per arrow
+        phasors_initial = PhasorArray(
+            wave_amplitude, current_phases_at_rx, origins=rx_position, colors=phasor_colors, stroke_width=4
+        )
 
         initial_state_label = Text("Initial State", font_size=24, color=BLACK).next_to(box, DOWN, buff=0.3) # Black label
         initial_state_label.set_z_index(20)
@@ -257,26 +202,25 @@ class RxBeamformingPhasors(Scene):
             run_time=1
         )
         self.wait(initial_sum_hold_duration)
-        print("--- Finished Step 4 ---")
+        end_span()
         # Step 4 Complete
 
         # --- Step 5: Morph Heatmap & Align Phasors/Dials ---
-        print("--- Starting Step 5: Morph and Align ---")
+        begin_span("Step 5: Morph and Align")
         self.play(FadeOut(initial_state_label), run_time=0.2)
 
         dials = VGroup()
-        dial_indicators = VGroup()
         dial_radius = 0.4 # Increased radius
         dial_label_offset = 1.0 # Offset for dials relative to label corners
 
         # Position dials relative to the corners using to_corner().shift()
         dial_positions = []
         # label_corners defined earlier
-        for i in range(num_mpc):
-            corner = label_corners[i]
+        for i in range(num_individual_mpc):
+            corner = label_corners[i % len(label_corners)]
             if np.array_equal(corner, UL) or np.array_equal(corner, UR):
                 offset_dir = DOWN
-            else: # DL corner
+            else: # DL/DR corners
                 offset_dir = UP
             # Create a temporary point at the corner and shift it
             dial_pos = Dot().to_corner(corner).shift(offset_dir * dial_label_offset).get_center()
@@ -285,46 +229,47 @@ class RxBeamformingPhasors(Scene):
         # Also create the MPC labels again for this phase, positioned near dials
         mpc_labels_step5 = VGroup()
         label_offset_factor = 0.0 # Smaller offset for labels vs dials
-        for i in range(num_mpc):
+        for i in range(num_individual_mpc):
             dial_center = dial_positions[i]
             dial_circle = Circle(radius=dial_radius, color=phasor_colors[i], stroke_width=2).move_to(dial_center)
-            indicator_line = Line(
-                start=dial_center, end=dial_center + dial_radius * RIGHT,
-                color=phasor_colors[i], stroke_width=3
-            ).rotate(current_phases_at_rx[i], about_point=dial_center)
             dials.add(dial_circle)
-            dial_indicators.add(indicator_line)
 
             # Position label near the dial using similar logic
-            corner = label_corners[i]
+            corner = label_corners[i % len(label_corners)]
             if np.array_equal(corner, UL) or np.array_equal(corner, UR): offset_dir = DOWN
             else: offset_dir = RIGHT
             label_pos = Dot().to_corner(corner).shift(offset_dir * label_offset_factor).get_center()
             label = Text(f"MPC {i+1}", font_size=24, color=BLACK).move_to(label_pos) # Black label
             mpc_labels_step5.add(label)
+        dial_indicators = PhasorArray(
+            dial_radius, current_phases_at_rx[:num_individual_mpc], origins=np.reshape(dial_positions, (-1, 3)),
+            colors=phasor_colors[:num_individual_mpc], stroke_width=3, tips=False
+        )
         dials.set_z_index(20)
         dial_indicators.set_z_index(20)
         mpc_labels_step5.set_z_index(20) # Ensure labels are also on top
 
         alignment_tracker = ValueTracker(0.0)
-        # Use become for heatmap morph
-        def heatmap_updater(img_mob):
-            alignment_val = alignment_tracker.get_value()
-            new_buf = generate_summed_heatmap_buffer(alignment_val)
-            new_img = ImageMobject(Image.open(new_buf))
-            new_img.set_height(box_height).move_to(box.get_center()).set_opacity(0.8)
-            img_mob.become(new_img)
+        # The heatmap is only computed at keyframes (heatmap_keyframe_rate per second of the morph),
+        # frames in between crossfade the two neighbouring keyframes
+        def heatmap_keyframe(alignment_val):
+            new_img = ImageMobject(Image.open(io.BytesIO(heatmap_source.get(alignment_val))))
+            return new_img.set_opacity(0.8).pixel_array
+
+        heatmap_updater = KeyframedUpdater.at_rate(
+            params.heatmap_keyframe_rate, morph_align_duration, alignment_tracker.get_value,
+            compute=heatmap_keyframe, apply=apply_pixels, blend=crossfade_pixels,
+        )
+        # Every keyframe is known up front, so they are computed in the background
+        # while earlier frames are rendered and encoded
+        alignment_schedule = [] if self.renderer.skip_animations else heatmap_updater.keyframe_values
+        heatmap_source = HeatmapPrefetcher(summed_heatmap_png, summed_heatmap_spec, alignment_schedule)
 
         summed_heatmap_image.add_updater(heatmap_updater)
 
-        phasor_rotations = [
-            Rotate(phasors_initial[i], angle=rotation_angles[i], about_point=rx_position)
-            for i in range(num_mpc)
-        ]
-        dial_rotations = [
-            Rotate(dial_indicators[i], angle=rotation_angles[i], about_point=dial_positions[i])
-            for i in range(num_mpc)
-        ]
+        # One vectorized rotation for all phasors and one for all dial indicators
+        phasor_rotations = RotatePhasors(phasors_initial, rotation_angles)
+        dial_rotations = RotatePhasors(dial_indicators, rotation_angles[:num_individual_mpc])
 
         aligning_label = Text("Aligning Phases...", font_size=24, color=BLACK).next_to(box, DOWN, buff=0.3) # Black label
         aligning_label.set_z_index(20)
@@ -332,18 +277,19 @@ class RxBeamformingPhasors(Scene):
         self.play(FadeIn(dials), FadeIn(dial_indicators), FadeIn(mpc_labels_step5), Write(aligning_label), run_time=0.5)
         self.play(
             alignment_tracker.animate.set_value(1.0),
-            AnimationGroup(*phasor_rotations, lag_ratio=0),
-            AnimationGroup(*dial_rotations, lag_ratio=0),
+            phasor_rotations,
+            dial_rotations,
             run_time=morph_align_duration,
             rate_func=linear
         )
         summed_heatmap_image.remove_updater(heatmap_updater)
+        heatmap_source.close()
         self.play(FadeOut(aligning_label), run_time=0.2)
-        print("--- Finished Step 5 ---")
+        end_span()
         # Step 5 Complete
 
         # --- Step 6: Final Emphasis ---
-        print("--- Starting Step 6: Final Emphasis ---")
+        begin_span("Step 6: Final Emphasis")
         aligned_sum_label = Text("Aligned Sum (Hotspot)", font_size=24, color=BLACK).next_to(box, DOWN, buff=0.3) # Black label
         aligned_sum_label.set_z_index(20)
         phasors_initial.set_z_index(15)
@@ -355,10 +301,14 @@ class RxBeamformingPhasors(Scene):
         # Keep MPC labels visible during flash
         self.play(Write(aligned_sum_label), FadeOut(dials), FadeOut(dial_indicators), run_time=0.5)
         self.play(hotspot_animation)
-        print("--- Finished Step 6 ---")
+        if params.annotate_hotspot:
+            hotspot_overlay = HotspotOverlay(summed_field_intensity(summed_heatmap_spec, 1.0), heatmap_extent)
+            hotspot_overlay.set_z_index(18)
+            self.play(hotspot_overlay.animation(run_time=1.5))
+        end_span()
         # Step 6 Complete
 
         # --- Step 7: Hold ---
-        self.wait(final_hold_duration)
+        with span("Step 7: Hold"):
+            self.wait(final_hold_duration)
         # Step 7 Complete
-        print("--- End of Construct ---")
@@ -0,0 +1,136 @@
+"""Heatmaps of ``RxBeamformingPhasors``.
+
+Step 5 needs one heatmap per frame.  The field geometry and the rendering live
+here, at module level and driven by a plain ``spec`` dict derived from the
+scene's ``RxBeamformingParams``, so ``HeatmapPrefetcher`` can run them in
+worker processes and ``assets.py`` can build every heatmap of a render before
+it starts; the scene builds the spec once::
+
+    spec = heatmap_spec(params)                    # at the manim config's resolution
+    png_bytes = summed_heatmap_png(spec, alignment_val)
+    static_png = single_heatmap_png(spec, mpc_index)
+"""
+import io
+
+import numpy as np
+
+from asset_cache import Asset
+from field_eval import real_part, summed_intensity
+from keyframes import KeyframedUpdater
+from lazy_imports import lazy_module
+from resolution import figure_dpi, grid_resolution
+
+plt = lazy_module("matplotlib.pyplot")
+
+# The scene builds its box from these: BOX_SIZE centred on the Rx.  The MPC sources sit
+# SOURCE_DISTANCE away from the Rx along their angle of arrival.
+BOX_SIZE = (6, 4)
+RX_POSITION = np.zeros(3)
+SOURCE_DISTANCE = 8
+
+
+def wavenumber(params):
+    return 2 * np.pi * params.wave_frequency / params.wave_speed
+
+
+def mpc_sources(params, rx_position=RX_POSITION):
+    """(num_mpc, 3) positions of the MPC sources."""
+    angles = np.array(params.mpc_aoa)
+    return rx_position + SOURCE_DISTANCE * np.stack([np.cos(angles), np.sin(angles), np.zeros_like(angles)], axis=1)
+
+
+def phases_at_rx(sources, phases, k, rx_position=RX_POSITION):
+    """Phase of every MPC at the Rx, in [0, 2 pi)."""
+    return (k * np.linalg.norm(rx_position - sources, axis=1) + phases) % (2 * np.pi)
+
+
+def heatmap_spec(params, **screen):
+    """Spec of the scene's heatmaps, sized for the manim config's resolution unless ``pixel_width``/``frame_width`` are given."""
+    box_width, box_height = BOX_SIZE
+    sources = mpc_sources(params)
+    phases = np.array(params.mpc_initial_phases)
+    k = wavenumber(params)
+    return {
+        # Step 5 aligns every MPC to phase 0 at the Rx
+        "sources": sources, "phases": phases, "rotations": 0.0 - phases_at_rx(sources, phases, k),
+        "k": k, "amplitude": params.wave_amplitude, "resolution": grid_resolution(box_width, **screen),
+        "colormap": params.heatmap_colormap,
+        "extent": [RX_POSITION[0] - box_width / 2, RX_POSITION[0] + box_width / 2,
+                   RX_POSITION[1] - box_height / 2, RX_POSITION[1] + box_height / 2],
+        "size": [box_width, box_height], "dpi": figure_dpi(box_width, box_width / 2, **screen),
+    }
+
+
+def heatmap_axes(extent, resolution):
+    """x and y sample coordinates of the ``resolution`` x ``resolution`` heatmap grid over ``extent`` (left, right, bottom, top)."""
+    return np.linspace(extent[0], extent[1], resolution), np.linspace(extent[2], extent[3], resolution)
+
+
+def summed_field_intensity(spec, alignment_value):
+    """(resolution, resolution) intensity of the summed MPC field, rows along y, evaluated tile by tile in float32."""
+    x_coords, y_coords = heatmap_axes(spec["extent"], spec["resolution"])
+    phases = np.asarray(spec["phases"]) + alignment_value * np.asarray(spec["rotations"])
+    return summed_intensity(x_coords, y_coords, spec["sources"], phases, spec["k"], spec["amplitude"])
+
+
+def _png(heatmap_data, spec, **imshow):
+    box_width, box_height = spec["size"]
+    fig, ax = plt.subplots(figsize=(box_width/2, box_height/2))
+    ax.imshow(heatmap_data, cmap=spec["colormap"], origin='lower', extent=spec["extent"], **imshow)
+    ax.axis('off')
+    fig.tight_layout(pad=0)
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', bbox_inches='tight', pad_inches=0, transparent=True, dpi=spec["dpi"])
+    plt.close(fig)
+    return buf.getvalue()
+
+
+def render_single_heatmap(key):
+    # Single MPC field REAL PART, evaluated tile by tile in float32
+    x_coords, y_coords = heatmap_axes(key["extent"], key["resolution"])
+    heatmap_data = real_part(x_coords, y_coords, key["source"], key["phase"], key["k"], key["amplitude"])
+    return _png(heatmap_data, key, vmin=-key["amplitude"], vmax=key["amplitude"])
+
+
+def render_summed_heatmap(key):
+    heatmap_data = summed_field_intensity(key, key["alignment"])
+    vmin = np.percentile(heatmap_data, 1)
+    vmax = np.percentile(heatmap_data, 99.5)
+    return _png(heatmap_data, key, vmin=vmin, vmax=vmax, interpolation='bicubic')
+
+
+# --- Assets ---
+# Heatmaps are shared through the asset cache by every variant with the same field
+def single_heatmap(spec, mpc_index):
+    key = {
+        "source": spec["sources"][mpc_index], "k": spec["k"], "phase": spec["phases"][mpc_index],
+        **{name: spec[name] for name in ("amplitude", "resolution", "colormap", "extent", "size", "dpi")},
+    }
+    return Asset("rx_single_heatmap", render_single_heatmap, key, sources=["field_eval"])
+
+
+def summed_heatmap(spec, alignment_value):
+    return Asset("rx_summed_heatmap", render_summed_heatmap, dict(spec, alignment=alignment_value), sources=["field_eval"])
+
+
+def single_heatmap_png(spec, mpc_index):
+    """PNG bytes of the static heatmap of MPC ``mpc_index`` (Step 2)."""
+    return single_heatmap(spec, mpc_index).read()
+
+
+def summed_heatmap_png(spec, alignment_value):
+    """PNG bytes of the summed heatmap at ``alignment_value`` (Steps 4 and 5)."""
+    return summed_heatmap(spec, alignment_value).read()
+
+
+def heatmap_assets(params, **screen):
+    """Every heatmap a render with ``params`` shows: the static ones of Step 2 and Step 5's keyframes."""
+    spec = heatmap_spec(params, **screen)
+    # Step 5's heatmap updater, only for its keyframe grid
+    keyframes = KeyframedUpdater.at_rate(
+        params.heatmap_keyframe_rate, params.morph_align_duration, None, None, None, None
+    ).keyframe_values
+    return [
+        *[single_heatmap(spec, index) for index in range(min(params.num_mpc, params.max_individual_mpcs))],
+        *[summed_heatmap(spec, value) for value in [0.0, *keyframes]],
+    ]
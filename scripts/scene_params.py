@@ -0,0 +1,104 @@
+"""Typed configuration of the parameterized scenes.
+
+Each scene reads its configuration block from one of these dataclasses instead
+of hard-coded locals, so variants can be rendered without editing the scene::
+
+    MANIM_SCENE_PARAMS='{"num_antennas": 16}' manim -ql scripts/tx_beamforming_arcs.py TxBeamformingArcs
+
+``sweep.py`` renders whole grids of variants this way.  The defaults are the
+values the scenes were designed with.
+"""
+import dataclasses
+import hashlib
+import json
+import math
+import os
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+PARAMS_ENV = "MANIM_SCENE_PARAMS"
+
+
+class SceneParams:
+    @classmethod
+    def from_env(cls):
+        """Parameters from ``MANIM_SCENE_PARAMS`` (a JSON object), defaults for anything missing."""
+        return cls(**json.loads(os.environ.get(PARAMS_ENV) or "{}"))
+
+    def to_json(self):
+        return json.dumps(dataclasses.asdict(self), sort_keys=True)
+
+    def digest(self):
+        return hashlib.sha256(f"{type(self).__name__}{self.to_json()}".encode()).hexdigest()[:12]
+
+
+@dataclass(frozen=True)
+class TxBeamformingParams(SceneParams):
+    num_antennas: int = 8
+    antenna_spacing: float = 0.5  # Spacing between antennas
+    wave_speed: float = 2.5  # Speed at which wavefronts expand
+    wave_frequency: float = 2.0
+    max_radius: float = 6  # How far the waves expand before fading
+    wave_stroke_width: float = 2
+    broadside_duration: float = 2
+    steering_animation_duration: float = 15
+    transition_duration: float = 1.0  # Duration for wave-to-pattern fade
+
+    def __post_init__(self):
+        if self.num_antennas < 2:
+            raise ValueError("num_antennas must be at least 2")
+        if self.wave_frequency <= 0:
+            raise ValueError("wave_frequency must be positive")
+
+
+# Angles of arrival and initial phases of the three original MPCs (TL, TR, BL)
+DEFAULT_MPC_AOA = (math.pi * 3 / 4, math.pi * 1 / 4, math.pi * 5 / 4)
+DEFAULT_MPC_PHASES = (math.pi / 3, math.pi * 8 / 10, math.pi * 3 / 2)
+
+
+@dataclass(frozen=True)
+class RxBeamformingParams(SceneParams):
+    num_mpc: int = 3
+    # None: the original MPCs for up to three paths, evenly spread arrivals beyond that
+    mpc_aoa: Optional[Tuple[float, ...]] = None
+    mpc_initial_phases: Optional[Tuple[float, ...]] = None
+    wave_speed: float = 2.5
+    wave_frequency: float = 1.0
+    wave_amplitude: float = 1.0
+    heatmap_colormap: str = "viridis"
+    phasor_colormap: str = "twilight"  # Colours by angle of arrival when there are more MPCs than palette colours
+    max_individual_mpcs: int = 4  # MPCs introduced one by one (Step 2) and given a dial (Step 5)
+    time_domain_duration_per_mpc: float = 4
+    morph_align_duration: float = 5
+    heatmap_keyframe_rate: float = 15  # Summed heatmaps computed per second of the morph
+    annotate_hotspot: bool = False  # Overlay FWHM contour and hotspot metrics on the aligned heatmap
+
+    def __post_init__(self):
+        if self.num_mpc < 1:
+            raise ValueError("num_mpc must be at least 1")
+        if self.heatmap_keyframe_rate <= 0:
+            raise ValueError("heatmap_keyframe_rate must be positive")
+        if self.max_individual_mpcs < 0:
+            raise ValueError("max_individual_mpcs cannot be negative")
+        if self.mpc_aoa is None:
+            aoa = DEFAULT_MPC_AOA[:self.num_mpc] if self.num_mpc <= len(DEFAULT_MPC_AOA) else tuple(
+                math.pi / 4 + 2 * math.pi * i / self.num_mpc for i in range(self.num_mpc)
+            )
+            object.__setattr__(self, "mpc_aoa", aoa)
+        if self.mpc_initial_phases is None:
+            # Golden-angle steps keep extra phases well spread over the circle
+            phases = DEFAULT_MPC_PHASES[:self.num_mpc] if self.num_mpc <= len(DEFAULT_MPC_PHASES) else tuple(
+                (i * 2.399963) % (2 * math.pi) for i in range(self.num_mpc)
+            )
+            object.__setattr__(self, "mpc_initial_phases", phases)
+        object.__setattr__(self, "mpc_aoa", tuple(self.mpc_aoa))
+        object.__setattr__(self, "mpc_initial_phases", tuple(self.mpc_initial_phases))
+        if len(self.mpc_aoa) != self.num_mpc or len(self.mpc_initial_phases) != self.num_mpc:
+            raise ValueError("mpc_aoa and mpc_initial_phases need one value per MPC")
+
+
+# Scene class name -> parameter class, for sweep.py
+SCENE_PARAMS = {
+    "TxBeamformingArcs": TxBeamformingParams,
+    "RxBeamformingPhasors": RxBeamformingParams,
+}
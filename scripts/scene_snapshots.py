@@ -0,0 +1,237 @@
+"""Fast single-frame snapshot checks for scenes.
+
+Renders only the requested timestamps and named steps of a scene to PNG and
+compares them with stored reference images using a perceptual hash, so small
+anti-aliasing or encoder differences pass and layout or colour changes fail::
+
+    python scripts/scene_snapshots.py scripts/rx_beamforming_phasors.py RxBeamformingPhasors \\
+        --at 2.5 12 --step "Step 4: Initial Summed State" -- -ql
+    python scripts/scene_snapshots.py --all            # the CHECKS below
+    python scripts/scene_snapshots.py --all --update   # accept the current output
+
+Named steps are the ``render_trace`` spans of the scene and are captured when
+the span closes.  The scene is fast-forwarded: updaters and animations still
+run for every frame so the state is exact, but frames are only rasterized when
+a snapshot is due and nothing is encoded.  Anything after ``--`` is passed on
+to manim.
+"""
+import argparse
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+
+import manim_hooks
+import render_trace
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+REPO_DIR = SCRIPTS_DIR.parent
+
+# Visual checks run by --all: (scene file, scene class, timestamps, named steps)
+CHECKS = [
+    ("scripts/rx_beamforming_phasors.py", "RxBeamformingPhasors", [3.0],
+     ["Step 2: Time Domain + Static Heatmaps", "Step 4: Initial Summed State", "Step 5: Morph and Align"]),
+    ("scripts/tx_beamforming_arcs.py", "TxBeamformingArcs", [3.0, 8.0, 14.0], []),
+    ("scripts/reflection_animation.py", "ReflectionAnimation", [4.0],
+     ["Stage 1: Wave Animation", "Stage 3: Angles", "Stage 5: Current Densities"]),
+]
+
+
+def snapshot_name(label):
+    return re.sub(r"[^A-Za-z0-9_.=-]+", "_", label).strip("_") + ".png"
+
+
+# --- Perceptual hash ---
+def _dct_matrix(size):
+    n = np.arange(size)
+    matrix = np.sqrt(2 / size) * np.cos(np.pi * (2 * n[None, :] + 1) * n[:, None] / (2 * size))
+    matrix[0] /= np.sqrt(2)
+    return matrix
+
+
+def perceptual_hash(image, hash_size=16, highfreq_factor=4):
+    """DCT-based perceptual hash of a PIL image as a flat boolean array."""
+    from PIL import Image
+
+    size = hash_size * highfreq_factor
+    pixels = np.asarray(image.convert("L").resize((size, size), Image.LANCZOS), dtype=float)
+    dct = _dct_matrix(size)
+    low_frequencies = (dct @ pixels @ dct.T)[:hash_size, :hash_size]
+    return (low_frequencies > np.median(low_frequencies)).ravel()
+
+
+def hash_distance(image_a, image_b):
+    return int(np.count_nonzero(perceptual_hash(image_a) != perceptual_hash(image_b)))
+
+
+# --- Fast-forward capture ---
+class SnapshotCapture:
+    def __init__(self, timestamps, steps):
+        self.pending_times = sorted(timestamps)
+        self.pending_steps = list(steps)
+        self.captured = {}
+        self.renderer = None
+        self.scene = None
+        self.output_dir = None
+
+    def capture(self, label):
+        """Rasterize every mobject of the scene and save it as ``label``."""
+        renderer = self.renderer
+        renderer.static_image = None
+        self.original_update_frame(renderer, self.scene, ignore_skipping=True)
+        path = self.output_dir / snapshot_name(label)
+        renderer.camera.get_image().save(path)
+        self.captured[label] = path
+
+    def capture_due(self, start, duration):
+        while self.pending_times and self.pending_times[0] < start + duration:
+            self.capture(f"t={self.pending_times.pop(0):g}s")
+
+    def install(self):
+        from manim import config
+        from manim.renderer.cairo_renderer import CairoRenderer
+
+        capture = self
+        self.original_update_frame = CairoRenderer.update_frame
+
+        def wrap_render(original):
+            def render(self, scene, time, moving_mobjects):
+                capture.capture_due(self.time, 1 / self.camera.frame_rate)
+                self.add_frame(None)
+            return render
+
+        def wrap_add_frame(original):
+            def add_frame(self, frame, num_frames=1):
+                # Only advance the clock, nothing is encoded
+                self.time += num_frames / self.camera.frame_rate
+            return add_frame
+
+        def wrap_freeze_current_frame(original):
+            def freeze_current_frame(self, duration):
+                capture.capture_due(self.time, duration)
+                self.add_frame(None, num_frames=int(duration * self.camera.frame_rate))
+            return freeze_current_frame
+
+        def skip_rasterizing(original):
+            def update_frame(self, *args, **kwargs):
+                pass
+            return update_frame
+
+        def wrap_save_static_frame_data(original):
+            def save_static_frame_data(self, scene, static_mobjects):
+                self.static_image = None
+            return save_static_frame_data
+
+        manim_hooks.patch_method(CairoRenderer, "render", wrap_render)
+        manim_hooks.patch_method(CairoRenderer, "add_frame", wrap_add_frame)
+        manim_hooks.patch_method(CairoRenderer, "freeze_current_frame", wrap_freeze_current_frame)
+        manim_hooks.patch_method(CairoRenderer, "update_frame", skip_rasterizing)
+        manim_hooks.patch_method(CairoRenderer, "save_static_frame_data", wrap_save_static_frame_data)
+
+        def on_step_end(name):
+            if name in capture.pending_steps and capture.scene is not None:
+                capture.pending_steps.remove(name)
+                capture.capture(name)
+
+        render_trace.tracer.end_callbacks.append(on_step_end)
+
+        def start(scene):
+            # Cached animations would be fast-forwarded in one jump, so always replay them
+            config.disable_caching = True
+            config.write_to_movie = False
+            capture.scene = scene
+            capture.renderer = scene.renderer
+            capture.output_dir = manim_hooks.output_path("snapshots", f"{type(scene).__name__}/.keep").parent
+            # Slide scenes would try to concatenate the (unwritten) partial movies
+            if hasattr(scene, "_save_slides"):
+                scene._save_slides = lambda *args, **kwargs: None
+
+        def finish(scene):
+            for timestamp in capture.pending_times:
+                print(f"Scene ended before t={timestamp:g}s, capturing the final frame instead")
+                capture.capture(f"t={timestamp:g}s")
+            for step in capture.pending_steps:
+                print(f"Step {step!r} never closed in {type(scene).__name__}")
+            capture.scene = None
+
+        manim_hooks.on_scene_start(start)
+        manim_hooks.on_scene_end(finish)
+
+
+def compare(captured, reference_dir, tolerance, update):
+    """Compare captured PNGs with references; returns the number of failures."""
+    from PIL import Image
+
+    reference_dir.mkdir(parents=True, exist_ok=True)
+    failures = 0
+    for label, path in captured.items():
+        reference = reference_dir / path.name
+        if update:
+            reference.write_bytes(path.read_bytes())
+            print(f"updated   {label}")
+            continue
+        if not reference.exists():
+            print(f"MISSING   {label} (no reference at {reference}, run with --update)")
+            failures += 1
+            continue
+        with Image.open(path) as current, Image.open(reference) as expected:
+            distance = hash_distance(current, expected)
+        status = "ok" if distance <= tolerance else "CHANGED"
+        failures += status != "ok"
+        print(f"{status:<9} {label} (hash distance {distance}, tolerance {tolerance})")
+    return failures
+
+
+def run_check(scene_file, scene_name, timestamps, steps, args, manim_args):
+    capture = SnapshotCapture(timestamps, steps)
+    capture.install()
+    try:
+        manim_hooks.run_manim([scene_file, scene_name, *manim_args])
+    except SystemExit as exit:
+        if exit.code not in (0, None):
+            raise
+    reference_dir = REPO_DIR / args.reference_dir / scene_name
+    failures = compare(capture.captured, reference_dir, args.tolerance, args.update)
+    return failures + len(capture.pending_steps)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render selected frames of a scene and compare them with references.")
+    parser.add_argument("scene_file", nargs="?")
+    parser.add_argument("scene_name", nargs="?")
+    parser.add_argument("--at", nargs="+", type=float, default=[], help="timestamps in seconds")
+    parser.add_argument("--step", action="append", default=[], help="render_trace step name (repeatable)")
+    parser.add_argument("--all", action="store_true", help="run every check in CHECKS, one process each")
+    parser.add_argument("--update", action="store_true", help="store the current output as the references")
+    parser.add_argument("--tolerance", type=int, default=12,
+                        help="maximum differing perceptual-hash bits out of 256 (default: 12)")
+    parser.add_argument("--reference-dir", default="snapshots", help="reference folder, relative to the repository")
+    argv = sys.argv[1:]
+    manim_args = ["-ql"]
+    if "--" in argv:
+        split = argv.index("--")
+        argv, manim_args = argv[:split], argv[split + 1:]
+    args = parser.parse_args(argv)
+
+    if args.all:
+        failures = 0
+        for scene_file, scene_name, timestamps, steps in CHECKS:
+            command = [sys.executable, __file__, scene_file, scene_name,
+                       "--tolerance", str(args.tolerance), "--reference-dir", args.reference_dir]
+            command += ["--at", *map(str, timestamps)] if timestamps else []
+            for step in steps:
+                command += ["--step", step]
+            command += ["--update"] if args.update else []
+            failures += subprocess.run(command + ["--", *manim_args], cwd=REPO_DIR).returncode != 0
+        sys.exit(1 if failures else 0)
+
+    if not (args.scene_file and args.scene_name):
+        parser.error("a scene file and scene name are required unless --all is given")
+    failures = run_check(args.scene_file, args.scene_name, args.at, args.step, args, manim_args)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Screen-space level of detail for spheres in 3D scenes.
+
+A ``Sphere`` keeps the tessellation it was built with, so a sphere a few
+pixels wide is still depth-sorted and rasterized face by face on every frame.
+``LODSphere`` picks its tessellation from its projected size instead and only
+re-tessellates when that size crosses into another band::
+
+    hotspot = LODSphere(radius=0.09, color=WHITE).track_camera(self.renderer.camera)
+
+Band changes need the requirement to leave the current band by ``HYSTERESIS``,
+so a size hovering at a band edge does not flip the mesh every frame.  The
+updater is suspended while an animation plays on the sphere itself (manim's
+default), so re-tessellation happens between such animations or during camera
+moves, never in the middle of a ``Rotate`` of the sphere.
+"""
+import numpy as np
+from manim import ORIGIN, Sphere
+
+from resolution import PIXELS_PER_FACE, on_screen_pixels
+
+# Faces around the equator a sphere may be drawn with; the tessellation only changes between these
+BANDS = (6, 8, 12, 16, 24, 32, 48, 64, 101)
+HYSTERESIS = 0.15
+
+
+def projected_radius(camera, center, radius):
+    """Radius, in scene units on the frame, of a sphere at ``center`` as ``camera`` projects it."""
+    if not hasattr(camera, "project_points"):
+        return radius
+    offsets = radius * np.vstack([np.eye(3), -np.eye(3)])
+    points = camera.project_points(np.vstack([center, center + offsets]))
+    return float(np.linalg.norm(points[1:] - points[0], axis=1).max())
+
+
+def faces_around(radius, **screen):
+    """Faces around the equator for faces of about ``PIXELS_PER_FACE`` pixels."""
+    return on_screen_pixels(2 * np.pi * radius, **screen) / PIXELS_PER_FACE
+
+
+def choose_band(faces, current=None, bands=BANDS, hysteresis=HYSTERESIS):
+    """Smallest band with at least ``faces`` faces, keeping ``current`` while within the hysteresis."""
+    target = next((band for band in bands if band >= faces), bands[-1])
+    if current is None or target == current:
+        return target
+    index = bands.index(current)
+    lower = bands[index - 1] if index else 0
+    if lower * (1 - hysteresis) < faces <= current * (1 + hysteresis):
+        return current
+    return target
+
+
+class LODSphere(Sphere):
+    def __init__(self, center=ORIGIN, radius=1, bands=BANDS, **kwargs):
+        kwargs.pop("resolution", None)
+        self.lod_bands = bands
+        self.lod_kwargs = kwargs
+        # Until a camera is tracked, size the mesh for the unprojected radius
+        self.lod_band = choose_band(faces_around(radius), bands=bands)
+        super().__init__(center=center, radius=radius, resolution=self.resolution_for(self.lod_band), **kwargs)
+
+    @staticmethod
+    def resolution_for(band):
+        return band, max(band // 2, 4)
+
+    def lod_radius(self):
+        return max(self.width, self.height, self.depth) / 2
+
+    def track_camera(self, camera):
+        """Re-tessellate from ``camera``'s projection on every frame the sphere is updated."""
+        self.add_updater(lambda mobject: mobject.update_lod(camera))
+        return self
+
+    def update_lod(self, camera):
+        radius = self.lod_radius()
+        faces = faces_around(projected_radius(camera, self.get_center(), radius))
+        band = choose_band(faces, self.lod_band, self.lod_bands)
+        if band == self.lod_band:
+            return self
+        self.lod_band = band
+        mesh = Sphere(center=self.get_center(), radius=radius, resolution=self.resolution_for(band), **self.lod_kwargs)
+        mesh.match_style(self)
+        self.submobjects = mesh.submobjects
+        return self
@@ -0,0 +1,165 @@
+"""Render a grid of scene variants on a local pool of manim processes.
+
+    python scripts/sweep.py scripts/tx_beamforming_arcs.py TxBeamformingArcs \\
+        --grid num_antennas=4,8,16 wave_frequency=1.5,2.0 -j 4 -- -ql
+    python scripts/sweep.py scripts/rx_beamforming_phasors.py RxBeamformingPhasors \\
+        --grid num_mpc=2,3,5 -- -ql
+
+Every combination of the ``--grid`` values is checked against the scene's
+parameter class in ``scene_params`` and rendered once (identical variants are
+merged) with ``MANIM_SCENE_PARAMS``.  Grid values are parsed as JSON, so lists
+work too: ``mpc_aoa=[0.5,2.0]``.  Generated inputs are built before the pool
+starts: ``assets.py`` builds what the variants declare, once per distinct
+asset, so variants with the same field reuse them.
+
+Each variant gets ``<media_dir>/sweeps/<Scene>/<variant>.json`` with its
+parameters, command, status, render time and movie, and ``index.json`` lists
+them all.  Variants whose manifest says they finished with the same
+parameters are not rendered again.
+"""
+import argparse
+import dataclasses
+import itertools
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from asset_cache import CACHE_ENV
+from assets import SCENE_ASSETS, build, quality_from_args, quality_screen, scene_assets
+from scene_params import PARAMS_ENV, SCENE_PARAMS
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+REPO_DIR = SCRIPTS_DIR.parent
+
+def parse_grid(assignments):
+    grid = {}
+    for assignment in assignments:
+        name, _, values = assignment.partition("=")
+        if not values:
+            raise ValueError(f"Grid entry {assignment!r} is not name=value[,value...]")
+        # Split on commas outside brackets, so list values stay whole
+        grid[name] = [parse_value(value) for value in re.split(r",(?![^\[]*\])", values)]
+    return grid
+
+
+def parse_value(text):
+    try:
+        value = json.loads(text)
+    except json.JSONDecodeError:
+        return text
+    return tuple(value) if isinstance(value, list) else value
+
+
+def expand(params_class, grid):
+    """Validated parameter objects for every combination in ``grid``, duplicates removed."""
+    variants = {}
+    names = list(grid)
+    for values in itertools.product(*(grid[name] for name in names)):
+        params = params_class(**dict(zip(names, values)))
+        variants.setdefault(params.digest(), (dict(zip(names, values)), params))
+    return list(variants.values())
+
+
+def variant_name(scene_name, overrides, params):
+    label = "_".join(f"{name}={value}" for name, value in overrides.items())
+    label = re.sub(r"[^A-Za-z0-9_.=-]+", "", label)[:60]
+    return f"{scene_name}_{label}_{params.digest()}" if label else f"{scene_name}_{params.digest()}"
+
+
+def media_dir_from_args(manim_args):
+    for index, arg in enumerate(manim_args):
+        if arg == "--media_dir" and index + 1 < len(manim_args):
+            return Path(manim_args[index + 1])
+        if arg.startswith("--media_dir="):
+            return Path(arg.split("=", 1)[1])
+    return Path("media")
+
+
+def render_variant(scene_file, scene_name, name, params, manim_args, manifest_dir, media_dir):
+    manifest_path = manifest_dir / f"{name}.json"
+    if manifest_path.exists():
+        previous = json.loads(manifest_path.read_text())
+        if previous["status"] == "ok" and previous["params"] == json.loads(params.to_json()) \
+                and previous["movie"] and (REPO_DIR / previous["movie"]).exists():
+            print(f"{name}: up to date")
+            return previous
+
+    command = [sys.executable, "-m", "manim", "render", scene_file, scene_name,
+               "-o", name, "--progress_bar", "none", *manim_args]
+    env = dict(os.environ, **{PARAMS_ENV: params.to_json()}, MPLBACKEND="Agg")
+    start = time.perf_counter()
+    result = subprocess.run(command, cwd=REPO_DIR, env=env, capture_output=True, text=True)
+    elapsed = time.perf_counter() - start
+
+    movies = sorted((REPO_DIR / media_dir / "videos" / Path(scene_file).stem).glob(f"*/{name}.mp4"))
+    entry = {
+        "name": name,
+        "scene": scene_name,
+        "params": dataclasses.asdict(params),
+        "command": command[1:],
+        "status": "ok" if result.returncode == 0 else "failed",
+        "render_time": round(elapsed, 2),
+        "movie": str(movies[-1].relative_to(REPO_DIR)) if movies and result.returncode == 0 else None,
+    }
+    if result.returncode != 0:
+        entry["error"] = result.stderr[-2000:]
+    manifest_path.write_text(json.dumps(entry, indent=2))
+    print(f"{name}: {entry['status']} in {elapsed:.1f} s")
+    return entry
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render a parameter grid of scene variants.")
+    parser.add_argument("scene_file")
+    parser.add_argument("scene_name", choices=sorted(SCENE_PARAMS))
+    parser.add_argument("--grid", nargs="+", default=[], help="name=value[,value...] per parameter")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="parallel renders")
+    argv = sys.argv[1:]
+    manim_args = ["-ql"]
+    if "--" in argv:
+        split = argv.index("--")
+        argv, manim_args = argv[:split], argv[split + 1:]
+    args = parser.parse_args(argv)
+
+    try:
+        variants = expand(SCENE_PARAMS[args.scene_name], parse_grid(args.grid))
+    except (TypeError, ValueError) as error:
+        parser.error(str(error))
+
+    # The renders run in the repository, so build into the cache they will look in
+    os.environ.setdefault(CACHE_ENV, str(REPO_DIR / "media" / "asset_cache"))
+    os.environ.setdefault("MPLBACKEND", "Agg")
+    if args.scene_name in SCENE_ASSETS:
+        screen = quality_screen(quality_from_args(manim_args))
+        build([asset for _, params in variants for asset in scene_assets(args.scene_name, params, **screen)], args.jobs)
+
+    media_dir = media_dir_from_args(manim_args)
+    manifest_dir = REPO_DIR / media_dir / "sweeps" / args.scene_name
+    manifest_dir.mkdir(parents=True, exist_ok=True)
+    print(f"Rendering {len(variants)} variants of {args.scene_name} on {min(args.jobs, len(variants))} workers")
+    with ThreadPoolExecutor(max_workers=args.jobs) as pool:
+        entries = list(pool.map(
+            lambda variant: render_variant(
+                args.scene_file, args.scene_name, variant_name(args.scene_name, *variant), variant[1],
+                manim_args, manifest_dir, media_dir,
+            ),
+            variants,
+        ))
+
+    index_path = manifest_dir / "index.json"
+    index = json.loads(index_path.read_text()) if index_path.exists() else {}
+    index.update({entry["name"]: {key: entry[key] for key in ("params", "status", "movie")} for entry in entries})
+    index_path.write_text(json.dumps(index, indent=2))
+    failed = [entry["name"] for entry in entries if entry["status"] != "ok"]
+    for name in failed:
+        print(f"FAILED {name}, see {manifest_dir / (name + '.json')}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""Shared transcode cache for the slide exporters.
+
+Every conversion of a deck used to re-encode (or copy) each slide video again,
+one after the other.  The exporters now ask this cache for their videos: an
+entry is keyed by the SHA-256 of the source video and the target profile (the
+ffmpeg arguments), so re-exporting a deck after editing one slide transcodes
+one video, and cache misses are transcoded by a pool of ffmpeg processes::
+
+    cache = TranscodeCache()
+    videos = cache.transcode_all(slide_files, "pptx", jobs=8)
+
+Source hashes are remembered by path, size and modification time in
+``<cache>/index.json``, so unchanged slides are not even read again.
+"""
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+DEFAULT_CACHE_DIR = Path("media") / "transcode_cache"
+
+# name: (file suffix, ffmpeg output arguments)
+PROFILES = {
+    # manim's H.264 as it is, with the index moved to the front so playback starts early
+    "remux": (".mp4", ["-c", "copy", "-movflags", "+faststart", "-an"]),
+    # Re-encoded so it plays in every browser, at the cost of a generation of quality
+    "html": (".mp4", ["-c:v", "libx264", "-preset", "medium", "-crf", "20", "-pix_fmt", "yuv420p",
+                      "-movflags", "+faststart", "-an"]),
+    # PowerPoint's media player is picky about H.264 profiles
+    "pptx": (".mp4", ["-c:v", "libx264", "-profile:v", "main", "-level", "4.0", "-preset", "medium",
+                      "-crf", "20", "-pix_fmt", "yuv420p", "-movflags", "+faststart", "-an"]),
+    # First frame, shown before a video starts; the temporary ".part" file name does not tell
+    # image2 the codec, which would fall back to MJPEG
+    "poster": (".png", ["-frames:v", "1", "-c:v", "png", "-update", "1"]),
+}
+
+
+def file_digest(path, chunk_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, "rb") as source:
+        while chunk := source.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class TranscodeCache:
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.index_path = self.cache_dir / "index.json"
+        self.index = json.loads(self.index_path.read_text()) if self.index_path.exists() else {}
+        self._lock = threading.Lock()
+
+    # --- Keys ---
+    def source_digest(self, source):
+        source = Path(source).resolve()
+        stat = source.stat()
+        entry = self.index.get(str(source))
+        if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+            return entry["sha256"]
+        digest = file_digest(source)
+        with self._lock:
+            self.index[str(source)] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": digest}
+        return digest
+
+    def path_for(self, source, profile):
+        suffix, arguments = PROFILES[profile]
+        profile_digest = hashlib.sha256(json.dumps(arguments).encode()).hexdigest()[:8]
+        return self.cache_dir / profile / f"{self.source_digest(source)[:24]}_{profile_digest}{suffix}"
+
+    # --- Transcoding ---
+    def transcode(self, source, target, profile, threads=0):
+        """Run ffmpeg for one cache miss, writing ``target`` atomically."""
+        suffix, arguments = PROFILES[profile]
+        target.parent.mkdir(parents=True, exist_ok=True)
+        temporary = target.with_name(target.name + ".part")
+        output_format = "image2" if suffix == ".png" else suffix.lstrip(".")
+        command = [
+            "ffmpeg", "-y", "-loglevel", "error", "-i", str(source),
+            *arguments, "-threads", str(threads), "-f", output_format, str(temporary),
+        ]
+        result = subprocess.run(command, capture_output=True, text=True)
+        if result.returncode != 0:
+            temporary.unlink(missing_ok=True)
+            raise RuntimeError(f"ffmpeg failed on {source}: {result.stderr.strip()}")
+        os.replace(temporary, target)
+        return target
+
+    def transcode_all(self, sources, profile, jobs=None):
+        """Cached ``profile`` versions of ``sources``, in order; misses run ``jobs`` ffmpeg at a time."""
+        if shutil.which("ffmpeg") is None:
+            raise RuntimeError("ffmpeg is required to transcode slide videos")
+        jobs = jobs or os.cpu_count() or 1
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            targets = list(pool.map(lambda source: self.path_for(source, profile), sources))
+        self._save_index()
+
+        # Identical slides share one cache entry and are transcoded once
+        misses = {target: source for source, target in zip(sources, targets) if not target.exists()}
+        if misses:
+            print(f"Transcoding {len(misses)} of {len(sources)} videos ({profile}) on {min(jobs, len(misses))} workers")
+            # Split the cores between the ffmpeg processes instead of oversubscribing them
+            threads = max(1, (os.cpu_count() or 1) // min(jobs, len(misses)))
+            with ThreadPoolExecutor(max_workers=jobs) as pool:
+                list(pool.map(lambda item: self.transcode(item[1], item[0], profile, threads), misses.items()))
+        return targets
+
+    def _save_index(self):
+        temporary = self.index_path.with_name("index.json.part")
+        temporary.write_text(json.dumps(self.index, indent=2))
+        os.replace(temporary, self.index_path)
@@ -1,23 +1,28 @@
 from manim import *
 import numpy as np
 import math
-import os
+
+from generate_cigar import cigar_pattern
+from numeric_label import NumericLabel
+from scene_params import TxBeamformingParams
 
 class TxBeamformingArcs(Scene): # Changed class name for clarity if needed, but keeping it for now
     def construct(self):
         self.camera.background_color =  WHITE
         # --- Configuration ---
-        num_antennas = 8
-        antenna_spacing = 0.5  # Spacing between antennas
-        wave_speed = 2.5       # Speed at which wavefronts expand
-        wave_frequency = 2.0   # Increased frequency
-        max_radius = 6         # How far the waves expand before fading
+        # Defaults live in TxBeamformingParams; sweep.py renders variants through MANIM_SCENE_PARAMS
+        params = TxBeamformingParams.from_env()
+        num_antennas = params.num_antennas
+        antenna_spacing = params.antenna_spacing
+        wave_speed = params.wave_speed
+        wave_frequency = params.wave_frequency
+        max_radius = params.max_radius
         pulse_interval = 1.0 / wave_frequency # Time between emitting new wavefronts (now shorter)
         wave_color = BLUE
-        wave_stroke_width = 2
-        broadside_duration = 2 # Reduced duration
-        steering_animation_duration = 15 # Even slower phase changes
-        transition_duration = 1.0 # Duration for wave-to-pattern fade
+        wave_stroke_width = params.wave_stroke_width
+        broadside_duration = params.broadside_duration
+        steering_animation_duration = params.steering_animation_duration
+        transition_duration = params.transition_duration
 
         # --- Antenna Array Setup ---
         antenna_positions = [
@@ -39,16 +44,15 @@ class TxBeamformingArcs(Scene): # Changed class name for clarity if needed, but
 
         # Text display: Δφ = value
         delta_phi_label = MathTex(r"\Delta\phi = ", font_size=36, color=BLACK)
-        delta_phi_value = always_redraw(
-            lambda: DecimalNumber(
-                delta_phi_tracker.get_value(),
-                num_decimal_places=2,
-                show_ellipsis=False,
-                include_sign=True, # Show + or -
-                unit=r"\,\,\text{ rad}" # Add rad unit
-                # Color will be set below
-            ).set_color(BLACK).scale(0.8).next_to(delta_phi_label, RIGHT, buff=0.15) # Explicitly set color here
-        )
+        # Glyphs are typeset once; the updater only re-lays them out each frame
+        delta_phi_value = NumericLabel(
+            delta_phi_tracker.get_value(),
+            num_decimal_places=2,
+            include_sign=True, # Show + or -
+            unit=r"\,\,\text{ rad}", # Add rad unit
+            color=BLACK
+        ).scale(0.8).next_to(delta_phi_label, RIGHT, buff=0.15)
+        delta_phi_value.add_updater(lambda m: m.set_value(delta_phi_tracker.get_value()))
         delta_phi_text_group = VGroup(delta_phi_label, delta_phi_value).to_corner(UR, buff=0.5)
 
         # Explanation Text (Corrected Arrow)
@@ -94,17 +98,14 @@ class TxBeamformingArcs(Scene): # Changed class name for clarity if needed, but
         self.last_steer_angle = 0 # Initialize for workaround
 
         # --- Beam Indicator (Replaced with SVG) ---
-        cigar_svg_path = "media/images/tx_beamforming_arcs/cigar_pattern.svg"
-        if not os.path.exists(cigar_svg_path):
-             logger.warning(f"SVG file not found at {cigar_svg_path}. Cannot create beam indicator.")
-             beam_indicator = Circle(radius=0.1, color=RED, fill_opacity=1).set_opacity(0) # Placeholder
-        else:
-             beam_indicator = SVGMobject(cigar_svg_path)
-             # Scale the SVG to a reasonable height (e.g., 3 units like the original arrow)
-             beam_indicator.scale_to_fit_height(3)
-             # Position the bottom center of the SVG at the antenna array center
-             beam_indicator.move_to(antennas.get_center(), aligned_edge=DOWN)
-             #beam_indicator.set_opacity(0) # Start invisible for FadeIn
+        # Built ahead of the render by assets.py, or here the first time it is needed
+        cigar_svg_path = str(cigar_pattern().ensure())
+        beam_indicator = SVGMobject(cigar_svg_path)
+        # Scale the SVG to a reasonable height (e.g., 3 units like the original arrow)
+        beam_indicator.scale_to_fit_height(3)
+        # Position the bottom center of the SVG at the antenna array center
+        beam_indicator.move_to(antennas.get_center(), aligned_edge=DOWN)
+        #beam_indicator.set_opacity(0) # Start invisible for FadeIn
 
         def update_beam_indicator(svg_mob):
             # Workaround: Rotate incrementally instead of using become
@@ -128,7 +129,7 @@ class TxBeamformingArcs(Scene): # Changed class name for clarity if needed, but
         last_emission_time = -pulse_interval # Ensure emission on first frame
 
         def generate_wave_set(current_delta_phi, emission_time):
-            """Generates a set of 8 arcs for a single emission time."""
+            """Generates one arc per antenna for a single emission time."""
             wave_set = VGroup()
             for i, ant_pos in enumerate(antenna_positions):
                 phase_rad = (i - center_index) * current_delta_phi